@@ -1,12 +1,16 @@
 """Approval-based committee (ABC) voting rules."""
 
+import concurrent.futures
 import functools
+import heapq
 import itertools
 import random
 import math
+import numbers
+import time
 from fractions import Fraction
 from abcvoting.output import output, DETAILS
-from abcvoting import abcrules_ortools, abcrules_pulp, misc, scores
+from abcvoting import abcrules_ortools, abcrules_pulp, ilp_backends, misc, preferences, scores
 from abcvoting.misc import str_committees_with_header, header, str_set_of_candidates
 from abcvoting.misc import sorted_committees, CandidateSet
 
@@ -56,7 +60,7 @@ are contained in this list.
 
 ALGORITHM_NAMES = {
     "gurobi": "Gurobi ILP solver",
-    "pulp": "PULP modeling language with HiGHS solver via WebAssembly",
+    "pulp": "PULP modeling language with HiGHS or CBC solver",
     "branch-and-bound": "branch-and-bound",
     "brute-force": "brute-force",
     "mip-cbc": "CBC ILP solver via Python MIP library",
@@ -66,15 +70,35 @@ ALGORITHM_NAMES = {
     # "cvxpy_glpk_mi": "GLPK ILP solver via CVXPY library",
     # "cvxpy_cbc": "CBC ILP solver via CVXPY library",
     "standard": "Standard algorithm",
+    "lazy-greedy": "Lazy greedy algorithm (lazy evaluation of marginal scores)",
     "standard-fractions": "Standard algorithm (using standard Python fractions)",
     "gmpy2-fractions": "Standard algorithm (using gmpy2 fractions)",
     "float-fractions": "Standard algorithm (using floats instead of fractions)",
+    "auto-exact": "Standard algorithm (floats, near ties resolved exactly)",
     "ortools-cp": "OR-Tools CP-SAT solver",
+    "local-search": "Local search (heuristic, not guaranteed to find a winning committee)",
 }
 """
 A dictionary containing mapping all valid algorithm identifiers to full names (i.e., descriptions).
 """
 
+LOCAL_SEARCH_TIME_LIMIT = 10
+"""
+Default time limit (in seconds) for the algorithm "local-search".
+
+The time limit can be set for each computation via the parameter `time_limit` of
+`compute_thiele_method()`. If it is `None`, the search only stops in a local optimum
+(or after `max_iterations` iterations).
+"""
+
+LOCAL_SEARCH_MAX_ITERATIONS = None
+"""
+Default maximum number of iterations (attempted swaps) of the algorithm "local-search".
+
+The maximum number can be set for each computation via the parameter `max_iterations` of
+`compute_thiele_method()`. If it is `None`, the number of iterations is not restricted.
+"""
+
 
 MAX_NUM_OF_COMMITTEES_DEFAULT = None
 """
@@ -85,6 +109,25 @@ on the maximum number of committees.
 Can be overridden with the parameter `max_num_of_committees` in any `compute` function.
 """
 
+WORKERS_DEFAULT = None
+"""
+The number of worker processes used by the algorithm "brute-force".
+
+The committees are split into ranges of lexicographic ranks, which are evaluated in parallel.
+If `WORKERS_DEFAULT` is set to `None`, the brute-force algorithm runs in the current process.
+Can be overridden with the parameter `workers` in all `compute` functions of rules that support
+the algorithm "brute-force".
+"""
+
+AUTO_EXACT_TOLERANCE = 1e-9
+"""
+Relative and absolute tolerance below which the algorithm "auto-exact" considers floats as tied.
+
+The algorithm "auto-exact" computes with floats. Values that are this close could be equal (and
+only differ due to rounding errors), hence ties between such values are resolved with exact
+fractions. This tolerance must be larger than the accumulated rounding errors.
+"""
+
 
 class Rule:
     """
@@ -107,12 +150,23 @@ class Rule:
     )
     _RESOLUTE_VALUES_FOR_OPTIMIZATION_BASED_RULES = (False, True)
     _RESOLUTE_VALUES_FOR_SEQUENTIAL_RULES = (True, False)
+    _THIELE_HEURISTIC_ALGORITHMS = ("local-search",)
+    _FRACTION_ALGORITHMS = (
+        # algorithms sorted by speed
+        "float-fractions",
+        "auto-exact",
+        "gmpy2-fractions",
+        "standard-fractions",
+    )
 
     def __init__(
         self,
         rule_id,
     ):
         self.rule_id = rule_id
+        # heuristic algorithms (only for resolute=True) do not necessarily find a winning
+        # committee, hence they are not contained in `self.algorithms`
+        self.heuristic_algorithms = ()
         if rule_id == "av":
             self.shortname = "AV"
             self.longname = "Approval Voting (AV)"
@@ -130,12 +184,14 @@ class Rule:
             self.longname = "Proportional Approval Voting (PAV)"
             self.compute_fct = compute_pav
             self.algorithms = self._THIELE_ALGORITHMS
+            self.heuristic_algorithms = self._THIELE_HEURISTIC_ALGORITHMS
             self.resolute_values = self._RESOLUTE_VALUES_FOR_OPTIMIZATION_BASED_RULES
         elif rule_id == "slav":
             self.shortname = "SLAV"
             self.longname = "Sainte-Laguë Approval Voting (SLAV)"
             self.compute_fct = compute_slav
             self.algorithms = self._THIELE_ALGORITHMS
+            self.heuristic_algorithms = self._THIELE_HEURISTIC_ALGORITHMS
             self.resolute_values = self._RESOLUTE_VALUES_FOR_OPTIMIZATION_BASED_RULES
         elif rule_id == "cc":
             self.shortname = "CC"
@@ -151,6 +207,7 @@ class Rule:
                 "brute-force",
                 "mip-cbc",
             )
+            self.heuristic_algorithms = self._THIELE_HEURISTIC_ALGORITHMS
             self.resolute_values = self._RESOLUTE_VALUES_FOR_OPTIMIZATION_BASED_RULES
         elif rule_id == "lexcc":
             self.shortname = "lex-CC"
@@ -163,7 +220,7 @@ class Rule:
             self.shortname = "seq-PAV"
             self.longname = "Sequential Proportional Approval Voting (seq-PAV)"
             self.compute_fct = compute_seqpav
-            self.algorithms = ("standard",)
+            self.algorithms = ("lazy-greedy", "standard")
             self.resolute_values = self._RESOLUTE_VALUES_FOR_SEQUENTIAL_RULES
         elif rule_id == "revseqpav":
             self.shortname = "revseq-PAV"
@@ -175,19 +232,19 @@ class Rule:
             self.shortname = "seq-SLAV"
             self.longname = "Sequential Sainte-Laguë Approval Voting (seq-SLAV)"
             self.compute_fct = compute_seqslav
-            self.algorithms = ("standard",)
+            self.algorithms = ("lazy-greedy", "standard")
             self.resolute_values = self._RESOLUTE_VALUES_FOR_SEQUENTIAL_RULES
         elif rule_id == "seqcc":
             self.shortname = "seq-CC"
             self.longname = "Sequential Approval Chamberlin-Courant (seq-CC)"
             self.compute_fct = compute_seqcc
-            self.algorithms = ("standard",)
+            self.algorithms = ("lazy-greedy", "standard")
             self.resolute_values = self._RESOLUTE_VALUES_FOR_SEQUENTIAL_RULES
         elif rule_id == "seqphragmen":
             self.shortname = "seq-Phragmén"
             self.longname = "Phragmén's Sequential Rule (seq-Phragmén)"
             self.compute_fct = compute_seqphragmen
-            self.algorithms = ("float-fractions", "gmpy2-fractions", "standard-fractions")
+            self.algorithms = self._FRACTION_ALGORITHMS
             self.resolute_values = self._RESOLUTE_VALUES_FOR_SEQUENTIAL_RULES
         elif rule_id == "minimaxphragmen":
             self.shortname = "minimax-Phragmén"
@@ -245,19 +302,19 @@ class Rule:
             self.shortname = "Equal Shares"
             self.longname = "Method of Equal Shares (aka Rule X) with Phragmén phase"
             self.compute_fct = compute_equal_shares
-            self.algorithms = ("float-fractions", "gmpy2-fractions", "standard-fractions")
+            self.algorithms = self._FRACTION_ALGORITHMS
             self.resolute_values = self._RESOLUTE_VALUES_FOR_SEQUENTIAL_RULES
         elif rule_id in ["equal-shares-with-av-completion"]:
             self.shortname = "Equal Shares with AV completion"
             self.longname = "Method of Equal Shares (aka Rule X) with AV completion"
             self.compute_fct = functools.partial(compute_equal_shares, completion="av")
-            self.algorithms = ("float-fractions", "gmpy2-fractions", "standard-fractions")
+            self.algorithms = self._FRACTION_ALGORITHMS
             self.resolute_values = self._RESOLUTE_VALUES_FOR_SEQUENTIAL_RULES
         elif rule_id in ["equal-shares-with-increment-completion"]:
             self.shortname = "Equal Shares with increment completion"
             self.longname = "Method of Equal Shares (aka Rule X) with increment completion"
             self.compute_fct = functools.partial(compute_equal_shares, completion="increment")
-            self.algorithms = ("float-fractions", "gmpy2-fractions", "standard-fractions")
+            self.algorithms = self._FRACTION_ALGORITHMS
             self.resolute_values = (True,)  # this rule is ill-defined for resolute=False
         elif rule_id in [
             "rule-x-without-phragmen-phase",
@@ -267,19 +324,19 @@ class Rule:
             self.shortname = "Equal Shares without completion"
             self.longname = "Method of Equal Shares (aka Rule X) without completion (second phase)"
             self.compute_fct = functools.partial(compute_equal_shares, completion=None)
-            self.algorithms = ("float-fractions", "gmpy2-fractions", "standard-fractions")
+            self.algorithms = self._FRACTION_ALGORITHMS
             self.resolute_values = self._RESOLUTE_VALUES_FOR_SEQUENTIAL_RULES
         elif rule_id == "phragmen-enestroem":
             self.shortname = "Phragmén-Eneström"
             self.longname = "Method of Phragmén-Eneström"
             self.compute_fct = compute_phragmen_enestroem
-            self.algorithms = ("float-fractions", "gmpy2-fractions", "standard-fractions")
+            self.algorithms = self._FRACTION_ALGORITHMS
             self.resolute_values = self._RESOLUTE_VALUES_FOR_SEQUENTIAL_RULES
         elif rule_id == "consensus-rule":
             self.shortname = "Consensus Rule"
             self.longname = "Consensus Rule"
             self.compute_fct = compute_consensus_rule
-            self.algorithms = ("float-fractions", "gmpy2-fractions", "standard-fractions")
+            self.algorithms = self._FRACTION_ALGORITHMS
             self.resolute_values = self._RESOLUTE_VALUES_FOR_SEQUENTIAL_RULES
         elif rule_id == "trivial":
             self.shortname = "Trivial Rule"
@@ -297,7 +354,7 @@ class Rule:
             self.shortname = "E Pluribus Hugo"
             self.longname = "E Pluribus Hugo (EPH)"
             self.compute_fct = compute_eph
-            self.algorithms = ("float-fractions", "gmpy2-fractions", "standard-fractions")
+            self.algorithms = self._FRACTION_ALGORITHMS
             self.resolute_values = (False, True)
         elif rule_id.startswith("geom"):
             parameter = rule_id[4:]
@@ -305,6 +362,7 @@ class Rule:
             self.longname = f"{parameter}-Geometric Rule"
             self.compute_fct = functools.partial(compute_thiele_method, rule_id)
             self.algorithms = self._THIELE_ALGORITHMS
+            self.heuristic_algorithms = self._THIELE_HEURISTIC_ALGORITHMS
             self.resolute_values = self._RESOLUTE_VALUES_FOR_OPTIMIZATION_BASED_RULES
         elif rule_id.startswith("seq") or rule_id.startswith("revseq"):
             # handle sequential and reverse sequential Thiele methods
@@ -328,7 +386,9 @@ class Rule:
                 self.shortname = f"seq-{optrule.shortname}"
                 self.longname = f"Sequential {optrule.longname}"
                 self.compute_fct = functools.partial(compute_seq_thiele_method, scorefct_id)
-                self.algorithms = ("standard",)
+                # lazy-greedy requires non-increasing marginal scores (not the case for all
+                # score functions, e.g., atleast-ell)
+                self.algorithms = ("standard", "lazy-greedy")
                 self.resolute_values = self._RESOLUTE_VALUES_FOR_SEQUENTIAL_RULES
             # reverse sequential Thiele methods
             elif rule_id.startswith("revseq"):
@@ -441,7 +501,7 @@ class Rule:
         if len(profile) == 0:
             raise ValueError("The given profile contains no voters (len(profile) == 0).")
 
-        if algorithm not in self.algorithms:
+        if algorithm not in self.algorithms and algorithm not in self.heuristic_algorithms:
             raise UnknownAlgorithm(self.rule_id, algorithm)
 
         if resolute not in self.resolute_values:
@@ -449,6 +509,11 @@ class Rule:
                 f'ABC rule with rule_id "{self.rule_id}" does not support resolute={resolute}.'
             )
 
+        if algorithm in self.heuristic_algorithms and not resolute:
+            raise NotImplementedError(
+                f'Algorithm "{algorithm}" is a heuristic and only supports resolute=True.'
+            )
+
         if (max_num_of_committees is not None and not isinstance(max_num_of_committees, int)) or (
             max_num_of_committees is not None and max_num_of_committees < 1
         ):
@@ -519,6 +584,106 @@ class NoAvailableAlgorithm(ValueError):
         super().__init__(message)
 
 
+class _NearTie(Exception):
+    """
+    Raised by the algorithm "auto-exact" if floats are too close to be compared reliably.
+    """
+
+
+def _is_near(x, y):
+    # for the algorithm "auto-exact": could the floats `x` and `y` be equal?
+    return math.isclose(x, y, rel_tol=AUTO_EXACT_TOLERANCE, abs_tol=AUTO_EXACT_TOLERANCE)
+
+
+def _check_near_ties(values, value):
+    """
+    For the algorithm "auto-exact": raise `_NearTie` if more than one of `values` is close
+    to `value` (e.g., to the minimum of `values`).
+    """
+    if sum(1 for other in values if _is_near(other, value)) > 1:
+        raise _NearTie
+
+
+def _is_rational(values):
+    # for the algorithm "auto-exact": can `values` be used to compute with exact fractions?
+    return all(isinstance(value, numbers.Rational) for value in values)
+
+
+def _exact_fractions_algorithm():
+    """
+    Return the fastest available algorithm that computes with exact fractions.
+    """
+    return "gmpy2-fractions" if mpq else "standard-fractions"
+
+
+def _auto_exact(algorithm_fct, algorithm, **kwargs):
+    """
+    Call `algorithm_fct(algorithm=algorithm, **kwargs)`.
+
+    For the algorithm "auto-exact", `algorithm_fct` computes with floats and raises `_NearTie`
+    if it encounters values that are too close to decide a comparison (or tie) reliably.
+    In this case, the computation is repeated with exact fractions.
+    """
+    try:
+        return algorithm_fct(algorithm=algorithm, **kwargs)
+    except _NearTie:
+        if algorithm != "auto-exact":
+            raise
+        return algorithm_fct(algorithm=_exact_fractions_algorithm(), **kwargs)
+
+
+def _auto_exact_tied_successors(tied_successors, start_committee, exact_start_state, to_float):
+    """
+    Resolve near ties of the algorithm "auto-exact" in the round in which they occur.
+
+    `tied_successors(committee, state, algorithm)` computes the successors of a partial committee
+    (as required by `_parallel_universes()`) either with floats (`algorithm="auto-exact"`) or with
+    exact fractions. If the former raises `_NearTie`, the state of `committee` is recomputed with
+    exact fractions (starting with the state returned by `exact_start_state()` and adding the
+    candidates of `committee` in the same order), the successors are computed exactly and their
+    states are converted back to floats with `to_float()`.
+
+    Returns a pair of functions: `tied_successors(committee, state)` and
+    `exact_state(committee)`, which returns the exact state of a partial committee.
+
+    `_NearTie` is raised if `exact_start_state()` returns None (i.e., no exact start state is
+    known) or if an earlier decision based on floats was wrong. Then the whole computation has to
+    be repeated with exact fractions (see `_auto_exact()`).
+    """
+    exact_algorithm = _exact_fractions_algorithm()
+    start_committee = tuple(start_committee)
+    # exact states of partial committees (in the order in which candidates have been added),
+    # computed only when required
+    exact_states = {}
+
+    def exact_state(committee):
+        if committee not in exact_states:
+            if committee == start_committee:
+                exact_states[committee] = exact_start_state()
+                if exact_states[committee] is None:
+                    raise _NearTie
+            else:
+                predecessor = committee[:-1]
+                successors = dict(
+                    tied_successors(predecessor, exact_state(predecessor), exact_algorithm)
+                )
+                if committee[-1] not in successors:
+                    raise _NearTie  # an earlier decision based on floats was wrong
+                exact_states[committee] = successors[committee[-1]]
+        return exact_states[committee]
+
+    def auto_exact_tied_successors(committee, state):
+        try:
+            return tied_successors(committee, state, "auto-exact")
+        except _NearTie:
+            exact_successors = tied_successors(committee, exact_state(committee), exact_algorithm)
+        for cand, new_state in exact_successors:
+            exact_states[committee + (cand,)] = new_state  # near ties in the next round
+        return [(cand, to_float(new_state)) for cand, new_state in exact_successors]
+
+    return auto_exact_tied_successors, exact_state
+
+
 def _available_algorithms():
     """Verify which algorithms are supported on the current machine.
 
@@ -535,6 +700,8 @@ def _available_algorithms():
             continue
         if algorithm == "ortools-cp" and not abcrules_ortools.cp_model:
             continue
+        if algorithm == "pulp" and ilp_backends.active_backend is None:
+            continue
         available.append(algorithm)
 
     return available
@@ -566,10 +733,47 @@ def get_rule(rule_id):
 ########################################################################
 
 
+_WEIGHT_INVARIANT_RULE_IDS = (
+    # rules that depend only on the total weight of voters with the same approval set,
+    # i.e., replacing k identical voters by one voter with k times the weight does not change
+    # the winning committees
+    "av",
+    "sav",
+    "pav",
+    "slav",
+    "cc",
+    "lexcc",
+    "geom2",
+    "seqpav",
+    "revseqpav",
+    "seqslav",
+    "seqcc",
+    "seqphragmen",
+    "minimaxphragmen",
+    "maximin-support",
+    "minimaxav",
+    "rule-x",
+    "equal-shares",
+    "equal-shares-with-seqphragmen-completion",
+    "equal-shares-with-av-completion",
+    "equal-shares-with-increment-completion",
+    "phragmen-enestroem",
+    "consensus-rule",
+    "trivial",
+    "eph",
+)
+
+
 def compute(rule_id, profile, committeesize, result=None, **kwargs):
     """
     Compute winning committees with an ABC rule given by `rule_id`.
 
+    If the rule only depends on the total weight of each approval set (see
+    `_WEIGHT_INVARIANT_RULE_IDS`) and the profile contains duplicate approval sets, the rule is
+    computed on the aggregated profile (see `Profile.aggregated()`), which yields the same
+    winning committees. This is not done if detailed output (verbosity `DETAILS` or lower) is
+    enabled, as this output refers to individual voters.
+
     Parameters
     ----------
         rule_id : str
@@ -598,6 +802,12 @@ def compute(rule_id, profile, committeesize, result=None, **kwargs):
             If `resolute=True`, the list contains only one winning committee.
     """
     rule = Rule(rule_id)
+    if rule_id in _WEIGHT_INVARIANT_RULE_IDS and not output.is_enabled(DETAILS):
+        # detailed output refers to voters (e.g., loads in seq-Phragmén) and is hence only
+        # meaningful for the original profile
+        aggregated_profile = profile.aggregated()
+        if len(aggregated_profile) < len(profile):
+            profile = aggregated_profile
     committees = rule.compute(profile=profile, committeesize=committeesize, **kwargs)
     if result is not None:
         # verify that the parameter `result` is indeed the result of computing the ABC rule
@@ -618,6 +828,9 @@ def compute_thiele_method(
     algorithm="fastest",
     resolute=False,
     max_num_of_committees=MAX_NUM_OF_COMMITTEES_DEFAULT,
+    workers=WORKERS_DEFAULT,
+    max_iterations=LOCAL_SEARCH_MAX_ITERATIONS,
+    time_limit=LOCAL_SEARCH_TIME_LIMIT,
 ):
     """
     Compute winning committees with Thiele methods.
@@ -661,6 +874,25 @@ def compute_thiele_method(
             The default value of `max_num_of_committees` can be modified via the constant
             `MAX_NUM_OF_COMMITTEES_DEFAULT`.
 
+        workers : int, optional
+            Number of worker processes used by the algorithm "brute-force".
+
+            See `WORKERS_DEFAULT`. Other algorithms ignore this parameter.
+
+        max_iterations : int, optional
+            The maximum number of iterations (attempted swaps) of the algorithm "local-search".
+
+            If `max_iterations=None`, the number of iterations is not restricted. The default
+            value can be modified via the constant `LOCAL_SEARCH_MAX_ITERATIONS`. Other
+            algorithms ignore this parameter.
+
+        time_limit : float, optional
+            Time limit (in seconds) for the algorithm "local-search".
+
+            If `time_limit=None`, the search only stops in a local optimum (or after
+            `max_iterations` iterations). The default value can be modified via the constant
+            `LOCAL_SEARCH_TIME_LIMIT`. Other algorithms ignore this parameter.
+
     Returns
     -------
         list of CandidateSet
@@ -679,6 +911,14 @@ def compute_thiele_method(
         max_num_of_committees=max_num_of_committees,
     )
 
+    kernel = None
+    if algorithm in ["pulp", "branch-and-bound", "brute-force"]:
+        kernel = _thiele_methods_kernel(scorefct_id, profile, committeesize)
+    if kernel is None:
+        reduced_profile, forced_cands = profile, ()
+    else:
+        reduced_profile, kept_cands, forced_cands = kernel
+
     if algorithm == "gurobi":
         committees = abcrules_gurobi._gurobi_thiele_methods(
             scorefct_id=scorefct_id,
@@ -690,26 +930,32 @@ def compute_thiele_method(
     elif algorithm == "pulp":
         committees = abcrules_pulp._pulp_thiele_methods(
             scorefct_id=scorefct_id,
-            profile=profile,
+            profile=reduced_profile,
             committeesize=committeesize,
             resolute=resolute,
             max_num_of_committees=max_num_of_committees,
+            forced_cands=forced_cands,
         )
     elif algorithm == "branch-and-bound":
+        # if the instance is kernelized, all winning committees are computed and
+        # `resolute` and `max_num_of_committees` are applied after mapping candidates back
         committees, detailed_info = _thiele_methods_branchandbound(
             scorefct_id=scorefct_id,
-            profile=profile,
+            profile=reduced_profile,
             committeesize=committeesize,
-            resolute=resolute,
-            max_num_of_committees=max_num_of_committees,
+            resolute=resolute and kernel is None,
+            max_num_of_committees=max_num_of_committees if kernel is None else None,
+            forced_cands=forced_cands,
         )
     elif algorithm == "brute-force":
         committees, detailed_info = _thiele_methods_bruteforce(
             scorefct_id=scorefct_id,
-            profile=profile,
+            profile=reduced_profile,
             committeesize=committeesize,
             resolute=resolute,
-            max_num_of_committees=max_num_of_committees,
+            max_num_of_committees=max_num_of_committees if kernel is None else None,
+            workers=workers,
+            forced_cands=forced_cands,
         )
     elif algorithm.startswith("mip-"):
         committees = abcrules_mip._mip_thiele_methods(
@@ -727,18 +973,53 @@ def compute_thiele_method(
             resolute=resolute,
             max_num_of_committees=max_num_of_committees,
         )
+    elif algorithm == "local-search":
+        committees, detailed_info = _thiele_methods_localsearch(
+            scorefct_id=scorefct_id,
+            profile=profile,
+            committeesize=committeesize,
+            max_iterations=max_iterations,
+            time_limit=time_limit,
+        )
     else:
         raise UnknownAlgorithm(scorefct_id, algorithm)
 
+    if kernel is not None:
+        committees = sorted_committees(
+            [kept_cands[cand] for cand in committee] for committee in committees
+        )
+        if max_num_of_committees is not None:
+            committees = committees[:max_num_of_committees]
+        if resolute:
+            committees = committees[:1]
+
     # optional output
     output.info(header(rule.longname), wrap=False)
     if resolute:
         output.info("Computing only one winning committee (resolute=True)\n")
     output.details(f"Algorithm: {ALGORITHM_NAMES[algorithm]}\n")
+    if kernel is not None:
+        output.debug(
+            f"Kernelization removed {profile.num_cand - reduced_profile.num_cand} candidate(s) "
+            f"and found {len(forced_cands)} candidate(s) contained in every winning committee.\n"
+        )
+    if algorithm == "local-search":
+        output.details(
+            f"Local search stopped after {detailed_info['num_iterations']} iterations "
+            f"({detailed_info['stopping_reason']})."
+        )
+        if detailed_info["upper_bound"] is not None:
+            output.details(
+                f"Upper bound on the optimal {scorefct_id.upper()}-score: "
+                f"{detailed_info['upper_bound']} (gap: {detailed_info['gap']})\n"
+            )
 
+    if algorithm in rule.heuristic_algorithms:
+        score_description = f"{scorefct_id.upper()}-score of committee"
+    else:
+        score_description = f"Optimal {scorefct_id.upper()}-score"
     output.details(
-        f"Optimal {scorefct_id.upper()}-score: "
-        f"{scores.thiele_score(scorefct_id, profile, committees[0])}\n"
+        f"{score_description}: {scores.thiele_score(scorefct_id, profile, committees[0])}\n"
     )
     output.info(
         str_committees_with_header(committees, cand_names=profile.cand_names, winning=True)
@@ -748,28 +1029,157 @@ def compute_thiele_method(
     return committees
 
 
+def _batches(committees, batch_size=4096):
+    """
+    Split an iterator of committees into lists of length `batch_size` (for batch scoring).
+    """
+    while True:
+        batch = list(itertools.islice(committees, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _bruteforce_search(shard_fct, profile, committeesize, workers, *args, num_committees=None):
+    """
+    Evaluate all committees of size `committeesize`, possibly using several worker processes.
+
+    `shard_fct(profile, committeesize, start, stop, *args)` evaluates all committees with
+    lexicographic rank in `[start, stop)` (see `misc.combinations_range()`) and returns a pair
+    `(opt_value, opt_committees)`, where larger values are better. The number of ranks is
+    `num_committees` (by default, the number of all committees of size `committeesize`).
+    If `workers` is larger than 1,
+    the ranks are split into ranges that are evaluated in parallel.
+    The results of all ranges are merged in the order of ranks, hence the result does not depend
+    on the number of workers.
+
+    Returns
+    -------
+        tuple
+            The optimal value and the list of committees with this value (ordered by rank).
+    """
+    if num_committees is None:
+        num_committees = misc.binom(profile.num_cand, committeesize)
+    if workers is None or workers <= 1:
+        return shard_fct(profile, committeesize, 0, num_committees, *args)
+
+    num_shards = min(num_committees, 4 * workers)
+    bounds = [num_committees * i // num_shards for i in range(num_shards + 1)]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(shard_fct, profile, committeesize, start, stop, *args)
+            for start, stop in zip(bounds, bounds[1:])
+        ]
+        results = [future.result() for future in futures]
+    opt_value = max(value for value, _ in results)
+    opt_committees = [
+        committee
+        for value, committees in results
+        if value == opt_value
+        for committee in committees
+    ]
+    return opt_value, opt_committees
+
+
+def _parallel_universes(
+    committeesize, tied_successors, start_committee=(), start_state=None, canonical_state=None
+):
+    """
+    Enumerate all committees of a sequential rule for all ways to break ties.
+
+    This is the "parallel universes tiebreaking" of sequential rules: starting from
+    `start_committee`, the partial committees are extended by each of the tied candidates.
+    The search is depth-first and lazy (a generator), so that it can be stopped as soon as
+    sufficiently many committees have been found.
+
+    Partial committees that are reached in several ways (e.g., by adding `a` and then `b` or by
+    adding `b` and then `a`) are explored only once if they have the same state. A state is
+    identified by the set of candidates in the committee and `canonical_state(state)`. The order
+    in which committees are found is the same as without this memoization.
+
+    Parameters
+    ----------
+        committeesize : int
+            The desired committee size.
+
+        tied_successors : callable
+            `tied_successors(committee, state)` returns a list of pairs `(cand, new_state)`, the
+            candidates that are tied for being added to `committee` (in the order of
+            tiebreaking) together with the state after adding them. If the list is empty,
+            `committee` cannot be extended (and is yielded as it is).
+
+        start_committee : tuple, optional
+            The committee to start with.
+
+        start_state : optional
+            The state of `start_committee`.
+
+        canonical_state : callable, optional
+            Returns a hashable representation of a state. If `None`, states are assumed to be
+            determined by the set of candidates in the committee.
+
+    Yields
+    ------
+        tuple
+            A pair `(committee, state)`, where `committee` is a tuple (in the order in which
+            candidates have been added). A committee may be yielded several times if it is
+            reached with different states.
+    """
+    stack = [(tuple(start_committee), start_state)]
+    visited = set()
+    while stack:
+        committee, state = stack.pop()
+        if len(committee) >= committeesize:
+            yield committee, state
+            continue
+        successors = tied_successors(committee, state)
+        if not successors:
+            yield committee, state
+            continue
+        new_partial_committees = []
+        for cand, new_state in successors:
+            new_committee = committee + (cand,)
+            if canonical_state is None:
+                key = frozenset(new_committee)
+            else:
+                key = (frozenset(new_committee), canonical_state(new_state))
+            if key in visited:
+                continue  # the same state has been reached before
+            visited.add(key)
+            new_partial_committees.append((new_committee, new_state))
+        # add new partial committees in reversed order, so that tiebreaking is correct
+        stack += reversed(new_partial_committees)
+
+
 def _thiele_methods_bruteforce(
     scorefct_id,
     profile,
     committeesize,
     resolute,
     max_num_of_committees=MAX_NUM_OF_COMMITTEES_DEFAULT,
+    workers=None,
+    forced_cands=(),
 ):
     """
     Brute-force algorithm for Thiele methods (PAV, CC, etc.).
 
     Only intended for comparison, much slower than _thiele_methods_branchandbound()
+
+    Only committees containing all candidates in `forced_cands` are considered.
     """
-    opt_committees = []
-    opt_thiele_score = -1
-    for committee in itertools.combinations(profile.candidates, committeesize):
-        score = scores.thiele_score(scorefct_id, profile, committee)
-        if score > opt_thiele_score:
-            opt_committees = [committee]
-            opt_thiele_score = score
-        elif score == opt_thiele_score:
-            if not resolute:
-                opt_committees.append(committee)
+    free_cands = [cand for cand in profile.candidates if cand not in forced_cands]
+    _, opt_committees = _bruteforce_search(
+        _thiele_methods_bruteforce_shard,
+        profile,
+        committeesize,
+        workers,
+        scorefct_id,
+        resolute,
+        tuple(forced_cands),
+        num_committees=misc.binom(len(free_cands), committeesize - len(forced_cands)),
+    )
+    if resolute:
+        opt_committees = opt_committees[:1]
 
     committees = sorted_committees(opt_committees)
     if max_num_of_committees is not None:
@@ -780,49 +1190,274 @@ def _thiele_methods_bruteforce(
     return committees, detailed_info
 
 
+def _thiele_methods_bruteforce_shard(
+    profile, committeesize, start, stop, scorefct_id, resolute, forced_cands=()
+):
+    """
+    Brute-force algorithm for Thiele methods, restricted to committees with rank in [start, stop).
+
+    Ranks refer to the combinations of candidates not in `forced_cands`; the order of ranks
+    coincides with the lexicographic order of the corresponding committees (including
+    `forced_cands`).
+    """
+    opt_committees = []
+    opt_thiele_score = -1
+    # compare scaled scores, which are integers for integer weights
+    score_table = scores.score_table(scorefct_id, committeesize)
+    committees = misc.combinations_range(
+        profile.num_cand - len(forced_cands), committeesize - len(forced_cands), start, stop
+    )
+    if forced_cands:
+        free_cands = [cand for cand in profile.candidates if cand not in forced_cands]
+        committees = (
+            tuple(sorted(forced_cands + tuple(free_cands[i] for i in committee)))
+            for committee in committees
+        )
+    for batch in _batches(committees):
+        batch_scores = scores.scaled_thiele_scores_batch(score_table, profile, batch)
+        for committee, score in zip(batch, batch_scores):
+            if score > opt_thiele_score:
+                opt_committees = [committee]
+                opt_thiele_score = score
+            elif score == opt_thiele_score:
+                if not resolute:
+                    opt_committees.append(committee)
+    return opt_thiele_score, opt_committees
+
+
+def _thiele_methods_localsearch(
+    scorefct_id,
+    profile,
+    committeesize,
+    max_iterations=LOCAL_SEARCH_MAX_ITERATIONS,
+    time_limit=LOCAL_SEARCH_TIME_LIMIT,
+):
+    """
+    Local search for Thiele methods (heuristic).
+
+    Starts with the committee of the corresponding sequential Thiele method and repeatedly
+    replaces a committee member by the best non-member if this strictly increases the score.
+    Each attempted swap only updates the approvers of the two candidates involved
+    (`scores.ThieleScoreState`). The search stops in a local optimum or when the budget
+    (`max_iterations`, `time_limit` in seconds) is exhausted.
+
+    For non-increasing marginal score functions, the score of any committee plus the sum of the
+    `committeesize` largest marginal scores of non-members is an upper bound on the optimal
+    score (submodularity). The smallest such bound over all committees encountered
+    (during the sequential phase and in the final committee) is reported in `detailed_info`,
+    together with the resulting gap.
+    """
+    start_time = time.perf_counter()
+    state = scores.ThieleScoreState(scorefct_id, profile, committeesize)
+    add_gains = state.add_gains
+    marginal = state.table.marginal_scaled
+    submodular = all(marginal[i] >= marginal[i + 1] for i in range(1, committeesize))
+
+    def upper_bound_scaled(scaled_score):
+        return scaled_score + sum(
+            heapq.nlargest(
+                committeesize,
+                (add_gains[cand] for cand in profile.candidates if cand not in state.committee),
+            )
+        )
+
+    # start with sequential Thiele (tiebreaking in favor of candidates with smaller index)
+    scaled_score = 0
+    upper_bounds = []
+    for _ in range(committeesize):
+        if submodular:
+            upper_bounds.append(upper_bound_scaled(scaled_score))
+        next_cand = max(
+            (cand for cand in profile.candidates if cand not in state.committee),
+            key=lambda cand: (add_gains[cand], -cand),
+        )
+        scaled_score += add_gains[next_cand]
+        state.add(next_cand)
+
+    num_iterations = 0
+    stopping_reason = "local optimum"
+    improved = committeesize < profile.num_cand
+    while improved and stopping_reason == "local optimum":
+        improved = False
+        for cand_out in sorted(state.committee):
+            if max_iterations is not None and num_iterations >= max_iterations:
+                stopping_reason = "iteration limit"
+                break
+            if time_limit is not None and time.perf_counter() - start_time >= time_limit:
+                stopping_reason = "time limit"
+                break
+            num_iterations += 1
+            loss = state.remove_losses[cand_out]
+            state.remove(cand_out)
+            cand_in = max(
+                (cand for cand in profile.candidates if cand not in state.committee),
+                key=lambda cand: (add_gains[cand], -cand),
+            )
+            if add_gains[cand_in] > loss:
+                scaled_score += add_gains[cand_in] - loss
+                state.add(cand_in)
+                improved = True
+            else:
+                state.add(cand_out)
+
+    committee = sorted(state.committee)
+    score = scores.thiele_score(scorefct_id, profile, committee)
+    if submodular:
+        upper_bounds.append(upper_bound_scaled(scaled_score))
+        upper_bound = max(score, state.unscaled(min(upper_bounds)))
+        gap = upper_bound - score
+    else:
+        upper_bound = gap = None
+
+    detailed_info = {
+        "score": score,
+        "upper_bound": upper_bound,
+        "gap": gap,
+        "num_iterations": num_iterations,
+        "stopping_reason": stopping_reason,
+    }
+    return sorted_committees([committee]), detailed_info
+
+
+def _thiele_methods_kernel(scorefct_id, profile, committeesize):
+    """
+    Reduce an instance of a Thiele method to a smaller instance with the same winning committees.
+
+    Candidate `cand` is dominated by candidate `other` if the approvers of `cand` are a strict
+    subset of the approvers of `other`. If all marginal scores up to `committeesize` are positive
+    (e.g., PAV and SLAV, but not CC), replacing `cand` by `other` strictly increases the score.
+    Hence:
+
+    - a candidate that is dominated by at least `committeesize` candidates is not contained in
+      any winning committee and can be removed (this includes all candidates without approvers
+      if sufficiently many candidates are approved), and
+    - a candidate that dominates all but at most `committeesize - 1` other candidates is
+      contained in every winning committee (a forced candidate).
+
+    Since removed candidates are contained in no winning committee, the reduced instance has
+    exactly the same winning committees (after mapping candidates back); no tie-breaking
+    information is lost.
+
+    Parameters
+    ----------
+        scorefct_id : str
+            A string identifying the score function that defines the Thiele method.
+
+        profile : abcvoting.preferences.Profile
+            A profile.
+
+        committeesize : int
+            The desired committee size.
+
+    Returns
+    -------
+        tuple or None
+            A triple `(reduced_profile, kept_cands, forced_cands)` or `None` if the kernelization
+            is not applicable or does not reduce the instance.
+
+            `kept_cands[i]` is the candidate in `profile` that corresponds to candidate `i` in
+            `reduced_profile` (in increasing order). `forced_cands` is a tuple of candidates
+            in `reduced_profile` that are contained in every winning committee.
+    """
+    table = scores.score_table(scorefct_id, committeesize)
+    if not all(score > 0 for score in table.marginal[1:]):
+        return None
+
+    # the approvers of each candidate as bitmask over voter indices
+    approver_masks = [
+        sum(1 << voter_index for voter_index in voter_indices)
+        for voter_indices, _ in profile.approvers
+    ]
+    kept_cands = []
+    forced = []
+    for cand, mask in enumerate(approver_masks):
+        # number of candidates dominating `cand` and dominated by `cand`, respectively
+        num_dominating = 0
+        num_dominated = 0
+        for other_mask in approver_masks:
+            if other_mask == mask:
+                continue
+            if mask & other_mask == mask:
+                num_dominating += 1
+            elif mask & other_mask == other_mask:
+                num_dominated += 1
+        if num_dominating >= committeesize:
+            continue
+        kept_cands.append(cand)
+        if profile.num_cand - 1 - num_dominated < committeesize:
+            forced.append(cand)
+    if len(kept_cands) == profile.num_cand and not forced:
+        return None
+
+    cand_names = [profile.cand_names[cand] for cand in kept_cands]
+    reduced_profile = preferences.Profile.from_approval_matrix(
+        profile.approval_matrix[:, kept_cands],
+        weights=profile.weight_vector.tolist(),
+        cand_names=cand_names,
+    )
+    forced_cands = tuple(kept_cands.index(cand) for cand in forced)
+    return reduced_profile, kept_cands, forced_cands
+
+
 def _thiele_methods_branchandbound(
     scorefct_id,
     profile,
     committeesize,
     resolute,
     max_num_of_committees=MAX_NUM_OF_COMMITTEES_DEFAULT,
+    forced_cands=(),
 ):
     """
     Branch-and-bound algorithm for Thiele methods.
-    """
-    marginal_scorefct = scores.get_marginal_scorefct(scorefct_id, committeesize)
 
+    Depth-first search over committees. The satisfaction of voters is updated incrementally
+    (`scores.ThieleScoreState`). In each node, the remaining candidates are ordered by their
+    marginal score (largest first), so that the first branch corresponds to sequential
+    Thiele. A branch is pruned if the current score plus the largest marginal scores of the
+    remaining candidates (prefix sums of the ordered marginal scores) is smaller than the best
+    score found so far; this bound is valid for non-increasing marginal score functions.
+
+    Only committees containing all candidates in `forced_cands` are considered.
+    """
+    state = scores.ThieleScoreState(scorefct_id, profile, committeesize, committee=forced_cands)
     best_committees = []
-    init_com, _ = _seq_thiele_resolute(scorefct_id, profile, committeesize)
-    init_com = init_com[0]
-    best_score = scores.thiele_score(scorefct_id, profile, init_com)
-    part_coms = [[]]
-    while part_coms:
-        part_com = part_coms.pop(0)
-        # potential committee, check if at least as good
-        # as previous best committee
-        if len(part_com) == committeesize:
-            score = scores.thiele_score(scorefct_id, profile, part_com)
-            if score == best_score:
-                best_committees.append(part_com)
-            elif score > best_score:
-                best_committees = [part_com]
-                best_score = score
-        else:
-            if len(part_com) > 0:
-                largest_cand = part_com[-1]
-            else:
-                largest_cand = -1
-            missing = committeesize - len(part_com)
-            marg_util_cand = scores.marginal_thiele_scores_add(
-                marginal_scorefct, profile, part_com
-            )
-            upper_bound = sum(
-                sorted(marg_util_cand[largest_cand + 1 :])[-missing:]
-            ) + scores.thiele_score(scorefct_id, profile, part_com)
-            if upper_bound >= best_score:
-                for cand in range(largest_cand + 1, profile.num_cand - missing + 1):
-                    part_coms.insert(0, part_com + [cand])
+    best_score = None
+    num_nodes = 0
+    num_pruned = 0
+
+    def search(committee, score, allowed_cands):
+        nonlocal best_committees, best_score, num_nodes, num_pruned
+        num_nodes += 1
+        missing = committeesize - len(committee)
+        if missing == 0:
+            # only possible if all candidates are forced
+            best_committees = [committee]
+            return
+        add_gains = state.add_gains
+        cands = sorted(allowed_cands, key=lambda cand: (-add_gains[cand], cand))
+        gains = [add_gains[cand] for cand in cands]
+        # prefix_sums[i] is the sum of the i largest marginal scores
+        prefix_sums = [0] + list(itertools.accumulate(gains))
+        num_branches = len(cands) - missing + 1
+        for i in range(num_branches):
+            upper_bound = score + prefix_sums[i + missing] - prefix_sums[i]
+            if best_score is not None and upper_bound < best_score:
+                num_pruned += num_branches - i
+                return  # all further branches have smaller upper bounds
+            cand = cands[i]
+            if missing == 1:
+                # committee is complete (score is exact)
+                if best_score is None or upper_bound > best_score:
+                    best_committees = []
+                    best_score = upper_bound
+                best_committees.append(committee + (cand,))
+                continue
+            state.add(cand)
+            search(committee + (cand,), score + gains[i], cands[i + 1 :])
+            state.remove(cand)
+
+    forced_cands = tuple(forced_cands)
+    search(forced_cands, 0, [cand for cand in profile.candidates if cand not in forced_cands])
 
     committees = sorted_committees(best_committees)
     if max_num_of_committees is not None:
@@ -830,7 +1465,7 @@ def _thiele_methods_branchandbound(
     if resolute:
         committees = [committees[0]]
 
-    detailed_info = {}
+    detailed_info = {"num_nodes": num_nodes, "num_pruned": num_pruned}
     return committees, detailed_info
 
 
@@ -840,6 +1475,7 @@ def compute_pav(
     algorithm="fastest",
     resolute=False,
     max_num_of_committees=MAX_NUM_OF_COMMITTEES_DEFAULT,
+    workers=WORKERS_DEFAULT,
 ):
     """
     Compute winning committees with Proportional Approval Voting (PAV).
@@ -882,6 +1518,11 @@ def compute_pav(
              The default value of `max_num_of_committees` can be modified via the constant
              `MAX_NUM_OF_COMMITTEES_DEFAULT`.
 
+        workers : int, optional
+            Number of worker processes used by the algorithm "brute-force".
+
+            See `WORKERS_DEFAULT`. Other algorithms ignore this parameter.
+
     Returns
     -------
         list of CandidateSet
@@ -894,6 +1535,7 @@ def compute_pav(
         algorithm=algorithm,
         resolute=resolute,
         max_num_of_committees=max_num_of_committees,
+        workers=workers,
     )
 
 
@@ -903,6 +1545,7 @@ def compute_slav(
     algorithm="fastest",
     resolute=False,
     max_num_of_committees=MAX_NUM_OF_COMMITTEES_DEFAULT,
+    workers=WORKERS_DEFAULT,
 ):
     """
     Compute winning committees with Sainte-Lague Approval Voting (SLAV).
@@ -946,6 +1589,11 @@ def compute_slav(
              The default value of `max_num_of_committees` can be modified via the constant
              `MAX_NUM_OF_COMMITTEES_DEFAULT`.
 
+        workers : int, optional
+            Number of worker processes used by the algorithm "brute-force".
+
+            See `WORKERS_DEFAULT`. Other algorithms ignore this parameter.
+
     Returns
     -------
         list of CandidateSet
@@ -958,6 +1606,7 @@ def compute_slav(
         algorithm=algorithm,
         resolute=resolute,
         max_num_of_committees=max_num_of_committees,
+        workers=workers,
     )
 
 
@@ -967,6 +1616,7 @@ def compute_cc(
     algorithm="fastest",
     resolute=False,
     max_num_of_committees=MAX_NUM_OF_COMMITTEES_DEFAULT,
+    workers=WORKERS_DEFAULT,
 ):
     """
     Compute winning committees with Approval Chamberlin-Courant (CC).
@@ -1010,6 +1660,11 @@ def compute_cc(
              The default value of `max_num_of_committees` can be modified via the constant
              `MAX_NUM_OF_COMMITTEES_DEFAULT`.
 
+        workers : int, optional
+            Number of worker processes used by the algorithm "brute-force".
+
+            See `WORKERS_DEFAULT`. Other algorithms ignore this parameter.
+
     Returns
     -------
         list of CandidateSet
@@ -1022,6 +1677,7 @@ def compute_cc(
         algorithm=algorithm,
         resolute=resolute,
         max_num_of_committees=max_num_of_committees,
+        workers=workers,
     )
 
 
@@ -1031,6 +1687,7 @@ def compute_lexcc(
     algorithm="fastest",
     resolute=False,
     max_num_of_committees=MAX_NUM_OF_COMMITTEES_DEFAULT,
+    workers=WORKERS_DEFAULT,
 ):
     """
     Compute winning committees with a Lexicographic Chamberlin-Courant (lex-CC).
@@ -1079,6 +1736,11 @@ def compute_lexcc(
              The default value of `max_num_of_committees` can be modified via the constant
              `MAX_NUM_OF_COMMITTEES_DEFAULT`.
 
+        workers : int, optional
+            Number of worker processes used by the algorithm "brute-force".
+
+            See `WORKERS_DEFAULT`. Other algorithms ignore this parameter.
+
     Returns
     -------
         list of CandidateSet
@@ -1102,6 +1764,7 @@ def compute_lexcc(
             committeesize=committeesize,
             resolute=resolute,
             max_num_of_committees=max_num_of_committees,
+            workers=workers,
         )
     elif algorithm == "gurobi":
         committees, detailed_info = abcrules_gurobi._gurobi_lexcc(
@@ -1144,23 +1807,10 @@ def compute_lexcc(
     return committees
 
 
-def _lexcc_bruteforce(profile, committeesize, resolute, max_num_of_committees):
-    opt_committees = []
-    opt_score_vector = [0] * committeesize
-    for committee in itertools.combinations(profile.candidates, committeesize):
-        score_vector = [
-            scores.thiele_score(f"atleast{ell}", profile, committee)
-            for ell in range(1, committeesize + 1)
-        ]
-        for i in range(committeesize):
-            if opt_score_vector[i] > score_vector[i]:
-                break
-            if opt_score_vector[i] < score_vector[i]:
-                opt_score_vector = score_vector
-                opt_committees = [committee]
-                break
-        else:
-            opt_committees.append(committee)
+def _lexcc_bruteforce(profile, committeesize, resolute, max_num_of_committees, workers=None):
+    opt_score_vector, opt_committees = _bruteforce_search(
+        _lexcc_bruteforce_shard, profile, committeesize, workers
+    )
 
     committees = sorted_committees(opt_committees)
     detailed_info = {"opt_score_vector": opt_score_vector}
@@ -1171,6 +1821,32 @@ def _lexcc_bruteforce(profile, committeesize, resolute, max_num_of_committees):
     return committees, detailed_info
 
 
+def _lexcc_bruteforce_shard(profile, committeesize, start, stop):
+    opt_committees = []
+    opt_score_vector = [0] * committeesize
+    committees = misc.combinations_range(profile.num_cand, committeesize, start, stop)
+    for batch in _batches(committees):
+        batch_score_vectors = zip(
+            *(
+                scores.thiele_scores_batch(f"atleast{ell}", profile, batch)
+                for ell in range(1, committeesize + 1)
+            )
+        )
+        for committee, score_vector in zip(batch, batch_score_vectors):
+            score_vector = list(score_vector)
+            for i in range(committeesize):
+                if opt_score_vector[i] > score_vector[i]:
+                    break
+                if opt_score_vector[i] < score_vector[i]:
+                    opt_score_vector = score_vector
+                    opt_committees = [committee]
+                    break
+            else:
+                opt_committees.append(committee)
+    # score vectors are compared lexicographically (larger is better)
+    return opt_score_vector, opt_committees
+
+
 def compute_seq_thiele_method(
     scorefct_id,
     profile,
@@ -1239,6 +1915,17 @@ def compute_seq_thiele_method(
             committees, detailed_info = _seq_thiele_irresolute(
                 scorefct_id, profile, committeesize, max_num_of_committees
             )
+    elif algorithm == "lazy-greedy":
+        if resolute:
+            committees, detailed_info = _seq_thiele_lazy_resolute(
+                scorefct_id, profile, committeesize
+            )
+        else:
+            # all tied candidates have to be explored, so there is nothing to gain from
+            # lazy evaluation
+            committees, detailed_info = _seq_thiele_irresolute(
+                scorefct_id, profile, committeesize, max_num_of_committees
+            )
     else:
         raise UnknownAlgorithm(rule_id, algorithm)
 
@@ -1248,7 +1935,8 @@ def compute_seq_thiele_method(
         output.info("Computing all possible winning committees for any tiebreaking order")
         output.info(" (aka parallel universes tiebreaking) (resolute=False)\n")
     output.details(f"Algorithm: {ALGORITHM_NAMES[algorithm]}\n")
-    if resolute:
+    if resolute and output.is_enabled(DETAILS):
+        # only compute intermediate scores if they are actually output
         output.details(
             f"starting with the empty committee (score = "
             f"{scores.thiele_score(scorefct_id, profile, [])})\n"
@@ -1300,24 +1988,79 @@ def _seq_thiele_resolute(scorefct_id, profile, committeesize):
     number/index (candidates with larger numbers get deleted first).
     """
     committee = []
-    marginal_scorefct = scores.get_marginal_scorefct(scorefct_id, committeesize)
+    state = scores.ThieleScoreState(scorefct_id, profile, committeesize)
+    detailed_info = {"next_cand": [], "tied_cands": [], "delta_score": []}
+
+    # build a committee starting with the empty set
+    for _ in range(committeesize):
+        # marginal utility gained by adding candidate to the committee (scaled)
+        additional_score_cand = {
+            cand: state.add_gains[cand] for cand in profile.candidates if cand not in committee
+        }
+        max_additional_score = max(additional_score_cand.values())
+        tied_cands = [
+            cand
+            for cand, additional_score in additional_score_cand.items()
+            if additional_score == max_additional_score
+        ]
+        next_cand = tied_cands[0]  # tiebreaking in favor of candidate with smallest index
+        committee.append(next_cand)
+        state.add(next_cand)
+        detailed_info["next_cand"].append(next_cand)
+        detailed_info["tied_cands"].append(tied_cands)
+        detailed_info["delta_score"].append(state.unscaled(max_additional_score))
+
+    return sorted_committees([committee]), detailed_info
+
+
+def _seq_thiele_lazy_resolute(scorefct_id, profile, committeesize):
+    """
+    Compute one winning committee (=resolute) for sequential Thiele methods via lazy evaluation.
+
+    If marginal scores are non-increasing, the marginal score of a candidate can only decrease
+    when the committee grows. Hence, outdated marginal scores are upper bounds and are kept in a
+    priority queue; only candidates at the top of the queue are re-evaluated.
+    Tiebreaking is in favor of candidates with smaller index (as in `_seq_thiele_resolute`).
+    """
+    state = scores.ThieleScoreState(scorefct_id, profile, committeesize, lazy=True)
+    marginal = state.table.marginal_scaled
+    if any(marginal[i] < marginal[i + 1] for i in range(1, committeesize)):
+        raise ValueError(
+            'Algorithm "lazy-greedy" requires a score function with non-increasing marginal '
+            f'scores ("{scorefct_id}" is not).'
+        )
+
+    committee = []
     detailed_info = {"next_cand": [], "tied_cands": [], "delta_score": []}
-
-    # build a committee starting with the empty set
-    for _ in range(committeesize):
-        additional_score_cand = scores.marginal_thiele_scores_add(
-            marginal_scorefct, profile, committee
-        )
-        tied_cands = [
-            cand
-            for cand in range(len(additional_score_cand))
-            if additional_score_cand[cand] == max(additional_score_cand)
-        ]
+    # priority queue with entries (-upper bound on marginal score, candidate)
+    queue = [(-add_gain, cand) for cand, add_gain in enumerate(state.add_gains)]
+    heapq.heapify(queue)
+    # the round in which the entry of a candidate in `queue` has been computed
+    last_update = [0] * profile.num_cand
+
+    for current_round in range(committeesize):
+        tied_cands = []
+        max_additional_score = None
+        while queue:
+            neg_additional_score, cand = queue[0]
+            if max_additional_score is not None and -neg_additional_score != max_additional_score:
+                break  # no more candidates with maximum marginal score
+            if last_update[cand] == current_round:
+                # up to date, hence maximum marginal score among all candidates
+                heapq.heappop(queue)
+                max_additional_score = -neg_additional_score
+                tied_cands.append(cand)
+            else:
+                heapq.heapreplace(queue, (-state.gain(cand), cand))
+                last_update[cand] = current_round
         next_cand = tied_cands[0]  # tiebreaking in favor of candidate with smallest index
+        for cand in tied_cands[1:]:
+            heapq.heappush(queue, (-max_additional_score, cand))
         committee.append(next_cand)
+        state.add(next_cand)
         detailed_info["next_cand"].append(next_cand)
         detailed_info["tied_cands"].append(tied_cands)
-        detailed_info["delta_score"].append(max(additional_score_cand))
+        detailed_info["delta_score"].append(state.unscaled(max_additional_score))
 
     return sorted_committees([committee]), detailed_info
 
@@ -1328,38 +2071,35 @@ def _seq_thiele_irresolute(scorefct_id, profile, committeesize, max_num_of_commi
     Consider all possible ways to break ties between candidates
     (aka parallel universe tiebreaking)
     """
-    marginal_scorefct = scores.get_marginal_scorefct(scorefct_id, committeesize)
 
-    # build committees starting with the empty set
-    partial_committees = [()]
-    winning_committees = set()
+    def tied_successors(committee, state):
+        # states are stored lazily as a pair (score state of the parent committee, last
+        # candidate) and only updated when the committee is processed
+        if state is None:
+            state = scores.ThieleScoreState(scorefct_id, profile, committeesize, committee)
+        else:
+            parent_state, last_cand = state
+            state = parent_state.copy()
+            state.add(last_cand)
+        # marginal utility gained by adding candidate to the committee (scaled)
+        additional_score_cand = {
+            cand: state.add_gains[cand] for cand in profile.candidates if cand not in committee
+        }
+        max_additional_score = max(additional_score_cand.values())
+        return [
+            (cand, (state, cand))
+            for cand, additional_score in additional_score_cand.items()
+            if additional_score >= max_additional_score
+        ]
 
-    while partial_committees:
-        new_partial_committees = []
-        committee = partial_committees.pop()
-        # marginal utility gained by adding candidate to the committee
-        additional_score_cand = scores.marginal_thiele_scores_add(
-            marginal_scorefct, profile, committee
-        )
-        for cand in profile.candidates:
-            if additional_score_cand[cand] >= max(additional_score_cand):
-                new_committee = committee + (cand,)
-
-                if len(new_committee) == committeesize:
-                    new_committee = tuple(sorted(new_committee))
-                    winning_committees.add(new_committee)  # remove duplicate committees
-                    if (
-                        max_num_of_committees is not None
-                        and len(winning_committees) == max_num_of_committees
-                    ):
-                        # sufficiently many winning committees found
-                        detailed_info = {}
-                        return sorted_committees(winning_committees), detailed_info
-                else:
-                    # partial committee
-                    new_partial_committees.append(new_committee)
-        # add new partial committees in reversed order, so that tiebreaking is correct
-        partial_committees += reversed(new_partial_committees)
+    # the score state is determined by the set of candidates in the committee, hence no
+    # `canonical_state` is required
+    winning_committees = set()
+    for committee, _ in _parallel_universes(committeesize, tied_successors):
+        winning_committees.add(tuple(sorted(committee)))  # remove duplicate committees
+        if max_num_of_committees is not None and len(winning_committees) == max_num_of_committees:
+            # sufficiently many winning committees found
+            break
 
     detailed_info = {}
     return sorted_committees(winning_committees), detailed_info
@@ -1635,7 +2375,8 @@ def compute_revseq_thiele_method(
         output.info(" (aka parallel universes tiebreaking) (resolute=False)\n")
     output.details(f"Algorithm: {ALGORITHM_NAMES[algorithm]}\n")
 
-    if resolute:
+    if resolute and output.is_enabled(DETAILS):
+        # only compute intermediate scores if they are actually output
         committee = set(profile.candidates)
         output.details(
             f"full committee ({len(committee)} candidates) has a total score of "
@@ -1688,30 +2429,41 @@ def _revseq_thiele_resolute(scorefct_id, profile, committeesize):
     Tiebreaking between candidates in favor of candidate with smaller
     number/index (candidates with smaller numbers are added first).
     """
-    marginal_scorefct = scores.get_marginal_scorefct(scorefct_id, committeesize)
     committee = set(profile.candidates)
+    state = _revseq_thiele_initial_state(scorefct_id, profile)
 
     detailed_info = {"next_cand": [], "tied_cands": [], "delta_score": []}
 
     for _ in range(profile.num_cand - committeesize):
-        marg_util_cand = scores.marginal_thiele_scores_remove(
-            marginal_scorefct, profile, committee
-        )
+        # marginal utility lost by removing candidate from the committee (scaled)
+        marg_util_cand = {cand: state.remove_losses[cand] for cand in sorted(committee)}
+        min_marg_util = min(marg_util_cand.values())
         # find smallest elements in `marg_util_cand` and return indices
         cands_to_remove = [
-            cand for cand in profile.candidates if marg_util_cand[cand] == min(marg_util_cand)
+            cand for cand, marg_util in marg_util_cand.items() if marg_util == min_marg_util
         ]
         next_cand = cands_to_remove[-1]
         tied_cands = cands_to_remove[:-1]
         committee.remove(next_cand)
+        state.remove(next_cand)
 
         detailed_info["next_cand"].append(next_cand)
         detailed_info["tied_cands"].append(tied_cands)
-        detailed_info["delta_score"].append(min(marg_util_cand))
+        detailed_info["delta_score"].append(state.unscaled(min_marg_util))
 
     return sorted_committees([committee]), detailed_info
 
 
+def _revseq_thiele_initial_state(scorefct_id, profile):
+    """
+    Return the score state of the full committee (containing all candidates).
+    """
+    max_ballot_length = int(profile.approval_matrix.sum(axis=1).max())
+    return scores.ThieleScoreState(
+        scorefct_id, profile, max_ballot_length, committee=profile.candidates
+    )
+
+
 def _revseq_thiele_irresolute(scorefct_id, profile, committeesize, max_num_of_committees):
     """
     Compute all winning committee (=irresolute) for reverse sequential Thiele methods.
@@ -1719,28 +2471,29 @@ def _revseq_thiele_irresolute(scorefct_id, profile, committeesize, max_num_of_co
     Consider all possible ways to break ties between candidates
     (aka parallel universe tiebreaking)
     """
-    marginal_scorefct = scores.get_marginal_scorefct(scorefct_id, committeesize)
-
     full_committee = tuple(profile.candidates)
-    comm_scores = {full_committee: scores.thiele_score(scorefct_id, profile, full_committee)}
+    # committees with their score states
+    comm_states = {full_committee: _revseq_thiele_initial_state(scorefct_id, profile)}
 
     for _ in range(profile.num_cand - committeesize):
-        comm_scores_next = {}
-        for committee, score in comm_scores.items():
-            marg_util_cand = scores.marginal_thiele_scores_remove(
-                marginal_scorefct, profile, committee
-            )
-            score_reduction = min(marg_util_cand)
+        comm_states_next = {}
+        for committee, state in comm_states.items():
+            # marginal utility lost by removing candidate from the committee (scaled)
+            min_marg_util = min(state.remove_losses[cand] for cand in committee)
             # find smallest elements in `marg_util_cand` and return indices
             cands_to_remove = [
-                cand for cand in profile.candidates if marg_util_cand[cand] == min(marg_util_cand)
+                cand for cand in committee if state.remove_losses[cand] == min_marg_util
             ]
             for cand in cands_to_remove:
-                next_committee = tuple(set(committee) - {cand})
-                comm_scores_next[next_committee] = score - score_reduction
-            comm_scores = comm_scores_next
-
-    committees = sorted_committees(list(comm_scores.keys()))
+                next_committee = tuple(sorted(set(committee) - {cand}))
+                if next_committee in comm_states_next:
+                    continue  # reached via a different order of removals
+                next_state = state.copy()
+                next_state.remove(cand)
+                comm_states_next[next_committee] = next_state
+        comm_states = comm_states_next
+
+    committees = sorted_committees(list(comm_states.keys()))
     if max_num_of_committees is not None:
         committees = committees[:max_num_of_committees]
     detailed_info = {}
@@ -2119,6 +2872,7 @@ def compute_minimaxav(
     algorithm="fastest",
     resolute=False,
     max_num_of_committees=MAX_NUM_OF_COMMITTEES_DEFAULT,
+    workers=WORKERS_DEFAULT,
 ):
     """
     Compute winning committees with Minimax Approval Voting (MAV).
@@ -2159,6 +2913,11 @@ def compute_minimaxav(
              The default value of `max_num_of_committees` can be modified via the constant
              `MAX_NUM_OF_COMMITTEES_DEFAULT`.
 
+        workers : int, optional
+            Number of worker processes used by the algorithm "brute-force".
+
+            See `WORKERS_DEFAULT`. Other algorithms ignore this parameter.
+
     Returns
     -------
         list of CandidateSet
@@ -2212,6 +2971,7 @@ def compute_minimaxav(
             committeesize=committeesize,
             resolute=resolute,
             max_num_of_committees=max_num_of_committees,
+            workers=workers,
         )
     else:
         raise UnknownAlgorithm(rule_id, algorithm)
@@ -2236,17 +2996,11 @@ def compute_minimaxav(
     return committees
 
 
-def _minimaxav_bruteforce(profile, committeesize, resolute, max_num_of_committees):
+def _minimaxav_bruteforce(profile, committeesize, resolute, max_num_of_committees, workers=None):
     """Brute-force algorithm for Minimax AV (MAV)."""
-    opt_committees = []
-    opt_minimaxav_score = profile.num_cand + 1
-    for committee in itertools.combinations(profile.candidates, committeesize):
-        score = scores.minimaxav_score(profile, committee)
-        if score < opt_minimaxav_score:
-            opt_committees = [committee]
-            opt_minimaxav_score = score
-        elif score == opt_minimaxav_score:
-            opt_committees.append(committee)
+    _, opt_committees = _bruteforce_search(
+        _minimaxav_bruteforce_shard, profile, committeesize, workers
+    )
 
     committees = sorted_committees(opt_committees)
     detailed_info = {}
@@ -2257,12 +3011,30 @@ def _minimaxav_bruteforce(profile, committeesize, resolute, max_num_of_committee
     return committees, detailed_info
 
 
+def _minimaxav_bruteforce_shard(profile, committeesize, start, stop):
+    opt_committees = []
+    opt_minimaxav_score = profile.num_cand + 1
+    # the MAV score only depends on the distinct approval sets
+    approval_bitmasks = set(profile.approval_bitmasks)
+    for committee in misc.combinations_range(profile.num_cand, committeesize, start, stop):
+        committee_bitmask = misc.bitmask(committee)
+        score = max(misc.hamming_bitmask(mask, committee_bitmask) for mask in approval_bitmasks)
+        if score < opt_minimaxav_score:
+            opt_committees = [committee]
+            opt_minimaxav_score = score
+        elif score == opt_minimaxav_score:
+            opt_committees.append(committee)
+    # smaller scores are better
+    return -opt_minimaxav_score, opt_committees
+
+
 def compute_lexminimaxav(
     profile,
     committeesize,
     algorithm="fastest",
     resolute=False,
     max_num_of_committees=MAX_NUM_OF_COMMITTEES_DEFAULT,
+    workers=WORKERS_DEFAULT,
 ):
     """
     Compute winning committees with Lexicographic Minimax AV (lex-MAV).
@@ -2312,6 +3084,11 @@ def compute_lexminimaxav(
              The default value of `max_num_of_committees` can be modified via the constant
              `MAX_NUM_OF_COMMITTEES_DEFAULT`.
 
+        workers : int, optional
+            Number of worker processes used by the algorithm "brute-force".
+
+            See `WORKERS_DEFAULT`. Other algorithms ignore this parameter.
+
     Returns
     -------
         list of CandidateSet
@@ -2338,6 +3115,7 @@ def compute_lexminimaxav(
             committeesize=committeesize,
             resolute=resolute,
             max_num_of_committees=max_num_of_committees,
+            workers=workers,
         )
     elif algorithm == "gurobi":
         committees, detailed_info = abcrules_gurobi._gurobi_lexminimaxav(
@@ -2375,12 +3153,32 @@ def compute_lexminimaxav(
     return committees
 
 
-def _lexminimaxav_bruteforce(profile, committeesize, resolute, max_num_of_committees):
+def _lexminimaxav_bruteforce(
+    profile, committeesize, resolute, max_num_of_committees, workers=None
+):
+    negated_opt_distances, opt_committees = _bruteforce_search(
+        _lexminimaxav_bruteforce_shard, profile, committeesize, workers
+    )
+    opt_distances = [-dist for dist in negated_opt_distances]
+
+    committees = sorted_committees(opt_committees)
+    detailed_info = {"opt_distances": opt_distances}
+    if resolute:
+        committees = [committees[0]]
+    if max_num_of_committees is not None:
+        committees = committees[:max_num_of_committees]
+    return committees, detailed_info
+
+
+def _lexminimaxav_bruteforce_shard(profile, committeesize, start, stop):
     opt_committees = []
     opt_distances = [profile.num_cand + 1] * len(profile)
-    for committee in itertools.combinations(profile.candidates, committeesize):
+    approval_bitmasks = profile.approval_bitmasks
+    for committee in misc.combinations_range(profile.num_cand, committeesize, start, stop):
+        committee_bitmask = misc.bitmask(committee)
         distances = sorted(
-            (misc.hamming(voter.approved, set(committee)) for voter in profile), reverse=True
+            (misc.hamming_bitmask(mask, committee_bitmask) for mask in approval_bitmasks),
+            reverse=True,
         )
         for i, dist in enumerate(distances):
             if opt_distances[i] < dist:
@@ -2391,14 +3189,8 @@ def _lexminimaxav_bruteforce(profile, committeesize, resolute, max_num_of_commit
                 break
         else:
             opt_committees.append(committee)
-
-    committees = sorted_committees(opt_committees)
-    detailed_info = {"opt_distances": opt_distances}
-    if resolute:
-        committees = [committees[0]]
-    if max_num_of_committees is not None:
-        committees = committees[:max_num_of_committees]
-    return committees, detailed_info
+    # sorted distances are compared lexicographically (smaller is better)
+    return [-dist for dist in opt_distances], opt_committees
 
 
 def compute_monroe(
@@ -2407,6 +3199,7 @@ def compute_monroe(
     algorithm="fastest",
     resolute=False,
     max_num_of_committees=MAX_NUM_OF_COMMITTEES_DEFAULT,
+    workers=WORKERS_DEFAULT,
 ):
     """
     Compute winning committees with Monroe's rule.
@@ -2447,6 +3240,11 @@ def compute_monroe(
              The default value of `max_num_of_committees` can be modified via the constant
              `MAX_NUM_OF_COMMITTEES_DEFAULT`.
 
+        workers : int, optional
+            Number of worker processes used by the algorithm "brute-force".
+
+            See `WORKERS_DEFAULT`. Other algorithms ignore this parameter.
+
     Returns
     -------
         list of CandidateSet
@@ -2502,6 +3300,7 @@ def compute_monroe(
             committeesize=committeesize,
             resolute=resolute,
             max_num_of_committees=max_num_of_committees,
+            workers=workers,
         )
     else:
         raise UnknownAlgorithm(rule_id, algorithm)
@@ -2522,19 +3321,13 @@ def compute_monroe(
     return committees
 
 
-def _monroe_bruteforce(profile, committeesize, resolute, max_num_of_committees):
+def _monroe_bruteforce(profile, committeesize, resolute, max_num_of_committees, workers=None):
     """
     Brute-force algorithm for Monroe's rule.
     """
-    opt_committees = []
-    opt_monroescore = -1
-    for committee in itertools.combinations(profile.candidates, committeesize):
-        score = scores.monroescore(profile, committee)
-        if score > opt_monroescore:
-            opt_committees = [committee]
-            opt_monroescore = score
-        elif scores.monroescore(profile, committee) == opt_monroescore:
-            opt_committees.append(committee)
+    _, opt_committees = _bruteforce_search(
+        _monroe_bruteforce_shard, profile, committeesize, workers
+    )
 
     committees = sorted_committees(opt_committees)
     if max_num_of_committees is not None:
@@ -2546,6 +3339,19 @@ def _monroe_bruteforce(profile, committeesize, resolute, max_num_of_committees):
     return committees, detailed_info
 
 
+def _monroe_bruteforce_shard(profile, committeesize, start, stop):
+    opt_committees = []
+    opt_monroescore = -1
+    for committee in misc.combinations_range(profile.num_cand, committeesize, start, stop):
+        score = scores.monroescore(profile, committee)
+        if score > opt_monroescore:
+            opt_committees = [committee]
+            opt_monroescore = score
+        elif scores.monroescore(profile, committee) == opt_monroescore:
+            opt_committees.append(committee)
+    return opt_monroescore, opt_committees
+
+
 def compute_greedy_monroe(
     profile, committeesize, algorithm="fastest", resolute=True, max_num_of_committees=None
 ):
@@ -2734,7 +3540,7 @@ def compute_seqphragmen(
             .. doctest::
 
                 >>> Rule("seqphragmen").algorithms
-                ('float-fractions', 'gmpy2-fractions', 'standard-fractions')
+                ('float-fractions', 'auto-exact', 'gmpy2-fractions', 'standard-fractions')
 
         resolute : bool, optional
             Return only one winning committee.
@@ -2767,13 +3573,15 @@ def compute_seqphragmen(
     )
 
     if resolute:
-        committees, detailed_info = _seqphragmen_resolute(
+        committees, detailed_info = _auto_exact(
+            _seqphragmen_resolute,
             profile=profile,
             committeesize=committeesize,
             algorithm=algorithm,
         )
     else:
-        committees, detailed_info = _seqphragmen_irresolute(
+        committees, detailed_info = _auto_exact(
+            _seqphragmen_irresolute,
             profile=profile,
             committeesize=committeesize,
             algorithm=algorithm,
@@ -2839,12 +3647,20 @@ def compute_seqphragmen(
 
 
 def _seqphragmen_resolute(
-    profile, committeesize, algorithm, start_load=None, partial_committee=None
+    profile,
+    committeesize,
+    algorithm,
+    start_load=None,
+    partial_committee=None,
+    exact_start_load=None,
 ):
     """
     Algorithm for computing resolute seq-Phragmen (1 winning committee).
+
+    For the algorithm "auto-exact", `exact_start_load` is an optional function that returns
+    `start_load` in exact fractions (if `start_load` contains floats).
     """
-    if algorithm == "float-fractions":
+    if algorithm in ["float-fractions", "auto-exact"]:
         division = lambda x, y: x / y  # standard float division
     elif algorithm == "standard-fractions":
         division = Fraction  # using Python built-in fractions
@@ -2857,9 +3673,6 @@ def _seqphragmen_resolute(
     else:
         raise UnknownAlgorithm("seqphragmen", algorithm)
 
-    approvers_weight = {}
-    for cand in profile.candidates:
-        approvers_weight[cand] = sum(voter.weight for voter in profile if cand in voter.approved)
     load = start_load
     if load is None:
         load = [0 for _ in range(len(profile))]
@@ -2867,6 +3680,24 @@ def _seqphragmen_resolute(
     if partial_committee is None:
         committee = []  # build committees starting with the empty set
 
+    # loads of approvers are updated incrementally,
+    # exact algorithms use integer arithmetic if weights and loads are rational
+    if algorithm not in ["float-fractions", "auto-exact"] and (
+        scores.ExactPhragmenLoadState.is_applicable(profile, load)
+    ):
+        load_state = scores.ExactPhragmenLoadState(profile, load, division)
+    else:
+        load_state = scores.PhragmenLoadState(profile, load, division)
+    if algorithm == "auto-exact":
+        # near ties are resolved with exact loads, which are only updated when required
+        exact_load_state = None
+        if scores.ExactPhragmenLoadState.is_applicable(profile, load):
+            exact_load_state = scores.ExactPhragmenLoadState(
+                profile, list(load), mpq if mpq else Fraction
+            )
+        exact_committee = list(committee)
+        pending_cands = []  # candidates not yet added to `exact_load_state`
+
     detailed_info = {
         "next_cand": [],
         "tied_cands": [],
@@ -2875,33 +3706,43 @@ def _seqphragmen_resolute(
     }
 
     for _ in range(len(committee), committeesize):
-        approvers_load = {}
-        for cand in profile.candidates:
-            approvers_load[cand] = sum(
-                voter.weight * load[v] for v, voter in enumerate(profile) if cand in voter.approved
-            )
-        new_maxload = [
-            division(approvers_load[cand] + 1, approvers_weight[cand])
-            if approvers_weight[cand] > 0
-            else committeesize + 1
-            for cand in profile.candidates
-        ]
-        # exclude committees already in the committee
-        for cand in profile.candidates:
-            if cand in committee:
-                new_maxload[cand] = committeesize + 2  # that's larger than any possible value
-        opt = min(new_maxload)
-        if algorithm == "float-fractions":
-            tied_cands = [
-                cand for cand in profile.candidates if misc.isclose(new_maxload[cand], opt)
-            ]
+        # only candidates (not in the committee) that might minimize the new maximum load
+        new_maxload = load_state.new_maxloads(committee, committeesize)
+        if algorithm == "auto-exact" and len(new_maxload) > 1:
+            # floats are too close to find the minimum reliably
+            if exact_load_state is None and exact_start_load is not None:
+                exact_load = exact_start_load()
+                if exact_load is not None and scores.ExactPhragmenLoadState.is_applicable(
+                    profile, exact_load
+                ):
+                    exact_load_state = scores.ExactPhragmenLoadState(
+                        profile, exact_load, mpq if mpq else Fraction
+                    )
+            if exact_load_state is None:
+                raise _NearTie
+            for cand in pending_cands:
+                exact_new_maxload = exact_load_state.new_maxloads(exact_committee, committeesize)
+                if cand not in exact_new_maxload:
+                    raise _NearTie  # an earlier decision based on floats was wrong
+                exact_load_state.add(cand, exact_new_maxload[cand])
+                exact_committee.append(cand)
+            pending_cands = []
+            exact_new_maxload = exact_load_state.new_maxloads(exact_committee, committeesize)
+            new_maxload = {cand: float(value) for cand, value in exact_new_maxload.items()}
+            # these candidates are exactly tied
+            tied_cands = list(new_maxload)
+            opt = new_maxload[tied_cands[0]]
+        elif algorithm in ["float-fractions", "auto-exact"]:
+            opt = min(new_maxload.values())
+            tied_cands = [cand for cand in new_maxload if misc.isclose(new_maxload[cand], opt)]
         else:
-            tied_cands = [cand for cand in profile.candidates if new_maxload[cand] == opt]
+            opt = min(new_maxload.values())
+            tied_cands = [cand for cand in new_maxload if new_maxload[cand] == opt]
         next_cand = tied_cands[0]
         # compute new loads and add new candidate
-        for v, voter in enumerate(profile):
-            if next_cand in voter.approved:
-                load[v] = new_maxload[next_cand]
+        load_state.add(next_cand, new_maxload[next_cand])
+        if algorithm == "auto-exact":
+            pending_cands.append(next_cand)
 
         committee = sorted(committee + [next_cand])
         detailed_info["next_cand"].append(next_cand)
@@ -2920,9 +3761,15 @@ def _seqphragmen_irresolute(
     max_num_of_committees,
     start_load=None,
     partial_committee=None,
+    exact_start_load=None,
 ):
-    """Algorithm for computing irresolute seq-Phragmen (all winning committees)."""
-    if algorithm == "float-fractions":
+    """
+    Algorithm for computing irresolute seq-Phragmen (all winning committees).
+
+    For the algorithm "auto-exact", `exact_start_load` is an optional function that returns
+    `start_load` in exact fractions (if `start_load` contains floats).
+    """
+    if algorithm in ["float-fractions", "auto-exact"]:
         division = lambda x, y: x / y  # standard float division
     elif algorithm == "standard-fractions":
         division = Fraction  # using Python built-in fractions
@@ -2935,9 +3782,8 @@ def _seqphragmen_irresolute(
     else:
         raise UnknownAlgorithm("seqphragmen", algorithm)
 
-    approvers_weight = {}
-    for cand in profile.candidates:
-        approvers_weight[cand] = sum(voter.weight for voter in profile if cand in voter.approved)
+    approvers = profile.approvers
+    approvers_weight = {cand: sum(approvers[cand][1]) for cand in profile.candidates}
 
     load = start_load
     if load is None:
@@ -2945,21 +3791,15 @@ def _seqphragmen_irresolute(
 
     if partial_committee is None:
         partial_committee = ()  # build committees starting with the empty set
-    else:
-        partial_committee = tuple(partial_committee)
-    committee_load_pairs = [(partial_committee, load)]
-    committees = set()
-    detailed_info = {"committee_load_pairs": {}}
 
-    while committee_load_pairs:
-        committee, load = committee_load_pairs.pop()
+    def tied_successors(committee, load, round_algorithm=algorithm):
+        # `round_algorithm` differs from `algorithm` if near ties of "auto-exact" are resolved
+        round_division = division if round_algorithm == algorithm else exact_division
         approvers_load = {}
         for cand in profile.candidates:
-            approvers_load[cand] = sum(
-                voter.weight * load[v] for v, voter in enumerate(profile) if cand in voter.approved
-            )
+            approvers_load[cand] = sum(weight * load[v] for v, weight in zip(*approvers[cand]))
         new_maxload = [
-            division(approvers_load[cand] + 1, approvers_weight[cand])
+            round_division(approvers_load[cand] + 1, approvers_weight[cand])
             if approvers_weight[cand] > 0
             else committeesize + 1
             for cand in profile.candidates
@@ -2968,38 +3808,53 @@ def _seqphragmen_irresolute(
         for cand in profile.candidates:
             if cand in committee:
                 new_maxload[cand] = committeesize + 2  # that's larger than any possible value
+        if round_algorithm == "auto-exact":
+            _check_near_ties(new_maxload, min(new_maxload))
         # compute new loads
-        new_committee_load_pairs = []
+        successors = []
         for cand in profile.candidates:
-            if algorithm == "float-fractions":
+            if round_algorithm in ["float-fractions", "auto-exact"]:
                 select_cand = misc.isclose(new_maxload[cand], min(new_maxload))
             else:
                 select_cand = new_maxload[cand] <= min(new_maxload)
 
             if select_cand:
-                new_load = [0] * len(profile)
-                for v, voter in enumerate(profile):
-                    if cand in voter.approved:
-                        new_load[v] = new_maxload[cand]
-                    else:
-                        new_load[v] = load[v]
-                new_committee = committee + (cand,)
-
-                if len(new_committee) == committeesize:
-                    new_committee = tuple(sorted(new_committee))
-                    committees.add(new_committee)  # remove duplicate committees
-                    detailed_info["committee_load_pairs"][new_committee] = new_load
-                    if (
-                        max_num_of_committees is not None
-                        and len(committees) == max_num_of_committees
-                    ):
-                        # sufficiently many winning committees found
-                        return sorted_committees(committees), detailed_info
-                else:
-                    # partial committee
-                    new_committee_load_pairs.append((new_committee, new_load))
-        # add new committee/load pairs in reversed order, so that tiebreaking is correct
-        committee_load_pairs += reversed(new_committee_load_pairs)
+                new_load = [load[v] for v in range(len(profile))]
+                for v in approvers[cand][0]:
+                    new_load[v] = new_maxload[cand]
+                successors.append((cand, new_load))
+        return successors
+
+    if algorithm == "auto-exact":
+        # near ties are resolved with exact loads in the round in which they occur
+        exact_division = mpq if mpq else Fraction
+
+        def exact_start_state():
+            if not _is_rational(voter.weight for voter in profile):
+                return None
+            if _is_rational(load[v] for v in range(len(profile))):
+                return [load[v] for v in range(len(profile))]
+            return exact_start_load() if exact_start_load else None
+
+        tied_successors, _ = _auto_exact_tied_successors(
+            tied_successors,
+            partial_committee,
+            exact_start_state,
+            to_float=lambda new_load: [float(value) for value in new_load],
+        )
+
+    # loads depend on the order in which candidates are added
+    committees = set()
+    detailed_info = {"committee_load_pairs": {}}
+    for committee, load in _parallel_universes(
+        committeesize, tied_successors, partial_committee, load, canonical_state=tuple
+    ):
+        committee = tuple(sorted(committee))
+        committees.add(committee)  # remove duplicate committees
+        detailed_info["committee_load_pairs"][committee] = load
+        if max_num_of_committees is not None and len(committees) == max_num_of_committees:
+            # sufficiently many winning committees found
+            break
 
     return sorted_committees(committees), detailed_info
 
@@ -3036,7 +3891,7 @@ def compute_rule_x(
             .. doctest::
 
                 >>> Rule("equal-shares").algorithms
-                ('float-fractions', 'gmpy2-fractions', 'standard-fractions')
+                ('float-fractions', 'auto-exact', 'gmpy2-fractions', 'standard-fractions')
 
         resolute : bool, optional
             Return only one winning committee.
@@ -3108,7 +3963,7 @@ def compute_equal_shares(
             .. doctest::
 
                 >>> Rule("equal-shares").algorithms
-                ('float-fractions', 'gmpy2-fractions', 'standard-fractions')
+                ('float-fractions', 'auto-exact', 'gmpy2-fractions', 'standard-fractions')
 
         resolute : bool, optional
             Return only one winning committee.
@@ -3165,13 +4020,15 @@ def compute_equal_shares(
     )
 
     if completion == "increment":
-        committees, detailed_info = _equal_shares_algorithm_with_increment_completion(
+        committees, detailed_info = _auto_exact(
+            _equal_shares_algorithm_with_increment_completion,
             profile=profile,
             committeesize=committeesize,
             algorithm=algorithm,
         )
     else:
-        committees, detailed_info = _equal_shares_algorithm(
+        committees, detailed_info = _auto_exact(
+            _equal_shares_algorithm,
             profile=profile,
             committeesize=committeesize,
             algorithm=algorithm,
@@ -3296,42 +4153,16 @@ def _equal_shares_algorithm(
 ):
     """Algorithm for the Method of Equal Shares."""
 
-    def _equal_shares_get_min_q(profile, budget, cand, division):
-        rich = {v for v, voter in enumerate(profile) if cand in voter.approved}
-        poor = set()
-        while len(rich) > 0:
-            poor_budget = sum(budget[v] for v in poor)
-            _q = division(1 - poor_budget, sum(profile[v].weight for v in rich))
-            if algorithm == "float-fractions":
-                # due to float imprecision, values very close to `q` count as `q`
-                new_poor = {
-                    v
-                    for v in rich
-                    if budget[v] < _q * profile[v].weight
-                    and not misc.isclose(budget[v], _q * profile[v].weight)
-                }
-            else:
-                new_poor = {v for v in rich if budget[v] < _q * profile[v].weight}
-            if len(new_poor) == 0:
-                return _q
-            rich -= new_poor
-            poor.update(new_poor)
-        return None  # not sufficient budget available
-
-    def find_minimum_dict_entries(dictx):
-        if algorithm == "float-fractions":
-            min_entries = [
-                cand for cand in dictx.keys() if misc.isclose(dictx[cand], min(dictx.values()))
-            ]
-        else:
-            min_entries = [cand for cand in dictx.keys() if dictx[cand] == min(dictx.values())]
-        return min_entries
-
     def phragmen_phase(_committee, _budget):
         # translate budget to loads
         start_load = [-_budget[v] / profile[v].weight for v in range(len(profile))]
         detailed_info["phragmen_start_load"] = list(start_load)  # make a copy
 
+        def exact_start_load():
+            # for the algorithm "auto-exact": only computed if seq-Phragmen encounters a near tie
+            exact_budget = exact_state(tuple(_committee))[0]
+            return [-exact_budget[v] / profile[v].weight for v in range(len(profile))]
+
         if resolute:
             committees, detailed_info_phragmen = _seqphragmen_resolute(
                 profile=profile,
@@ -3339,6 +4170,7 @@ def _equal_shares_algorithm(
                 algorithm=algorithm,
                 partial_committee=list(_committee),
                 start_load=start_load,
+                exact_start_load=exact_start_load if algorithm == "auto-exact" else None,
             )
         else:
             committees, detailed_info_phragmen = _seqphragmen_irresolute(
@@ -3351,6 +4183,7 @@ def _equal_shares_algorithm(
                 #       already contained in `winning_committees` - so we need more
                 partial_committee=list(_committee),
                 start_load=start_load,
+                exact_start_load=exact_start_load if algorithm == "auto-exact" else None,
             )
         winning_committees.update([tuple(sorted(committee)) for committee in committees])
         detailed_info["phragmen_phase"] = detailed_info_phragmen
@@ -3385,7 +4218,7 @@ def _equal_shares_algorithm(
         else:
             raise RuntimeError("Critical bug. This for-loop should terminate earlier.")
 
-    if algorithm == "float-fractions":
+    if algorithm in ["float-fractions", "auto-exact"]:
         division = lambda x, y: x / y  # standard float division
     elif algorithm == "standard-fractions":
         division = Fraction  # using Python built-in fractions
@@ -3404,11 +4237,11 @@ def _equal_shares_algorithm(
     if per_voter_budget:
         start_budget = {vi: voter.weight * per_voter_budget for vi, voter in enumerate(profile)}
     else:
+        total_weight = profile.total_weight()
         start_budget = {
-            vi: division(voter.weight * committeesize, profile.total_weight())
+            vi: division(voter.weight * committeesize, total_weight)
             for vi, voter in enumerate(profile)
         }
-    committee_budget_pairs = [(tuple(), start_budget)]
     winning_committees = set()
     detailed_info = {
         "next_cand": [],
@@ -3419,66 +4252,98 @@ def _equal_shares_algorithm(
         "phragmen_start_load": None,
     }
 
-    while committee_budget_pairs:
-        committee, budget = committee_budget_pairs.pop()
-
-        available_candidates = [cand for cand in profile.candidates if cand not in committee]
-        min_q = {}
-        for cand in available_candidates:
-            q = _equal_shares_get_min_q(profile, budget, cand, division)
-            if q is not None:
-                min_q[cand] = q
-
-        if len(min_q) > 0:  # one or more candidates are affordable
-            # choose those candidates that require the smallest budget
-            tied_cands = find_minimum_dict_entries(min_q)
-
-            new_committee_budget_pairs = []
-            for next_cand in sorted(tied_cands):
-                new_budget = dict(budget)
-                for v, voter in enumerate(profile):
-                    if next_cand in voter.approved:
-                        new_budget[v] -= min(budget[v], min_q[next_cand] * voter.weight)
-
-                new_committee = committee + (next_cand,)
-
-                if resolute:
-                    detailed_info["next_cand"].append(next_cand)
-                    detailed_info["tied_cands"].append(tied_cands)
-                    detailed_info["cost"].append(min(min_q.values()))
-                    detailed_info["budget"].append(new_budget)
-
-                if len(new_committee) == committeesize:
-                    new_committee = tuple(sorted(new_committee))
-                    winning_committees.add(new_committee)  # remove duplicate committees
-                    if (
-                        max_num_of_committees is not None
-                        and len(winning_committees) == max_num_of_committees
-                    ):
-                        # sufficiently many winning committees found
-                        return sorted_committees(winning_committees), detailed_info
-                else:
-                    # partial committee
-                    new_committee_budget_pairs.append((new_committee, new_budget))
-
-                if resolute:
-                    break
+    def tied_successors(committee, state, round_algorithm=algorithm):
+        # `round_algorithm` differs from `algorithm` if near ties of "auto-exact" are resolved;
+        # a state also contains the tied candidates and the cost of the round that led to it
+        round_division = division if round_algorithm == algorithm else exact_division
+        budget, queue, _ = state
+        queue = list(queue)  # `queue` may be shared with other universes
+        tied_cands, min_q = _equal_shares_pop_cheapest_candidates(
+            profile, budget, queue, round_algorithm, round_division
+        )
+        if len(tied_cands) == 0:  # no affordable candidates remain
+            return []
+
+        successors = []
+        for next_cand in tied_cands:
+            new_budget = dict(budget)
+            for v, weight in zip(*profile.approvers[next_cand]):
+                new_budget[v] -= min(budget[v], min_q[next_cand] * weight)
+            new_queue = list(queue)
+            for cand in tied_cands:
+                if cand != next_cand:
+                    heapq.heappush(new_queue, (min_q[cand], cand))
+            round_info = (tied_cands, min(min_q.values()))
+            successors.append((next_cand, (new_budget, new_queue, round_info)))
+
+            if resolute:
+                break
+        return successors
+
+    def to_float(state):
+        budget, queue, (tied_cands, cost) = state
+        return (
+            {v: float(value) for v, value in budget.items()},
+            [(float(bound), cand) for bound, cand in queue],
+            (tied_cands, float(cost)),
+        )
 
-            # add new committee/budget pairs in reversed order, so that tiebreaking is correct
-            committee_budget_pairs += reversed(new_committee_budget_pairs)
-
-        else:  # no affordable candidates remain
-            if not completion or completion.lower == "none":
-                winning_committees.add(tuple(sorted(committee)))
-            elif completion == "seqphragmen":
-                # fill committee via seq-Phragmen
-                phragmen_phase(committee, budget)
-            elif completion == "av":
-                av_phase(committee)
+    # budgets depend on the order in which candidates are added
+    # priority queue with entries (lower bound on `q`, candidate)
+    start_queue = [(0, cand) for cand in profile.candidates]
+    successor_fct = tied_successors
+    if algorithm == "auto-exact":
+        # near ties are resolved with exact budgets in the round in which they occur
+        exact_division = mpq if mpq else Fraction
+
+        def exact_start_state():
+            if not _is_rational(voter.weight for voter in profile):
+                return None
+            if per_voter_budget:
+                exact_start_budget = {
+                    vi: voter.weight * exact_division(per_voter_budget)
+                    for vi, voter in enumerate(profile)
+                }
             else:
-                raise ValueError(f"completion argument {completion} unknown.")
+                exact_start_budget = {
+                    vi: exact_division(voter.weight * committeesize, total_weight)
+                    for vi, voter in enumerate(profile)
+                }
+            return exact_start_budget, start_queue, None
+
+        successor_fct, exact_state = _auto_exact_tied_successors(
+            tied_successors, (), exact_start_state, to_float
+        )
+
+    def recorded_tied_successors(committee, state):
+        successors = successor_fct(committee, state)
+        if resolute and successors:
+            next_cand, (new_budget, _, (tied_cands, cost)) = successors[0]
+            detailed_info["next_cand"].append(next_cand)
+            detailed_info["tied_cands"].append(tied_cands)
+            detailed_info["cost"].append(cost)
+            detailed_info["budget"].append(new_budget)
+        return successors
+
+    for committee, (budget, *_) in _parallel_universes(
+        committeesize,
+        recorded_tied_successors,
+        start_state=(start_budget, start_queue, None),
+        canonical_state=lambda state: tuple(state[0].values()),
+    ):
+        if len(committee) == committeesize or not completion or completion.lower == "none":
+            # (if no affordable candidates remain, the committee may be completed)
+            winning_committees.add(tuple(sorted(committee)))  # remove duplicate committees
+        elif completion == "seqphragmen":
+            # fill committee via seq-Phragmen
+            phragmen_phase(committee, budget)
+        elif completion == "av":
+            av_phase(committee)
+        else:
+            raise ValueError(f"completion argument {completion} unknown.")
 
         if max_num_of_committees is not None and len(winning_committees) >= max_num_of_committees:
+            # sufficiently many winning committees found
             winning_committees = sorted_committees(winning_committees)[:max_num_of_committees]
             break
 
@@ -3503,27 +4368,225 @@ def _equal_shares_algorithm_with_increment_completion(
         detailed_info = {"too_few_approved_candidates": True}
         return committees, detailed_info
 
-    for increment_committeesize in range(
-        committeesize, math.ceil(committeesize * profile.total_weight() + 1)
-    ):
-        committees, detailed_info = _equal_shares_algorithm(
-            profile,
-            committeesize,
-            algorithm,
-            resolute=True,
-            completion=None,
-            per_voter_budget=Fraction(increment_committeesize, profile.total_weight()),
+    total_weight = profile.total_weight()
+    increment_committeesize = committeesize
+    while increment_committeesize < math.ceil(committeesize * total_weight + 1):
+        per_voter_budget = Fraction(increment_committeesize, total_weight)
+        committee, next_budget = _equal_shares_next_budget(
+            profile, committeesize, per_voter_budget
         )
-        detailed_info["increment_committeesize"] = increment_committeesize
-        committees = [comm for comm in committees if len(comm) == committeesize]
-        if any(len(comm) > committeesize for comm in committees):
-            raise RuntimeError("Critical bug. This condition should not be satisfiable.")
-        if committees:
-            return committees, detailed_info
+        if len(committee) == committeesize:
+            committees, detailed_info = _equal_shares_algorithm(
+                profile,
+                committeesize,
+                algorithm,
+                resolute=True,
+                completion=None,
+                per_voter_budget=per_voter_budget,
+            )
+            detailed_info["increment_committeesize"] = increment_committeesize
+            committees = [comm for comm in committees if len(comm) == committeesize]
+            if any(len(comm) > committeesize for comm in committees):
+                raise RuntimeError("Critical bug. This condition should not be satisfiable.")
+            if committees:
+                return committees, detailed_info
+            # (possible for algorithm="float-fractions" due to float imprecision)
+            next_budget = None
+        if next_budget is None:
+            increment_committeesize += 1
+        else:
+            # the committee is the same for all budgets smaller than `next_budget`
+            increment_committeesize = max(
+                increment_committeesize + 1, int(math.ceil(next_budget * total_weight))
+            )
+    raise RuntimeError(
+        "Critical bug. This LOC should not be reachable; while-loop should terminate earlier."
+    )
+
+
+def _equal_shares_next_budget(profile, committeesize, per_voter_budget):
+    """
+    Compute the Method of Equal Shares (without completion) together with a range of budgets.
+
+    The committee is computed for `per_voter_budget` (resolute, in exact arithmetic). All
+    budgets and costs are affine functions of the per-voter budget. Each comparison the
+    computation relies on (such as which candidate is cheapest) remains true up to some
+    per-voter budget; the smallest of these budgets is returned.
+
+    Parameters
+    ----------
+        profile : abcvoting.preferences.Profile
+            A profile.
+
+        committeesize : int
+            The desired committee size.
+
+        per_voter_budget : Fraction
+            The budget per unit of voter weight.
+
+    Returns
+    -------
+        tuple
+            A pair `(committee, next_budget)`: the Method of Equal Shares without completion
+            returns `committee` for all per-voter budgets at least `per_voter_budget` and
+            smaller than `next_budget` (or `next_budget` is None if there is no bound).
+    """
+    division = mpq if mpq else Fraction
+    base = division(per_voter_budget)
+    weights = [division(voter.weight) for voter in profile]
+    # the budget of voter `v` is `offset[v] + slope[v] * b` for per-voter budget `b`
+    offset = [0] * len(profile)
+    slope = list(weights)
+    next_budget = None
+
+    def restrict(value, value_slope):
+        # the affine function `value` (at `base`) with slope `value_slope` has to be >= 0
+        nonlocal next_budget
+        if value_slope < 0:
+            bound = base + value / -value_slope
+            if next_budget is None or bound < next_budget:
+                next_budget = bound
+
+    def get_min_q(cand):
+        # returns `q` as triple (value at `base`, offset, slope) or None if unaffordable
+        voters = profile.approvers[cand][0]
+        budget = {v: offset[v] + slope[v] * base for v in voters}
+        approvers = sorted(voters, key=lambda v: budget[v] / weights[v])
+        poor_offset = poor_slope = 0
+        rich_weight = sum(weights[v] for v in voters)
+        for num_poor, v in enumerate(approvers):
+            q = (1 - poor_offset - poor_slope * base) / rich_weight
+            if budget[v] >= q * weights[v]:
+                break
+            poor_offset += offset[v]
+            poor_slope += slope[v]
+            rich_weight -= weights[v]
+        else:
+            # the total budget of approvers remains smaller than 1
+            restrict(1 - poor_offset - poor_slope * base, -poor_slope)
+            return None
+        q_slope = -poor_slope / rich_weight
+        for i, v in enumerate(approvers):
+            # poor voters remain poor (and rich voters rich)
+            sign = -1 if i < num_poor else 1
+            restrict(sign * (budget[v] - q * weights[v]), sign * (slope[v] - q_slope * weights[v]))
+        return q, (1 - poor_offset) / rich_weight, q_slope
+
+    # priority queue with entries (lower bound on `q` at `base`, candidate);
+    # `bound_slope[cand]` is the slope of this lower bound
+    queue = [(0, cand) for cand in profile.candidates]
+    bound_slope = {}
+    committee = []
+    while len(committee) < committeesize:
+        min_q = {}
+        next_cand = None
+        while queue and (next_cand is None or queue[0][0] <= min_q[next_cand][0]):
+            _, cand = heapq.heappop(queue)
+            q = get_min_q(cand)
+            if q is None:
+                continue
+            min_q[cand] = q
+            if next_cand is None or (q[0], cand) < (min_q[next_cand][0], next_cand):
+                next_cand = cand
+        if next_cand is None:
+            break  # no affordable candidates remain
+        q, q_offset, q_slope = min_q.pop(next_cand)
+        # all other candidates remain more expensive
+        for bound, cand in queue:
+            restrict(bound - q, bound_slope[cand] - q_slope)
+        for cand, (cand_q, _, cand_slope) in min_q.items():
+            restrict(cand_q - q, cand_slope - q_slope)
+            heapq.heappush(queue, (cand_q, cand))
+            bound_slope[cand] = cand_slope
+        for v, weight in zip(*profile.approvers[next_cand]):
+            if offset[v] + slope[v] * base < q * weight:
+                offset[v] = slope[v] = 0
+            else:
+                offset[v] -= q_offset * weight
+                slope[v] -= q_slope * weight
+        committee.append(next_cand)
+    return committee, next_budget
+
+
+def _equal_shares_get_min_q(profile, budget, cand, algorithm, division):
+    """
+    Return the smallest `q` such that the approvers of `cand` can pay for `cand`.
+
+    Each approver pays `q` times their weight or their whole budget (if it is smaller). Returns
+    None if the approvers cannot afford `cand`.
+    """
+    voters, weights = profile.approvers[cand]
+    if algorithm == "auto-exact" and _is_near(sum(budget[v] for v in voters), 1):
+        # it is not clear whether `cand` is affordable
+        # (otherwise, values close to `q` can count as `q` without changing `q`)
+        raise _NearTie
+    # voters that can pay less (relative to their weight) come first
+    approvers = sorted(zip(voters, weights), key=lambda vw: division(budget[vw[0]], vw[1]))
+    poor_budget = 0
+    rich_weight = sum(weights)
+    for v, weight in approvers:
+        _q = division(1 - poor_budget, rich_weight)
+        if algorithm in ["float-fractions", "auto-exact"]:
+            # due to float imprecision, values very close to `q` count as `q`
+            if budget[v] >= _q * weight or misc.isclose(budget[v], _q * weight):
+                return _q  # `v` and all later voters can pay `q` (times their weight)
+        elif budget[v] >= _q * weight:
+            return _q
+        # `v` cannot pay `q` and thus spends its whole budget
+        poor_budget += budget[v]
+        rich_weight -= weight
+    return None  # not sufficient budget available
+
+
+def _equal_shares_find_minimum_dict_entries(dictx, algorithm):
+    min_value = min(dictx.values())
+    if algorithm == "auto-exact":
+        _check_near_ties(dictx.values(), min_value)
+    if algorithm in ["float-fractions", "auto-exact"]:
+        min_entries = [cand for cand, value in dictx.items() if misc.isclose(value, min_value)]
     else:
-        raise RuntimeError(
-            "Critical bug. This LOC should not be reachable; for-loop should terminate earlier."
-        )
+        min_entries = [cand for cand, value in dictx.items() if value == min_value]
+    return sorted(min_entries)
+
+
+def _equal_shares_may_be_tied(value, min_value, algorithm):
+    if algorithm == "auto-exact":
+        return value <= min_value or _is_near(value, min_value)
+    if algorithm == "float-fractions":
+        return value <= min_value or misc.isclose(value, min_value)
+    return value <= min_value
+
+
+def _equal_shares_pop_cheapest_candidates(profile, budget, queue, algorithm, division):
+    """
+    Pop the cheapest candidates from the priority queue `queue`.
+
+    The entries of `queue` are pairs `(lower bound on q, candidate)`. Returns the (sorted) list of
+    candidates that require the smallest `q` and a dictionary with the values `q` of all
+    re-evaluated candidates; all other re-evaluated candidates are pushed back to `queue`.
+    """
+    # The value `q` of a candidate never decreases when budgets are spent. Hence, outdated
+    # values in `queue` are lower bounds and only candidates at the top are re-evaluated.
+    min_q = {}
+    min_value = None
+    while queue and (
+        min_value is None or _equal_shares_may_be_tied(queue[0][0], min_value, algorithm)
+    ):
+        _, cand = heapq.heappop(queue)
+        q = _equal_shares_get_min_q(profile, budget, cand, algorithm, division)
+        if q is None:
+            continue  # unaffordable candidates remain unaffordable
+        min_q[cand] = q
+        if min_value is None or q < min_value:
+            min_value = q
+    if len(min_q) == 0:
+        return [], None
+    # choose those candidates that require the smallest budget
+    tied_cands = _equal_shares_find_minimum_dict_entries(min_q, algorithm)
+    for cand, q in min_q.items():
+        if cand not in tied_cands:
+            heapq.heappush(queue, (q, cand))
+    return tied_cands, min_q
 
 
 def compute_minimaxphragmen(
@@ -3920,35 +4983,23 @@ def _maximin_support_irresolute(scorefct, profile, committeesize, max_num_of_com
     Consider all possible ways to break ties between candidates
     (aka parallel universe tiebreaking)
     """
-    # build committees starting with the empty set
-    partial_committees = [()]
-    winning_committees = set()
-
-    while partial_committees:
-        new_partial_committees = []
-        committee = partial_committees.pop()
+    def tied_successors(committee, _):
         additional_score_cand = scorefct(profile, committee)
         remaining_cands = set(profile.candidates) - set(committee)
         highest_score = max(additional_score_cand[cand] for cand in remaining_cands)
-        for cand in remaining_cands:
-            if additional_score_cand[cand] >= highest_score - 1e-7:  # ILP float accuracy
-                new_committee = committee + (cand,)
-
-                if len(new_committee) == committeesize:
-                    new_committee = tuple(sorted(new_committee))
-                    winning_committees.add(new_committee)  # remove duplicate committees
-                    if (
-                        max_num_of_committees is not None
-                        and len(winning_committees) == max_num_of_committees
-                    ):
-                        # sufficiently many winning committees found
-                        detailed_info = {}
-                        return sorted_committees(winning_committees), detailed_info
-                else:
-                    # partial committee
-                    new_partial_committees.append(new_committee)
-        # add new partial committees in reversed order, so that tiebreaking is correct
-        partial_committees += reversed(new_partial_committees)
+        return [
+            (cand, None)
+            for cand in remaining_cands
+            if additional_score_cand[cand] >= highest_score - 1e-7  # ILP float accuracy
+        ]
+
+    # the scores are determined by the set of candidates in the committee
+    winning_committees = set()
+    for committee, _ in _parallel_universes(committeesize, tied_successors):
+        winning_committees.add(tuple(sorted(committee)))  # remove duplicate committees
+        if max_num_of_committees is not None and len(winning_committees) == max_num_of_committees:
+            # sufficiently many winning committees found
+            break
 
     detailed_info = {}
     return sorted_committees(winning_committees), detailed_info
@@ -3989,7 +5040,7 @@ def compute_phragmen_enestroem(
             .. doctest::
 
                 >>> Rule("phragmen-enestroem").algorithms
-                ('float-fractions', 'gmpy2-fractions', 'standard-fractions')
+                ('float-fractions', 'auto-exact', 'gmpy2-fractions', 'standard-fractions')
 
         resolute : bool, optional
             Return only one winning committee.
@@ -4021,7 +5072,8 @@ def compute_phragmen_enestroem(
         max_num_of_committees=max_num_of_committees,
     )
 
-    committees, detailed_info = _phragmen_enestroem_algorithm(
+    committees, detailed_info = _auto_exact(
+        _phragmen_enestroem_algorithm,
         profile=profile,
         committeesize=committeesize,
         algorithm=algorithm,
@@ -4049,7 +5101,7 @@ def _phragmen_enestroem_algorithm(
     """
     Algorithm computing Phragmen-Enestroem.
     """
-    if algorithm == "float-fractions":
+    if algorithm in ["float-fractions", "auto-exact"]:
         division = lambda x, y: x / y  # standard float division
     elif algorithm == "standard-fractions":
         division = Fraction  # using Python built-in fractions
@@ -4068,11 +5120,13 @@ def _phragmen_enestroem_algorithm(
     initial_voter_budget = [voter.weight for voter in profile]
     # price for adding a candidate to the committee
     price = division(sum(initial_voter_budget), committeesize)
-    committee_budget_pairs = [(tuple(), initial_voter_budget)]
-    committees = set()
 
-    while committee_budget_pairs:
-        committee, budget = committee_budget_pairs.pop()
+    def tied_successors(committee, budget, round_algorithm=algorithm):
+        # `round_algorithm` differs from `algorithm` if near ties of "auto-exact" are resolved
+        if round_algorithm == algorithm:
+            round_division, round_price = division, price
+        else:
+            round_division, round_price = exact_division, exact_price
         available_candidates = [cand for cand in profile.candidates if cand not in committee]
         support = {cand: 0 for cand in available_candidates}
         for i, voter in enumerate(profile):
@@ -4083,7 +5137,11 @@ def _phragmen_enestroem_algorithm(
                 if cand in available_candidates:
                     support[cand] += voting_power
         max_support = max(support.values())
-        if algorithm == "float-fractions":
+        if round_algorithm == "auto-exact":
+            _check_near_ties(support.values(), max_support)
+            if _is_near(max_support, round_price):
+                raise _NearTie  # it is not clear whether supporters can afford it
+        if round_algorithm in ["float-fractions", "auto-exact"]:
             tied_cands = [
                 cand for cand, supp in support.items() if misc.isclose(supp, max_support)
             ]
@@ -4092,16 +5150,39 @@ def _phragmen_enestroem_algorithm(
         if not tied_cands:
             raise RuntimeError("_phragmen_enestroem_algorithm: no candidate with max support (??)")
 
-        new_committee_budget_pairs = []
+        successors = []
         for cand in tied_cands:
             new_budget = list(budget)  # copy of budget
-            if max_support > price:  # supporters can afford it
-                multiplier = division(max_support - price, max_support)
+            if max_support > round_price:  # supporters can afford it
+                multiplier = round_division(max_support - round_price, max_support)
             else:  # supporters can't afford it, set budget to 0
                 multiplier = 0
             for i, voter in enumerate(profile):
                 if cand in voter.approved:
                     new_budget[i] *= multiplier
+            successors.append((cand, new_budget))
+        return successors
+
+    if algorithm == "auto-exact":
+        # near ties are resolved with exact budgets in the round in which they occur
+        exact_division = mpq if mpq else Fraction
+        exact_price = None
+        if _is_rational(initial_voter_budget):
+            exact_price = exact_division(sum(initial_voter_budget), committeesize)
+        tied_successors, _ = _auto_exact_tied_successors(
+            tied_successors,
+            (),
+            lambda: initial_voter_budget if exact_price is not None else None,
+            to_float=lambda new_budget: [float(value) for value in new_budget],
+        )
+
+    committee_budget_pairs = [(tuple(), initial_voter_budget)]
+    committees = set()
+
+    while committee_budget_pairs:
+        committee, budget = committee_budget_pairs.pop()
+        new_committee_budget_pairs = []
+        for cand, new_budget in tied_successors(committee, budget):
             new_committee = committee + (cand,)
 
             if len(new_committee) == committeesize:
@@ -4151,7 +5232,7 @@ def compute_consensus_rule(
             .. doctest::
 
                 >>> Rule("consensus-rule").algorithms
-                ('float-fractions', 'gmpy2-fractions', 'standard-fractions')
+                ('float-fractions', 'auto-exact', 'gmpy2-fractions', 'standard-fractions')
 
         resolute : bool, optional
             Return only one winning committee.
@@ -4183,7 +5264,8 @@ def compute_consensus_rule(
         max_num_of_committees=max_num_of_committees,
     )
 
-    committees, detailed_info = _consensus_rule_algorithm(
+    committees, detailed_info = _auto_exact(
+        _consensus_rule_algorithm,
         profile=profile,
         committeesize=committeesize,
         algorithm=algorithm,
@@ -4209,7 +5291,7 @@ def _consensus_rule_algorithm(profile, committeesize, algorithm, resolute, max_n
     """
     Algorithm for computing the consensus rule.
     """
-    if algorithm == "float-fractions":
+    if algorithm in ["float-fractions", "auto-exact"]:
         division = lambda x, y: x / y  # standard float division
     elif algorithm == "standard-fractions":
         division = Fraction  # using Python built-in fractions
@@ -4225,27 +5307,29 @@ def _consensus_rule_algorithm(profile, committeesize, algorithm, resolute, max_n
     if resolute:
         max_num_of_committees = 1  # same algorithm for resolute==True and resolute==False
 
-    initial_voter_budget = [0] * len(profile)
-    committee_budget_pairs = [(tuple(), initial_voter_budget)]
-    committees = set()
-
-    while committee_budget_pairs:
-        committee, budget = committee_budget_pairs.pop()
-
-        for i, _ in enumerate(profile):
-            budget[i] += profile[i].weight  # weight is 1 by default
+    def tied_successors(committee, budget, round_algorithm=algorithm):
+        # `round_algorithm` differs from `algorithm` if near ties of "auto-exact" are resolved
+        round_division = division if round_algorithm == algorithm else exact_division
+        # weight is 1 by default
+        budget = [budget[i] + voter.weight for i, voter in enumerate(profile)]
         available_candidates = [cand for cand in profile.candidates if cand not in committee]
         support = {cand: 0 for cand in available_candidates}
         supporters = {cand: [] for cand in available_candidates}
         for i, voter in enumerate(profile):
-            if (budget[i] <= 0) or (algorithm == "float-fractions" and misc.isclose(budget[i], 0)):
+            if round_algorithm == "auto-exact" and _is_near(budget[i], 0):
+                raise _NearTie  # it is not clear whether the budget is positive
+            if (budget[i] <= 0) or (
+                round_algorithm == "float-fractions" and misc.isclose(budget[i], 0)
+            ):
                 continue
             for cand in voter.approved:
                 if cand in available_candidates:
                     support[cand] += budget[i]
                     supporters[cand].append(i)
         max_support = max(support.values())
-        if algorithm == "float-fractions":
+        if round_algorithm == "auto-exact":
+            _check_near_ties(support.values(), max_support)
+        if round_algorithm in ["float-fractions", "auto-exact"]:
             tied_cands = [
                 cand for cand, supp in support.items() if misc.isclose(supp, max_support)
             ]
@@ -4254,13 +5338,36 @@ def _consensus_rule_algorithm(profile, committeesize, algorithm, resolute, max_n
         if not tied_cands:
             raise RuntimeError("_consensus_rule_algorithm: no candidate with max support (??)")
 
-        new_committee_budget_pairs = []
+        successors = []
         for cand in tied_cands:
             new_budget = list(budget)  # copy of budget
             for i in supporters[cand]:
-                new_budget[i] -= profile[i].weight * division(
+                new_budget[i] -= profile[i].weight * round_division(
                     profile.total_weight(), sum(profile[vi].weight for vi in supporters[cand])
                 )
+            successors.append((cand, new_budget))
+        return successors
+
+    initial_voter_budget = [0] * len(profile)
+    if algorithm == "auto-exact":
+        # near ties are resolved with exact budgets in the round in which they occur
+        exact_division = mpq if mpq else Fraction
+        tied_successors, _ = _auto_exact_tied_successors(
+            tied_successors,
+            (),
+            lambda: (
+                initial_voter_budget if _is_rational(voter.weight for voter in profile) else None
+            ),
+            to_float=lambda new_budget: [float(value) for value in new_budget],
+        )
+
+    committee_budget_pairs = [(tuple(), initial_voter_budget)]
+    committees = set()
+
+    while committee_budget_pairs:
+        committee, budget = committee_budget_pairs.pop()
+        new_committee_budget_pairs = []
+        for cand, new_budget in tied_successors(committee, budget):
             new_committee = committee + (cand,)
 
             if len(new_committee) == committeesize:
@@ -4495,7 +5602,7 @@ def compute_eph(
             .. doctest::
 
                 >>> Rule("eph").algorithms
-                ('float-fractions', 'gmpy2-fractions', 'standard-fractions')
+                ('float-fractions', 'auto-exact', 'gmpy2-fractions', 'standard-fractions')
 
         resolute : bool, optional
             Return only one winning committee.
@@ -4523,7 +5630,8 @@ def compute_eph(
         profile, committeesize, algorithm, resolute, max_num_of_committees
     )
 
-    committees, detailed_info = _eph_algorithm(
+    committees, detailed_info = _auto_exact(
+        _eph_algorithm,
         rule_id=rule_id,
         profile=profile,
         algorithm=algorithm,
@@ -4548,7 +5656,7 @@ def compute_eph(
 def _eph_algorithm(rule_id, profile, algorithm, committeesize, resolute, max_num_of_committees):
     """Algorithm for computing the "E Pluribus Hugo" (EPH) voting rule."""
 
-    if algorithm == "float-fractions":
+    if algorithm in ["float-fractions", "auto-exact"]:
         division = lambda x, y: x / y  # standard float division
     elif algorithm == "standard-fractions":
         division = Fraction  # using Python built-in fractions
@@ -4564,17 +5672,38 @@ def _eph_algorithm(rule_id, profile, algorithm, committeesize, resolute, max_num
     if resolute:
         max_num_of_committees = 1  # same algorithm for resolute==True and resolute==False
 
-    remaining_candidates = set(profile.candidates)
-    while True:
+    def sdv_and_av_scores(remaining_candidates, division):
         sdv_score = {cand: 0 for cand in remaining_candidates}
         av_score = {cand: 0 for cand in remaining_candidates}
-        for voter in profile:
-            remaining_approved = [cand for cand in remaining_candidates if cand in voter.approved]
-            for cand in remaining_approved:
-                sdv_score[cand] += division(voter.weight, len(remaining_approved))
-                av_score[cand] += voter.weight
+        num_remaining_approved = (
+            profile.approval_matrix[:, sorted(remaining_candidates)].sum(axis=1).tolist()
+        )
+        for voter, num_approved in zip(profile, num_remaining_approved):
+            if num_approved == 0:
+                continue
+            share = division(voter.weight, num_approved)
+            for cand in voter.approved:
+                if cand in remaining_candidates:
+                    sdv_score[cand] += share
+                    av_score[cand] += voter.weight
+        return sdv_score, av_score
 
-        cutoff_sdv = sorted(sdv_score.values())[1]  # 2nd smallest value
+    remaining_candidates = set(profile.candidates)
+    while True:
+        sdv_score, av_score = sdv_and_av_scores(remaining_candidates, division)
+        sorted_sdv_scores = sorted(sdv_score.values())
+        cutoff_sdv = sorted_sdv_scores[1]  # 2nd smallest value
+        if (
+            algorithm == "auto-exact"
+            and len(sorted_sdv_scores) > 2
+            and _is_near(sorted_sdv_scores[2], cutoff_sdv)
+        ):
+            # it is not clear whether the 3rd smallest value equals the cutoff,
+            # hence this round is computed with exact fractions
+            if not _is_rational(voter.weight for voter in profile):
+                raise _NearTie
+            sdv_score, av_score = sdv_and_av_scores(remaining_candidates, mpq if mpq else Fraction)
+            cutoff_sdv = sorted(sdv_score.values())[1]
         elimination_cands = [
             cand
             for cand in remaining_candidates
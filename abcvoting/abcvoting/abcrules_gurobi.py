@@ -181,16 +181,17 @@ def _gurobi_thiele_methods(
         # objective: the Thiele score of the committee
         model.setObjective(
             gb.quicksum(
-                float(marginal_scorefct(x)) * voter.weight * utility[(voter, x)]
+                marginal_scores[x] * voter.weight * utility[(voter, x)]
                 for voter in profile
                 for x in range(1, max_in_committee[voter] + 1)
             ),
             gb.GRB.MAXIMIZE,
         )
 
-    marginal_scorefct = scores.get_marginal_scorefct(scorefct_id, committeesize)
+    score_table = scores.score_table(scorefct_id, committeesize)
+    marginal_scores = score_table.marginal_float.tolist()
 
-    score_values = [marginal_scorefct(x) for x in range(1, committeesize + 1)]
+    score_values = score_table.marginal[1:]
     if not all(
         first > second or first == second == 0
         for first, second in zip(score_values, score_values[1:])
@@ -224,7 +225,10 @@ def _gurobi_lexcc(profile, committeesize, resolute, max_num_of_committees):
 
         utility = {}
         iteration = len(satisfaction_constraints)
-        scorefcts = [scores.get_marginal_scorefct(f"atleast{i + 1}") for i in range(iteration + 1)]
+        scorefcts = [
+            scores.score_table(f"atleast{i + 1}", committeesize).marginal_float.tolist()
+            for i in range(iteration + 1)
+        ]
 
         max_in_committee = {}
         for i, voter in enumerate(profile):
@@ -247,7 +251,7 @@ def _gurobi_lexcc(profile, committeesize, resolute, max_num_of_committees):
         for prev_iteration in range(iteration):
             model.addConstr(
                 gb.quicksum(
-                    float(scorefcts[prev_iteration](x)) * voter.weight * utility[(voter, x)]
+                    scorefcts[prev_iteration][x] * voter.weight * utility[(voter, x)]
                     for voter in profile
                     for x in range(1, max_in_committee[voter] + 1)
                 )
@@ -257,7 +261,7 @@ def _gurobi_lexcc(profile, committeesize, resolute, max_num_of_committees):
         # objective: the at-least-y score of the committee in iteration y
         model.setObjective(
             gb.quicksum(
-                float(scorefcts[iteration](x)) * voter.weight * utility[(voter, x)]
+                scorefcts[iteration][x] * voter.weight * utility[(voter, x)]
                 for voter in profile
                 for x in range(1, max_in_committee[voter] + 1)
             ),
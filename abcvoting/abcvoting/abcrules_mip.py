@@ -204,15 +204,16 @@ def _mip_thiele_methods(
         # objective: the Thiele score of the committee
         model.objective = mip.maximize(
             mip.xsum(
-                float(marginal_scorefct(x)) * voter.weight * utility[(voter, x)]
+                marginal_scores[x] * voter.weight * utility[(voter, x)]
                 for voter in profile
                 for x in range(1, max_in_committee[voter] + 1)
             )
         )
 
-    marginal_scorefct = scores.get_marginal_scorefct(scorefct_id, committeesize)
+    score_table = scores.score_table(scorefct_id, committeesize)
+    marginal_scores = score_table.marginal_float.tolist()
 
-    score_values = [marginal_scorefct(x) for x in range(1, committeesize + 1)]
+    score_values = score_table.marginal[1:]
     if not all(
         first > second or first == second == 0
         for first, second in zip(score_values, score_values[1:])
@@ -3,19 +3,303 @@
 import functools
 import itertools
 import math
+import numpy as np
 from abcvoting.misc import sorted_committees
 from abcvoting import scores
 from abcvoting import misc
+from abcvoting import ilp_model
+from abcvoting import ilp_backends
 from abcvoting.output import output
 import pulp
-import js
-import json
 
 ACCURACY = 1e-8  # 1e-9 causes problems (some unit tests fail)
 CMP_ACCURACY = 10 * ACCURACY  # when comparing float numbers obtained from a MIP
 
 def mySolve(model):
-    return json.loads(js.runHighs(model.writeLP()))
+    return ilp_backends.solve_pulp_model(model)
+
+
+def _clone_classes(profile):
+    """
+    Partition the candidates into classes of clones, i.e., candidates with identical approvers.
+
+    Returns
+    -------
+        list of list of int
+            The classes of clones (each sorted), ordered by their smallest candidate.
+    """
+    classes = {}
+    for cand, (voter_indices, _) in enumerate(profile.approvers):
+        classes.setdefault(voter_indices, []).append(cand)
+    return list(classes.values())
+
+
+def _expand_clones(committee, clone_classes):
+    """
+    Yield all committees that are obtained from `committee` by replacing candidates with clones.
+
+    Each committee contains the same number of candidates from each class of clones as
+    `committee`; `committee` itself is yielded first.
+    """
+    # only classes that are partially contained in `committee` allow for different choices
+    choices = []
+    for clones in clone_classes:
+        multiplicity = len(committee & set(clones))
+        if 0 < multiplicity < len(clones):
+            choices.append((clones, multiplicity))
+    fixed = committee - {cand for clones, _ in choices for cand in clones}
+
+    def expand(index):
+        if index == len(choices):
+            yield set(fixed)
+            return
+        clones, multiplicity = choices[index]
+        for chosen in itertools.combinations(clones, multiplicity):
+            for rest in expand(index + 1):
+                yield rest | set(chosen)
+
+    yield from expand(0)
+
+
+class _PulpSession:
+    """
+    An ILP model that is kept alive across several solves.
+
+    Rules that solve a sequence of related ILPs (lexicographic optimization, enumeration of tied
+    committees) add constraints to the same model and replace its objective instead of
+    rebuilding the model in every iteration. The LP file passed to the solver is assembled from
+    cached parts: every constraint is serialized only once (see `lp_text()`).
+
+    The model contains a binary variable `in_committee[cand]` for each candidate and
+    symmetry-breaking constraints for clones (see `_optimize_rule_pulp()`).
+
+    Parameters
+    ----------
+    profile : abcvoting.preferences.Profile
+        approval sets of voters
+    name : str
+        name of the model
+    """
+
+    def __init__(self, profile, name):
+        self.model = pulp.LpProblem(name, pulp.LpMaximize)
+
+        # `in_committee` is a binary variable indicating whether `cand` is in the committee
+        self.in_committee = {}
+        for cand in profile.candidates:
+            self.in_committee[cand] = pulp.LpVariable(f"in_committee_{cand}", cat=pulp.LpBinary)
+
+        # symmetry breaking: a candidate can only be selected if its preceding clones are selected
+        self.clone_classes = _clone_classes(profile)
+        for clones in self.clone_classes:
+            for cand, next_cand in zip(clones, clones[1:]):
+                self.model += self.in_committee[cand] >= self.in_committee[next_cand]
+
+        # serialized constraints: constraint name -> (LP file line, variables in constraint)
+        self._serialized_constraints = {}
+        self._variables = {}  # variables in serialized constraints (by name)
+        # whether `lp_text()` has been compared with `self.model.writeLP()` (None if not yet)
+        self._lp_text_verified = None
+
+    def solve(self):
+        """
+        Solve the current model.
+
+        Returns
+        -------
+        status : str
+        objective_value : float
+            `None` if no solution was found
+        in_committee_values : list of float
+            the values of `in_committee[cand]` for all candidates, `None` if no solution was found
+        """
+        solution = ilp_backends.solve_pulp_model(self.model, lp_text=self.lp_text)
+        status = solution["Status"]
+        if status != "Optimal":
+            return status, None, None
+        columns = solution["Columns"]
+        in_committee_values = [
+            columns[self.in_committee[cand].name]["Primal"] for cand in sorted(self.in_committee)
+        ]
+        return status, solution["ObjectiveValue"], in_committee_values
+
+    def fix_objective(self, objective_value):
+        """Add a constraint that the (maximized) objective is at least `objective_value`."""
+        self.model += self.model.objective >= objective_value - CMP_ACCURACY
+
+    def candidate_bounds(self):
+        """Return the bounds `(lower, upper)` of `in_committee[cand]` for all candidates."""
+        return [
+            (self.in_committee[cand].lowBound, self.in_committee[cand].upBound)
+            for cand in sorted(self.in_committee)
+        ]
+
+    def fix_candidates(self, fixed, bounds):
+        """
+        Fix `in_committee[cand]` to `fixed[cand]` for all `cand` in `fixed`.
+
+        The bounds of all other candidates are set to `bounds` (see `candidate_bounds()`).
+        """
+        for cand, (lower, upper) in enumerate(bounds):
+            self.in_committee[cand].lowBound = fixed.get(cand, lower)
+            self.in_committee[cand].upBound = fixed.get(cand, upper)
+
+    def remove_constraint(self, constraint_name):
+        """Remove a constraint from the model (e.g., to replace it by a different one)."""
+        del self.model.constraints[constraint_name]
+        if self._serialized_constraints.pop(constraint_name, None) is not None:
+            self._variables = None  # has to be recomputed
+
+    def lp_text(self):
+        """
+        Return the model in LP file format (as `self.model.writeLP()`).
+
+        Only constraints that have been added since the last call are serialized. This relies on
+        internal functions of pulp, hence, `self.model.writeLP()` remains the reference: the
+        first LP file of each session is compared with it. If they differ (e.g., after a change in
+        pulp) or pulp lacks these functions, `self.model.writeLP()` is used for this session.
+        """
+        if self._lp_text_verified is not False:
+            try:
+                lp_text = self._cached_lp_text()
+            except AttributeError:  # internal functions of pulp are not available
+                self._lp_text_verified = False
+        if self._lp_text_verified is None:
+            reference = self.model.writeLP()
+            self._lp_text_verified = lp_text == reference
+            return reference
+        if self._lp_text_verified:
+            return lp_text
+        return self.model.writeLP()
+
+    def _cached_lp_text(self):
+        # assemble the LP file from cached serialized constraints
+        # (uses internal functions of `pulp.LpProblem.writeLP()`)
+        model = self.model
+        if self._variables is None:
+            self._variables = {}
+            for _, constraint_variables in self._serialized_constraints.values():
+                for variable in constraint_variables:
+                    self._variables[variable.name] = variable
+        for constraint_name, constraint in model.constraints.items():
+            if constraint_name in self._serialized_constraints:
+                continue
+            if not list(constraint.keys()):
+                # empty constraint: add a dummy variable that is fixed to zero (as pulp does)
+                dummy_var = model.get_dummyVar()
+                constraint += dummy_var
+                if "_dummy" not in self._serialized_constraints:
+                    self._serialized_constraints["_dummy"] = (
+                        (dummy_var == 0.0).asCplexLpConstraint("_dummy"),
+                        [dummy_var],
+                    )
+            constraint_variables = list(constraint.keys())
+            self._serialized_constraints[constraint_name] = (
+                constraint.asCplexLpConstraint(constraint_name),
+                constraint_variables,
+            )
+            for variable in constraint_variables:
+                self._variables[variable.name] = variable
+
+        was_none, objective_dummy_var = model.fixObjective()
+        objective_name = model.objective.name or "OBJ"
+        lines = [f"\\* {model.name} *\\\n", "Minimize\n" if model.sense == 1 else "Maximize\n"]
+        lines.append(model.objective.asCplexLpAffineExpression(objective_name, constant=0))
+        lines.append("Subject To\n")
+        # constraints are ordered by name (as in `pulp.LpProblem.writeLP()`)
+        for constraint_name in sorted(self._serialized_constraints):
+            lines.append(self._serialized_constraints[constraint_name][0])
+        variables = dict(self._variables)
+        for variable in model.objective.keys():
+            variables[variable.name] = variable
+        model.restoreObjective(was_none, objective_dummy_var)
+
+        variables = [variables[variable_name] for variable_name in sorted(variables)]
+        bounded = [
+            v
+            for v in variables
+            if not (v.isPositive() and v.cat == pulp.LpContinuous) and not v.isBinary()
+        ]
+        if bounded:
+            lines.append("Bounds\n")
+            lines.extend(f" {v.asCplexLpVariable()}\n" for v in bounded)
+        generals = [v for v in variables if v.cat == pulp.LpInteger and not v.isBinary()]
+        if generals:
+            lines.append("Generals\n")
+            lines.extend(f"{v.name}\n" for v in generals)
+        binaries = [v for v in variables if v.isBinary()]
+        if binaries:
+            lines.append("Binaries\n")
+            lines.extend(f"{v.name}\n" for v in binaries)
+        lines.append("End\n")
+        return "".join(lines)
+
+
+class _MatrixSession:
+    """
+    The counterpart of `_PulpSession` for models given by sparse matrices.
+
+    The model is an `ilp_model.MatrixModel` (no pulp objects are created), `in_committee` is an
+    array with the indices of the binary variables indicating whether `cand` is in the committee.
+
+    Parameters
+    ----------
+    profile : abcvoting.preferences.Profile
+        approval sets of voters
+    name : str
+        name of the model
+    """
+
+    def __init__(self, profile, name):
+        self.model = ilp_model.MatrixModel(name)
+        self.in_committee = self.model.add_variables(profile.num_cand, 0, 1, integer=True)
+
+        # symmetry breaking: a candidate can only be selected if its preceding clones are selected
+        self.clone_classes = _clone_classes(profile)
+        pairs = np.array(
+            [
+                (cand, next_cand)
+                for clones in self.clone_classes
+                for cand, next_cand in zip(clones, clones[1:])
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        self.model.add_constraints(
+            indptr=np.arange(0, 2 * len(pairs) + 1, 2),
+            indices=self.in_committee[pairs].ravel(),
+            data=np.tile([1.0, -1.0], len(pairs)),
+            lower=0,
+        )
+
+    def solve(self):
+        """Solve the current model (see `_PulpSession.solve()`)."""
+        status, objective_value, values = self.model.solve()
+        if status != "Optimal":
+            return status, None, None
+        return status, objective_value, values[self.in_committee].tolist()
+
+    def fix_objective(self, objective_value):
+        """Add a constraint that the (maximized) objective is at least `objective_value`."""
+        objective = self.model.arrays()["objective"]
+        (cols,) = np.nonzero(objective)
+        self.model.add_constraint(cols, objective[cols], lower=objective_value - CMP_ACCURACY)
+
+    def candidate_bounds(self):
+        """Return the bounds `(lower, upper)` of `in_committee[cand]` for all candidates."""
+        arrays = self.model.arrays()
+        return list(
+            zip(
+                arrays["col_lower"][self.in_committee].tolist(),
+                arrays["col_upper"][self.in_committee].tolist(),
+            )
+        )
+
+    def fix_candidates(self, fixed, bounds):
+        """Fix candidates (see `_PulpSession.fix_candidates()`)."""
+        lower, upper = (np.array(values, dtype=float) for values in zip(*bounds))
+        for cand, value in fixed.items():
+            lower[cand] = upper[cand] = value
+        self.model.set_bounds(self.in_committee, lower, upper)
 
 
 def _optimize_rule_pulp(
@@ -26,9 +310,20 @@ def _optimize_rule_pulp(
     max_num_of_committees,
     name="None",
     committeescorefct=None,
+    session=None,
 ):
     """Compute rules, which are given in the form of an optimization problem, using pulp.
 
+    Clones (candidates with identical approvers) are interchangeable for all rules in this module.
+    Therefore, the ILP only computes committees that contain the first candidates of each class of
+    clones (enforced by symmetry-breaking constraints), i.e., it optimizes over the number of
+    candidates per class. Tied committees that differ only in clones are generated
+    combinatorially instead of solving the ILP again.
+
+    If `resolute=False`, the remaining optimal committees are enumerated by branching over the
+    optimal face of the ILP (see `_optimal_face_committees()`). Committees are generated lazily,
+    i.e., the enumeration stops as soon as `max_num_of_committees` committees have been found.
+
     Parameters
     ----------
     set_opt_model_func : callable
@@ -45,6 +340,12 @@ def _optimize_rule_pulp(
         name of the model, used for error messages
     committeescorefct : callable
         a function used to compute the score of a committee
+    session : _PulpSession or _MatrixSession, optional
+        a model from a previous call; `set_opt_model_func` only has to add the new constraints and
+        set the objective. If `resolute=False`, the objective is fixed to its optimal value
+        afterwards (this constraint remains in the model). `set_opt_model_func` is called with
+        `session.model` and `session.in_committee`, i.e., for a `_MatrixSession` with an
+        `ilp_model.MatrixModel` and an array of column indices.
 
     Returns
     -------
@@ -57,21 +358,13 @@ def _optimize_rule_pulp(
 
     """
 
-    maxscore = None
-    committees = []
+    if session is None:
+        session = _PulpSession(profile, name)
+    set_opt_model_func(session.model, session.in_committee)
 
-    model = pulp.LpProblem(name, pulp.LpMinimize)
-
-    # `in_committee` is a binary variable indicating whether `cand` is in the committee
-    in_committee = {}
-    for cand in profile.candidates:
-        in_committee[cand] = pulp.LpVariable(f"in_committee_{cand}", cat=pulp.LpBinary)
-
-    set_opt_model_func(model, in_committee)
-
-    while True:
-        solution = mySolve(model)
-        status = solution["Status"]
+    def solve():
+        # solve the model, return the committee and its (exact if possible) objective value
+        status, ilp_objective_value, in_committee_values = session.solve()
 
         if status not in ["Optimal", "Infeasible"]:
             raise RuntimeError(
@@ -79,19 +372,12 @@ def _optimize_rule_pulp(
                 f"Warning: solutions may be incomplete or not optimal (model {name})."
             )
         if status != "Optimal":
-            if len(committees) == 0:
-                # we are in the first round of searching for committees
-                # and Pulp didn't find any
-                raise RuntimeError(f"Pulp found no solution (model {name})")
-            break
+            return None
 
-        value = {}
-        for v in solution["Columns"]:
-            value[v] = solution["Columns"][v]["Primal"]
         committee = {
             cand
             for cand in profile.candidates
-            if value[in_committee[cand].name] >= 0.9
+            if in_committee_values[cand] >= 0.9
             # this should be >= 1 - ACCURACY, but apparently it is not necessarily the case that
             # integers are only ACCURACY apart from either 0 or 1
         }
@@ -100,42 +386,137 @@ def _optimize_rule_pulp(
                 "_optimize_rule_pulp() produced a committee with "
                 f"fewer than `committeesize` members (model {name}).\n"
                 + "\n".join(
-                    f"({v.name}, {value[v.name]})" for v in model.variables() if "in_committee" in v.name
+                    f"(in_committee_{cand}, {in_committee_values[cand]})"
+                    for cand in profile.candidates
                 )
             )
 
         if committeescorefct is None:
-            objective_value = solution["ObjectiveValue"]  # numeric value from MIP
+            objective_value = ilp_objective_value  # numeric value from MIP
         else:
             objective_value = committeescorefct(profile, committee)  # exact value
-
-        if maxscore is None:
-            maxscore = objective_value
-        elif (committeescorefct is not None and objective_value > maxscore) or (
-            committeescorefct is None and objective_value > maxscore + CMP_ACCURACY
-        ):
+        return committee, objective_value, ilp_objective_value
+
+    result = solve()
+    if result is None:
+        raise RuntimeError(f"Pulp found no solution (model {name})")
+    committee, maxscore, ilp_maxscore = result
+    if resolute:
+        return [committee], maxscore
+
+    def solve_in_optimal_face():
+        result = solve()
+        if result is None:
+            return None
+        committee, objective_value, _ = result
+        if committeescorefct is None:
+            # the objective is fixed to its optimum; the objective values of the solver may
+            # deviate (within its feasibility tolerance) and are not compared
+            return committee, True
+        if objective_value > maxscore:
             raise RuntimeError(
                 "Pulp found a solution better than a previous optimum. This "
                 f"should not happen (previous optimal score: {maxscore}, "
-                f"new optimal score: {value(model.objective)}, model {name})."
+                f"new optimal score: {objective_value}, model {name})."
             )
-        elif (committeescorefct is not None and objective_value < maxscore) or (
-            committeescorefct is None and objective_value < maxscore - CMP_ACCURACY
-        ):
-            # no longer optimal
-            break
+        # with an exact `committeescorefct`, the fixed objective may admit slightly worse
+        # committees (within the numerical accuracy)
+        return committee, objective_value == maxscore
 
-        committees.append(committee)
+    # enumerate all optimal committees with the objective fixed to its optimum
+    session.fix_objective(ilp_maxscore)
+    committees = []
+    for committee in _optimal_face_committees(
+        session, committee, committeesize, solve_in_optimal_face
+    ):
+        for equivalent_committee in _expand_clones(committee, session.clone_classes):
+            committees.append(equivalent_committee)
+            if max_num_of_committees is not None and len(committees) >= max_num_of_committees:
+                return committees, maxscore
 
-        if resolute:
-            break
-        if max_num_of_committees is not None and len(committees) >= max_num_of_committees:
-            return committees, maxscore
+    return committees, maxscore
 
-        # find a new committee that has not been found yet by excluding previously found committees
-        model += pulp.lpSum(in_committee[cand] for cand in committee) <= committeesize - 1
 
-    return committees, maxscore
+def _optimal_face_committees(session, committee, committeesize, solve):
+    """
+    Enumerate the committees in the optimal face of an ILP (lazily).
+
+    The objective has to be fixed to its optimal value (see `_PulpSession.fix_objective()`). The
+    set of committees that are feasible in a subproblem (given by fixed candidates) and differ
+    from a known solution `committee` is partitioned into the subproblems in which the remaining
+    candidates agree with `committee` up to the i-th candidate and differ in the i-th candidate.
+    Each subproblem is solved once (with fixed variable bounds instead of additional constraints)
+    and partitioned further if it is feasible. Thus, every committee is found exactly once.
+    Subproblems that are infeasible because of the committee size or the symmetry-breaking
+    constraints for clones are skipped without calling the solver.
+
+    Parameters
+    ----------
+    session : _PulpSession or _MatrixSession
+        the model with fixed objective
+    committee : set
+        an optimal committee (the first committee that is yielded)
+    committeesize : int
+        number of chosen alternatives
+    solve : callable
+        solves the model with the current bounds and returns `None` if it is infeasible and
+        otherwise a pair `(committee, optimal)`, where `optimal` indicates whether the committee
+        is indeed optimal (and not only within the numerical accuracy of the fixed objective)
+
+    Yields
+    ------
+    set
+        the optimal committees (only one for each class of equivalent committees w.r.t. clones)
+    """
+    bounds = session.candidate_bounds()
+    free_cands = [cand for cand, (lower, upper) in enumerate(bounds) if lower != upper]
+    num_forced = sum(1 for lower, upper in bounds if lower == upper == 1)
+    predecessor = {
+        next_cand: cand
+        for clones in session.clone_classes
+        for cand, next_cand in zip(clones, clones[1:])
+    }
+
+    def is_trivially_infeasible(fixed):
+        num_selected = num_forced + sum(fixed.values())
+        if num_selected > committeesize:
+            return True
+        if num_selected + len(free_cands) - len(fixed) < committeesize:
+            return True
+        return any(
+            value == 1 and fixed.get(predecessor.get(cand)) == 0 for cand, value in fixed.items()
+        )
+
+    def subproblems(fixed, committee):
+        prefix = dict(fixed)
+        for cand in free_cands:
+            if cand in fixed:
+                continue
+            subproblem = dict(prefix)
+            subproblem[cand] = int(cand not in committee)
+            prefix[cand] = int(cand in committee)
+            if not is_trivially_infeasible(subproblem):
+                yield subproblem
+
+    yield committee
+    stack = [subproblems({}, committee)]
+    try:
+        while stack:
+            fixed = next(stack[-1], None)
+            if fixed is None:
+                stack.pop()
+                continue
+            session.fix_candidates(fixed, bounds)
+            result = solve()
+            if result is None:
+                continue
+            committee, optimal = result
+            if optimal:
+                yield committee
+            stack.append(subproblems(fixed, committee))
+    finally:
+        session.fix_candidates({}, bounds)
+
 
 def _pulp_thiele_methods(
     scorefct_id,
@@ -143,6 +524,7 @@ def _pulp_thiele_methods(
     committeesize,
     resolute,
     max_num_of_committees,
+    forced_cands=(),
 ):
     def set_opt_model_func(model, in_committee):
         # utility[(voter, x)] contains (intended binary) variables counting the number of approved
@@ -155,35 +537,54 @@ def _pulp_thiele_methods(
         # interpretation is valid:
         # utility[(voter, x)] indicates whether `voter` approves at least x candidates in the
         # committee (this is the case for scorefct_id "pav", "slav" or "geom").
+        #
+        # Candidates in `forced_cands` are contained in every winning committee (see
+        # abcrules._thiele_methods_kernel()).
+        #
+        # The model is built with numpy arrays: the utility variables of a voter form a
+        # contiguous block of length max_in_committee[voter].
+
+        approval_matrix = profile.approval_matrix
+        # maximum number of approved candidates that a voter can have in a committee
+        num_approved = approval_matrix.sum(axis=1).astype(np.int64)
+        max_in_committee = np.minimum(num_approved, committeesize)
+        block_start = np.concatenate(([0], np.cumsum(max_in_committee)))
+        num_utility = int(block_start[-1])
+        # position of each utility variable within its block (i.e., x - 1)
+        voter_of_utility = np.repeat(np.arange(len(profile)), max_in_committee)
+        x_minus_one = np.arange(num_utility) - block_start[voter_of_utility]
+        objective = (
+            np.asarray(marginal_scores)[x_minus_one + 1]
+            * np.asarray(profile.weight_vector, dtype=float)[voter_of_utility]
+        )
+        utility = model.add_variables(num_utility, 0, 1, integer=True, objective=objective)
 
-        utility = {}
-
-        max_in_committee = {}
-        for i, voter in enumerate(profile):
-            # maximum number of approved candidates that this voter can have in a committee
-            max_in_committee[voter] = min(len(voter.approved), committeesize)
-            for x in range(1, max_in_committee[voter] + 1):
-                utility[(voter, x)] = pulp.LpVariable(f"utility({i,x})", lowBound=0, upBound=1, cat='Integer')
+        if len(forced_cands):
+            model.set_bounds(in_committee[list(forced_cands)], 1, 1)
 
         # constraint: the committee has the required size
-        model += pulp.lpSum(in_committee) == committeesize
+        model.add_constraint(
+            in_committee, np.ones(len(in_committee)), committeesize, committeesize
+        )
 
         # constraint: utilities are consistent with actual committee
-        for voter in profile:
-            model += pulp.lpSum(utility[voter, x] for x in range(1, max_in_committee[voter] + 1)) == pulp.lpSum(in_committee[cand] for cand in voter.approved)
-
-        # objective: the Thiele score of the committee
-        model += pulp.lpSum(
-            float(marginal_scorefct(x)) * voter.weight * utility[(voter, x)]
-            for voter in profile
-            for x in range(1, max_in_committee[voter] + 1)
+        # (row of a voter: its utility variables with +1, her approved candidates with -1)
+        approving_voters, approved_cands = np.nonzero(approval_matrix)
+        row_of_entry = np.concatenate((voter_of_utility, approving_voters))
+        order = np.argsort(row_of_entry, kind="stable")
+        row_lengths = max_in_committee + num_approved
+        model.add_constraints(
+            indptr=np.concatenate(([0], np.cumsum(row_lengths))),
+            indices=np.concatenate((utility, in_committee[approved_cands]))[order],
+            data=np.concatenate((np.ones(num_utility), -np.ones(len(approved_cands))))[order],
+            lower=0,
+            upper=0,
         )
 
-        model.sense = pulp.LpMaximize
+    score_table = scores.score_table(scorefct_id, committeesize)
+    marginal_scores = score_table.marginal_float.tolist()
 
-    marginal_scorefct = scores.get_marginal_scorefct(scorefct_id, committeesize)
-
-    score_values = [marginal_scorefct(x) for x in range(1, committeesize + 1)]
+    score_values = score_table.marginal[1:]
     if not all(
         first > second or first == second == 0
         for first, second in zip(score_values, score_values[1:])
@@ -204,6 +605,7 @@ def _pulp_thiele_methods(
         max_num_of_committees=max_num_of_committees,
         name=scorefct_id,
         committeescorefct=functools.partial(scores.thiele_score, scorefct_id),
+        session=_MatrixSession(profile, scorefct_id),
     )
     return sorted_committees(committees)
 
@@ -213,34 +615,51 @@ def _pulp_lexcc(profile, committeesize, resolute, max_num_of_committees):
         # candidates in the selected committee by `voter`. This utility[(voter, x)] is true for
         # exactly the number of candidates in the committee approved by `voter` for all
         # x = 1...committeesize.
+        #
+        # The model is built in the first iteration and kept in `session`; later iterations only
+        # add the constraint from the previous iteration and replace the objective.
 
-        utility = {}
         iteration = len(satisfaction_constraints)
-        scorefcts = [scores.get_marginal_scorefct(f"atleast{i + 1}") for i in range(iteration + 1)]
 
-        max_in_committee = {}
-        for i, voter in enumerate(profile):
-            # maximum number of approved candidates that this voter can have in a committee
-            max_in_committee[voter] = min(len(voter.approved), committeesize)
-            for x in range(1, max_in_committee[voter] + 1):
-                utility[(voter, x)] = pulp.LpVariable(f"utility({i, x})", lowBound=0, upBound=1, cat=pulp.LpBinary)
+        if iteration == 0:
+            for i, voter in enumerate(profile):
+                # maximum number of approved candidates that this voter can have in a committee
+                max_in_committee[voter] = min(len(voter.approved), committeesize)
+                for x in range(1, max_in_committee[voter] + 1):
+                    utility[(voter, x)] = pulp.LpVariable(
+                        f"utility({i, x})", lowBound=0, upBound=1, cat=pulp.LpBinary
+                    )
 
-        # constraint: the committee has the required size
-        model += pulp.lpSum(in_committee) == committeesize
+            # constraint: the committee has the required size
+            model += pulp.lpSum(in_committee) == committeesize
 
-        # constraint: utilities are consistent with actual committee
-        for voter in profile:
-            model += pulp.lpSum(utility[voter, x] for x in range(1, max_in_committee[voter] + 1)) == pulp.lpSum(in_committee[cand] for cand in voter.approved)
-
-        # additional constraints from previous iterations
-        for prev_iteration in range(iteration):
-            model += pulp.lpSum(float(scorefcts[prev_iteration](x)) * voter.weight * utility[(voter, x)] for voter in profile for x in range(1, max_in_committee[voter] + 1)) >= satisfaction_constraints[prev_iteration] - ACCURACY
+            # constraint: utilities are consistent with actual committee
+            for voter in profile:
+                model += pulp.lpSum(
+                    utility[voter, x] for x in range(1, max_in_committee[voter] + 1)
+                ) == pulp.lpSum(in_committee[cand] for cand in voter.approved)
+        else:
+            # additional constraint from the previous iteration
+            model += (
+                atleast_score(iteration - 1) >= satisfaction_constraints[iteration - 1] - ACCURACY
+            )
 
         # objective: the at-least-y score of the committee in iteration y
-        model += pulp.lpSum(float(scorefcts[iteration](x)) * voter.weight * utility[(voter, x)] for voter in profile for x in range(1, max_in_committee[voter] + 1))
-
+        model.setObjective(atleast_score(iteration))
         model.sense = pulp.LpMaximize
-        model.setObjective(model.objective)
+
+    def atleast_score(iteration):
+        score_table = scores.score_table(f"atleast{iteration + 1}", committeesize)
+        scorefct = score_table.marginal_float.tolist()
+        return pulp.lpSum(
+            scorefct[x] * voter.weight * utility[(voter, x)]
+            for voter in profile
+            for x in range(1, max_in_committee[voter] + 1)
+        )
+
+    utility = {}
+    max_in_committee = {}
+    session = _PulpSession(profile, "lexcc")
 
     # proceed in `committeesize` many iterations to achieve lexicographic tie-breaking
     satisfaction_constraints = []
@@ -255,6 +674,7 @@ def _pulp_lexcc(profile, committeesize, resolute, max_num_of_committees):
             max_num_of_committees=None,
             name=f"lexcc-atleast{iteration}",
             committeescorefct=functools.partial(scores.thiele_score, f"atleast{iteration}"),
+            session=session,
         )
         satisfaction_constraints.append(
             scores.thiele_score(f"atleast{iteration}", profile, committees[0])
@@ -268,6 +688,7 @@ def _pulp_lexcc(profile, committeesize, resolute, max_num_of_committees):
         max_num_of_committees=max_num_of_committees,
         name="lexcc-final",
         committeescorefct=functools.partial(scores.thiele_score, f"atleast{committeesize}"),
+        session=session,
     )
     satisfaction_constraints.append(
         scores.thiele_score(f"atleast{iteration}", profile, committees[0])
@@ -424,49 +845,74 @@ def _pulp_minimaxphragmen(profile, committeesize, resolute, max_num_of_committee
 def _pulp_leximaxphragmen(profile, committeesize, resolute, max_num_of_committees):
     
     def set_opt_model_func(model, in_committee):
-        load = {}
-        loadbound_constraint = {}
-        for cand in profile.candidates:
-            for i, voter in enumerate(profile):
-                load[(voter, cand)] = pulp.LpVariable(f"load{i}-{cand}", 0, 1)
-
-        for i, _ in enumerate(profile):
-            for j, _ in enumerate(profile):
-                loadbound_constraint[(i, j)] = pulp.LpVariable(f"loadbound_constraint({i, j})", 0, 1, cat='Binary')
-
-        for i, _ in enumerate(profile):
-            model += pulp.lpSum(loadbound_constraint[(i, j)] for j, _ in enumerate(profile)) == 1
-            model += pulp.lpSum(loadbound_constraint[(j, i)] for j, _ in enumerate(profile)) == 1
+        # The model is built in the first iteration and kept in `session`; later iterations only
+        # add the constraints for new loadbounds and replace the constraints for `newloadbound`.
+        nonlocal num_added_loadbounds
+
+        if not load:
+            for cand in profile.candidates:
+                for i, voter in enumerate(profile):
+                    load[(voter, cand)] = pulp.LpVariable(f"load{i}-{cand}", 0, 1)
+
+            for i, _ in enumerate(profile):
+                for j, _ in enumerate(profile):
+                    loadbound_constraint[(i, j)] = pulp.LpVariable(
+                        f"loadbound_constraint({i, j})", 0, 1, cat="Binary"
+                    )
+
+            for i, _ in enumerate(profile):
+                model += (
+                    pulp.lpSum(loadbound_constraint[(i, j)] for j, _ in enumerate(profile)) == 1
+                )
+                model += (
+                    pulp.lpSum(loadbound_constraint[(j, i)] for j, _ in enumerate(profile)) == 1
+                )
 
-        # constraint: the committee has the required size
-        model += pulp.lpSum(in_committee[cand] for cand in profile.candidates) == committeesize
+            # constraint: the committee has the required size
+            model += pulp.lpSum(in_committee[cand] for cand in profile.candidates) == committeesize
 
-        for cand in profile.candidates:
-            for voter in profile:
-                if cand not in voter.approved:
-                    load[(voter, cand)] = 0
+            for cand in profile.candidates:
+                for voter in profile:
+                    if cand not in voter.approved:
+                        load[(voter, cand)] = 0
 
-        # a candidate's load is distributed among his approvers
-        for cand in profile.candidates:
-            model += pulp.lpSum(
-                voter.weight * load[(voter, cand)]
-                for voter in profile
-                if cand in profile.candidates
-            ) >= in_committee[cand]
+            # a candidate's load is distributed among his approvers
+            for cand in profile.candidates:
+                model += pulp.lpSum(
+                    voter.weight * load[(voter, cand)]
+                    for voter in profile
+                    if cand in profile.candidates
+                ) >= in_committee[cand]
 
-        for i, _ in enumerate(loadbounds):
+        for i in range(num_added_loadbounds, len(loadbounds)):
             for j, voter in enumerate(profile):
                 model += pulp.lpSum(load[(voter, cand)] for cand in voter.approved) <= loadbounds[i] + (1 - loadbound_constraint[(i, j)]) * committeesize + ACCURACY
                     # constraint applies only if loadbound_constraint[(i, voter)] == 1
+        num_added_loadbounds = len(loadbounds)
 
-        newloadbound = pulp.LpVariable("new loadbound", 0, committeesize)
+        # these constraints depend on the number of loadbounds and are replaced in each iteration
         for j, voter in enumerate(profile):
-            model += pulp.lpSum(load[(voter, cand)] for cand in voter.approved) <= newloadbound + pulp.lpSum(loadbound_constraint[(i, j)] * committeesize for i in range(len(loadbounds)))
+            constraint_name = f"newloadbound_constraint{j}"
+            if constraint_name in model.constraints:
+                session.remove_constraint(constraint_name)
+            model += (
+                pulp.lpSum(load[(voter, cand)] for cand in voter.approved)
+                <= newloadbound
+                + pulp.lpSum(
+                    loadbound_constraint[(i, j)] * committeesize for i in range(len(loadbounds))
+                ),
+                constraint_name,
+            )
 
         # maximizing the negative distance makes code more similar to the other methods here
-        model += pulp.lpSum(-newloadbound)
+        model.setObjective(pulp.lpSum(-newloadbound))
         model.sense = pulp.LpMaximize
-    
+
+    load = {}
+    loadbound_constraint = {}
+    num_added_loadbounds = 0
+    newloadbound = pulp.LpVariable("new loadbound", 0, committeesize)
+
     # check if a sufficient number of candidates is approved
     approved_candidates = profile.approved_candidates()
     if len(approved_candidates) < committeesize:
@@ -486,6 +932,7 @@ def _pulp_leximaxphragmen(profile, committeesize, resolute, max_num_of_committee
             for extra in itertools.combinations(remaining_candidates, num_missing_candidates)
         ]
 
+    session = _PulpSession(profile, "leximaxphragmen")
     loadbounds = []
     for iteration in range(len(profile) - 1):
         # in interation we enforce a new loadbound.
@@ -497,6 +944,7 @@ def _pulp_leximaxphragmen(profile, committeesize, resolute, max_num_of_committee
             resolute=True,
             max_num_of_committees=None,
             name=f"leximaxphragmen-iteration{iteration}",
+            session=session,
         )
         if math.isclose(neg_loadbound, 0, rel_tol=CMP_ACCURACY, abs_tol=CMP_ACCURACY):
             # all other voters have a load of zero, no further loadbounds constraints required
@@ -510,6 +958,7 @@ def _pulp_leximaxphragmen(profile, committeesize, resolute, max_num_of_committee
         resolute=resolute,
         max_num_of_committees=max_num_of_committees,
         name="leximaxphragmen-final",
+        session=session,
     )
 
     return sorted_committees(committees)
@@ -597,42 +1046,47 @@ def _pulp_minimaxav(profile, committeesize, resolute, max_num_of_committees):
 
 def _pulp_lexminimaxav(profile, committeesize, resolute, max_num_of_committees):
     def set_opt_model_func(model, in_committee):
-        voteratmostdistances = {}
+        # The model is built in the first iteration and kept in `session`; later iterations only
+        # add the constraint from the previous iteration and replace the objective.
 
-        for i, voter in enumerate(profile):
-            for dist in range(profile.num_cand + 1):
-                voteratmostdistances[(i, dist)] = pulp.LpVariable(
-                    f"atmostdistance({i, dist})", cat=pulp.LpBinary
-                )
-                if dist >= len(voter.approved) + committeesize:
-                    # distances are always <= len(voter.approved) + committeesize
-                    voteratmostdistances[(i, dist)] = 1
-                if dist < abs(len(voter.approved) - committeesize):
-                    # distances are never < abs(len(voter.approved) - committeesize)
-                    voteratmostdistances[(i, dist)] = 0
-
-        # constraint: the committee has the required size
-        model.addConstraint(pulp.lpSum(in_committee) == committeesize)
-
-        # constraint: distances are consistent with actual committee
-        for i, voter in enumerate(profile):
-            not_approved = [cand for cand in profile.candidates if cand not in voter.approved]
-            for dist in range(profile.num_cand + 1):
-                if isinstance(voteratmostdistances[(i, dist)], int):
-                    # trivially satisfied
-                    continue
-                model.addConstraint(
+        if not voteratmostdistances:
+            for i, voter in enumerate(profile):
+                for dist in range(profile.num_cand + 1):
+                    voteratmostdistances[(i, dist)] = pulp.LpVariable(
+                        f"atmostdistance({i, dist})", cat=pulp.LpBinary
+                    )
+                    if dist >= len(voter.approved) + committeesize:
+                        # distances are always <= len(voter.approved) + committeesize
+                        voteratmostdistances[(i, dist)] = 1
+                    if dist < abs(len(voter.approved) - committeesize):
+                        # distances are never < abs(len(voter.approved) - committeesize)
+                        voteratmostdistances[(i, dist)] = 0
+
+            # constraint: the committee has the required size
+            model.addConstraint(pulp.lpSum(in_committee) == committeesize)
+
+            # constraint: distances are consistent with actual committee
+            for i, voter in enumerate(profile):
+                not_approved = [cand for cand in profile.candidates if cand not in voter.approved]
+                for dist in range(profile.num_cand + 1):
+                    if isinstance(voteratmostdistances[(i, dist)], int):
+                        # trivially satisfied
+                        continue
+                    model.addConstraint(
                         pulp.lpSum(1 - in_committee[cand] for cand in voter.approved)
                         + pulp.lpSum(in_committee[cand] for cand in not_approved)
                         <= dist + (1 - voteratmostdistances[(i, dist)]) * (profile.num_cand + 1)
-                )
+                    )
 
-        # additional constraints from previous iterations
+        # additional constraints from previous iterations (that have not been added yet)
         for dist, num_voters_achieving_distance in hammingdistance_constraints.items():
+            if dist in added_distances:
+                continue
             model.addConstraint(
                 pulp.lpSum(voteratmostdistances[(i, dist)] for i, _ in enumerate(profile))
                 >= num_voters_achieving_distance - ACCURACY
             )
+            added_distances.add(dist)
 
         new_distance = min(hammingdistance_constraints.keys()) - 1
         # objective: maximize number of voters achieving at most distance `new_distance`
@@ -641,6 +1095,10 @@ def _pulp_lexminimaxav(profile, committeesize, resolute, max_num_of_committees):
         )
         model.sense = pulp.LpMaximize
 
+    voteratmostdistances = {}
+    added_distances = set()
+    session = _PulpSession(profile, "lexminimaxav")
+
     # compute minimaxav as baseline and then improve on it
     committees = _pulp_minimaxav(
         profile, committeesize, resolute=True, max_num_of_committees=None
@@ -665,6 +1123,7 @@ def _pulp_lexminimaxav(profile, committeesize, resolute, max_num_of_committees):
             resolute=_resolute,
             max_num_of_committees=_max_num_of_committees,
             name=f"lexminimaxav-atmostdistance{distance}",
+            session=session,
             committeescorefct=functools.partial(
                 scores.num_voters_with_upper_bounded_hamming_distance, distance
             ),
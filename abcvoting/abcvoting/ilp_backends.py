@@ -0,0 +1,314 @@
+"""
+Solver backends for integer linear programs (ILPs).
+
+ILPs are either pulp models (`pulp.LpProblem`) or `ilp_model.MatrixModel` objects. They are
+solved by the active backend. The following backends are supported (in order of preference):
+
+- "highspy": the HiGHS solver via its native Python interface (package `highspy`),
+- "highs-wasm": the HiGHS solver compiled to WebAssembly (via `js.runHighs` in Pyodide),
+- "pulp-cbc": the CBC solver shipped with pulp.
+
+The first available backend is selected when this module is imported. A different backend can be
+chosen with `set_backend()`.
+
+Solutions of pulp models are returned as dictionaries in the JSON format of HiGHS, i.e.,
+`{"Status": ..., "ObjectiveValue": ..., "Columns": {variable_name: {"Primal": value}}}`
+(only "Status" if no solution was found).
+"""
+
+import json
+import os
+import tempfile
+import numpy as np
+import pulp
+
+try:
+    import highspy
+except ImportError:
+    highspy = None
+
+try:
+    import js
+except ImportError:
+    js = None
+
+ACCURACY = 1e-8  # as in abcrules_gurobi and abcrules_mip
+
+
+class _Backend:
+    """
+    A solver backend.
+
+    Subclasses implement `is_available()` and `solve_lp_text()` or override the `solve_*()`
+    methods that do not go through LP files.
+    """
+
+    name = None
+    description = None
+
+    def is_available(self):
+        """Return whether the solver is installed."""
+        raise NotImplementedError
+
+    def solve_lp_text(self, lp_text):
+        """Solve a model given in LP file format and return the solution (as dictionary)."""
+        raise NotImplementedError
+
+    def solve_pulp_model(self, model, lp_text=None):
+        """
+        Solve a pulp model and return the solution (as dictionary).
+
+        `lp_text` is an optional function returning the model in LP file format (which may be
+        faster than `model.writeLP()`).
+        """
+        return self.solve_lp_text(model.writeLP() if lp_text is None else lp_text())
+
+    def solve_matrix_model(self, model):
+        """
+        Solve an `ilp_model.MatrixModel` and return the triple
+        `(status, objective_value, values)` (see `ilp_model.MatrixModel.solve()`).
+        """
+        solution = self.solve_lp_text(model.lp_text())
+        status = solution["Status"]
+        if status != "Optimal":
+            return status, None, None
+        values = np.zeros(model.num_cols)
+        for name, column in solution["Columns"].items():
+            values[int(name[1:])] = column["Primal"]  # variables are called x0, x1, ...
+        return status, solution["ObjectiveValue"], values
+
+
+class _HighspyBackend(_Backend):
+    name = "highspy"
+    description = "HiGHS solver (native)"
+
+    def is_available(self):
+        return highspy is not None
+
+    @staticmethod
+    def _run(highs):
+        highs.run()
+        status = highs.modelStatusToString(highs.getModelStatus())
+        if status != "Optimal":
+            return status, None, None
+        objective_value = highs.getInfo().objective_function_value
+        return status, objective_value, np.array(highs.getSolution().col_value)
+
+    @staticmethod
+    def _highs():
+        highs = highspy.Highs()
+        highs.setOptionValue("output_flag", False)
+        # the default integrality tolerance (1e-6) is multiplied by big-M coefficients (e.g., in
+        # leximaxphragmen) and then exceeds the accuracy used to compare objective values;
+        # ACCURACY itself is not sufficient for leximaxphragmen
+        highs.setOptionValue("mip_feasibility_tolerance", ACCURACY / 10)
+        # by default, HiGHS stops at a relative gap of 1e-4, i.e., possibly with a suboptimal
+        # committee; the enumeration of optimal committees requires (numerically) exact optima
+        highs.setOptionValue("mip_rel_gap", ACCURACY)
+        highs.setOptionValue("mip_abs_gap", ACCURACY)
+        return highs
+
+    def solve_lp_text(self, lp_text):
+        highs = self._highs()
+        # highspy reads models only from files
+        with tempfile.NamedTemporaryFile("w", suffix=".lp", delete=False) as lp_file:
+            lp_file.write(lp_text)
+        try:
+            if highs.readModel(lp_file.name) == highspy.HighsStatus.kError:
+                raise RuntimeError("HiGHS could not read the LP file.")
+        finally:
+            os.unlink(lp_file.name)
+        status, objective_value, values = self._run(highs)
+        if status != "Optimal":
+            return {"Status": status}
+        return {
+            "Status": status,
+            "ObjectiveValue": objective_value,
+            "Columns": {
+                name: {"Primal": value}
+                for name, value in zip(highs.getLp().col_names_, values.tolist())
+            },
+        }
+
+    def solve_matrix_model(self, model):
+        # the arrays are passed to HiGHS directly (without LP file)
+        arrays = model.arrays()
+        lp = highspy.HighsLp()
+        lp.num_col_ = model.num_cols
+        lp.num_row_ = model.num_rows
+        lp.col_cost_ = arrays["objective"]
+        lp.col_lower_ = arrays["col_lower"]
+        lp.col_upper_ = arrays["col_upper"]
+        lp.row_lower_ = arrays["row_lower"]
+        lp.row_upper_ = arrays["row_upper"]
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+        lp.a_matrix_.start_ = arrays["indptr"]
+        lp.a_matrix_.index_ = arrays["indices"]
+        lp.a_matrix_.value_ = arrays["data"]
+        lp.integrality_ = [
+            highspy.HighsVarType.kInteger if integer else highspy.HighsVarType.kContinuous
+            for integer in arrays["integrality"].tolist()
+        ]
+        lp.sense_ = highspy.ObjSense.kMaximize if model.maximize else highspy.ObjSense.kMinimize
+        highs = self._highs()
+        if highs.passModel(lp) == highspy.HighsStatus.kError:
+            raise RuntimeError("HiGHS could not read the model.")
+        return self._run(highs)
+
+
+class _WasmHighsBackend(_Backend):
+    name = "highs-wasm"
+    description = "HiGHS solver via WebAssembly"
+
+    def is_available(self):
+        return js is not None and hasattr(js, "runHighs")
+
+    def solve_lp_text(self, lp_text):
+        return json.loads(js.runHighs(lp_text))
+
+
+class _PulpCbcBackend(_Backend):
+    name = "pulp-cbc"
+    description = "CBC solver (via pulp)"
+
+    def is_available(self):
+        return pulp.PULP_CBC_CMD(msg=False).available()
+
+    def solve_pulp_model(self, model, lp_text=None):
+        model.solve(pulp.PULP_CBC_CMD(msg=False))
+        status = pulp.LpStatus[model.status]
+        if status != "Optimal":
+            return {"Status": status}
+        return {
+            "Status": status,
+            "ObjectiveValue": pulp.value(model.objective) or 0.0,
+            "Columns": {
+                variable.name: {"Primal": variable.varValue} for variable in model.variables()
+            },
+        }
+
+    def solve_matrix_model(self, model):
+        # CBC is called via pulp, hence the model has to be converted
+        arrays = model.arrays()
+        problem = pulp.LpProblem(
+            model.name, pulp.LpMaximize if model.maximize else pulp.LpMinimize
+        )
+        variables = [
+            pulp.LpVariable(
+                f"x{col}",
+                lowBound=None if lower == -np.inf else lower,
+                upBound=None if upper == np.inf else upper,
+                cat=pulp.LpInteger if integer else pulp.LpContinuous,
+            )
+            for col, (lower, upper, integer) in enumerate(
+                zip(
+                    arrays["col_lower"].tolist(),
+                    arrays["col_upper"].tolist(),
+                    arrays["integrality"].tolist(),
+                )
+            )
+        ]
+        problem += pulp.LpAffineExpression(zip(variables, arrays["objective"].tolist()))
+        indptr, indices, data = arrays["indptr"], arrays["indices"], arrays["data"]
+        for row in range(model.num_rows):
+            start, end = indptr[row], indptr[row + 1]
+            expression = pulp.LpAffineExpression(
+                [
+                    (variables[col], coef)
+                    for col, coef in zip(indices[start:end].tolist(), data[start:end].tolist())
+                ]
+            )
+            lower, upper = float(arrays["row_lower"][row]), float(arrays["row_upper"][row])
+            if lower == upper:
+                problem += expression == lower
+                continue
+            if lower > -np.inf:
+                problem += expression >= lower
+            if upper < np.inf:
+                problem += expression <= upper
+        solution = self.solve_pulp_model(problem)
+        status = solution["Status"]
+        if status != "Optimal":
+            return status, None, None
+        values = np.array([variable.varValue or 0.0 for variable in variables])
+        return status, solution["ObjectiveValue"], values
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in [_HighspyBackend(), _WasmHighsBackend(), _PulpCbcBackend()]
+}
+"""
+All supported solver backends (in order of preference).
+"""
+
+
+def _available_backends():
+    """Verify which solver backends are installed on the current machine."""
+    return [name for name, backend in BACKENDS.items() if backend.is_available()]
+
+
+available_backends = _available_backends()
+active_backend = BACKENDS[available_backends[0]] if available_backends else None
+
+
+def set_backend(name):
+    """
+    Choose the solver backend that is used for all ILPs.
+
+    Parameters
+    ----------
+        name : str
+            The name of the backend, one of `available_backends`.
+    """
+    global active_backend
+    if name not in available_backends:
+        raise ValueError(
+            f"Solver backend {name} is not available (available: {available_backends})."
+        )
+    active_backend = BACKENDS[name]
+
+
+def _get_active_backend():
+    if active_backend is None:
+        raise RuntimeError(
+            f"No ILP solver is available (supported backends: {', '.join(BACKENDS)})."
+        )
+    return active_backend
+
+
+def solve_pulp_model(model, lp_text=None):
+    """
+    Solve a pulp model with the active backend.
+
+    Parameters
+    ----------
+        model : pulp.LpProblem
+            The model.
+
+        lp_text : callable, optional
+            A function returning the model in LP file format (as `model.writeLP()`).
+
+    Returns
+    -------
+        dict
+            The solution in the JSON format of HiGHS (see module documentation).
+    """
+    return _get_active_backend().solve_pulp_model(model, lp_text)
+
+
+def solve_matrix_model(model):
+    """
+    Solve an `ilp_model.MatrixModel` with the active backend.
+
+    Parameters
+    ----------
+        model : ilp_model.MatrixModel
+            The model.
+
+    Returns
+    -------
+        tuple
+            A triple `(status, objective_value, values)` (see `ilp_model.MatrixModel.solve()`).
+    """
+    return _get_active_backend().solve_matrix_model(model)
@@ -0,0 +1,253 @@
+"""
+Integer linear programs given by sparse matrices (without constructing pulp objects).
+
+Building ILPs with `pulp.LpVariable` and `pulp.lpSum` creates Python objects for every variable
+and every coefficient, which dominates the running time for mid-size instances. A `MatrixModel`
+instead stores the constraint matrix in compressed sparse row (CSR) format together with vectors
+for bounds, integrality and the objective. Constraints are added in vectorized blocks.
+
+The model is passed to the solver as arrays or, if the solver backend only has a text interface,
+in LP file format (`MatrixModel.lp_text()`), see `abcvoting.ilp_backends`.
+"""
+
+import numpy as np
+from abcvoting import ilp_backends
+
+
+class MatrixModel:
+    """
+    A (mixed) integer linear program given by sparse matrices.
+
+    Variables (columns) are referred to by their indices, constraints (rows) are of the form
+    `lower <= sum(coefficients * variables) <= upper`.
+
+    Parameters
+    ----------
+        name : str
+            Name of the model (used in the LP file).
+
+        maximize : bool, optional
+            Maximize the objective (otherwise it is minimized).
+    """
+
+    def __init__(self, name, maximize=True):
+        self.name = name
+        self.maximize = maximize
+        self.num_cols = 0
+        self.num_rows = 0
+        # blocks of columns: (lower, upper, integrality, objective)
+        self._col_blocks = []
+        # blocks of rows in CSR format: (indptr, indices, data, lower, upper)
+        self._row_blocks = []
+        self._arrays = None
+
+    def add_variables(self, num, lower=0.0, upper=np.inf, integer=False, objective=0.0):
+        """
+        Add `num` variables.
+
+        Parameters
+        ----------
+            num : int
+                The number of variables.
+
+            lower, upper : float or array_like, optional
+                Lower and upper bounds (scalars or arrays of length `num`).
+
+            integer : bool, optional
+                Whether the variables are integer variables.
+
+            objective : float or array_like, optional
+                The objective coefficients of the variables.
+
+        Returns
+        -------
+            numpy.ndarray
+                The indices of the new variables.
+        """
+        self._col_blocks.append(
+            (
+                np.broadcast_to(np.asarray(lower, dtype=float), (num,)),
+                np.broadcast_to(np.asarray(upper, dtype=float), (num,)),
+                np.full(num, bool(integer)),
+                np.broadcast_to(np.asarray(objective, dtype=float), (num,)),
+            )
+        )
+        indices = np.arange(self.num_cols, self.num_cols + num)
+        self.num_cols += num
+        self._arrays = None
+        return indices
+
+    def add_constraints(self, indptr, indices, data, lower=-np.inf, upper=np.inf):
+        """
+        Add a block of constraints given in CSR format.
+
+        Row `i` of the block consists of the coefficients `data[indptr[i]:indptr[i + 1]]` of the
+        variables `indices[indptr[i]:indptr[i + 1]]`.
+
+        Parameters
+        ----------
+            indptr, indices, data : array_like
+                The constraint matrix of the block in CSR format.
+
+            lower, upper : float or array_like, optional
+                Lower and upper bounds of the rows (scalars or arrays of length `len(indptr) - 1`).
+        """
+        indptr = np.asarray(indptr, dtype=np.int64)
+        num = len(indptr) - 1
+        self._row_blocks.append(
+            (
+                indptr,
+                np.asarray(indices, dtype=np.int64),
+                np.asarray(data, dtype=float),
+                np.broadcast_to(np.asarray(lower, dtype=float), (num,)),
+                np.broadcast_to(np.asarray(upper, dtype=float), (num,)),
+            )
+        )
+        self.num_rows += num
+        self._arrays = None
+
+    def add_constraint(self, indices, data, lower=-np.inf, upper=np.inf):
+        """
+        Add a single constraint `lower <= sum(data * variables[indices]) <= upper`.
+        """
+        self.add_constraints([0, len(indices)], indices, data, lower, upper)
+
+    def set_bounds(self, indices, lower, upper):
+        """
+        Change the bounds of the variables `indices`.
+        """
+        arrays = self.arrays()
+        arrays["col_lower"][indices] = lower
+        arrays["col_upper"][indices] = upper
+
+    def arrays(self):
+        """
+        Return the model as arrays.
+
+        Returns
+        -------
+            dict
+                The arrays `col_lower`, `col_upper`, `integrality` (bool), `objective` (of length
+                `num_cols`), `indptr`, `indices`, `data` (constraint matrix in CSR format),
+                `row_lower` and `row_upper` (of length `num_rows`).
+        """
+        if self._arrays is not None:
+            return self._arrays
+        col_blocks = list(zip(*self._col_blocks)) or [[]] * 4
+        arrays = {
+            key: np.concatenate(block).astype(dtype) if block else np.zeros(0, dtype=dtype)
+            for key, block, dtype in zip(
+                ["col_lower", "col_upper", "integrality", "objective"],
+                col_blocks,
+                [float, float, bool, float],
+            )
+        }
+        indptrs = [np.zeros(1, dtype=np.int64)]
+        offset = 0
+        for indptr, indices, _, _, _ in self._row_blocks:
+            indptrs.append(indptr[1:] - indptr[0] + offset)
+            offset += indptr[-1] - indptr[0]
+        arrays["indptr"] = np.concatenate(indptrs)
+        for position, key, dtype in [
+            (1, "indices", np.int64),
+            (2, "data", float),
+            (3, "row_lower", float),
+            (4, "row_upper", float),
+        ]:
+            if position <= 2:
+                parts = [block[position][block[0][0] : block[0][-1]] for block in self._row_blocks]
+            else:
+                parts = [block[position] for block in self._row_blocks]
+            arrays[key] = np.concatenate(parts).astype(dtype) if parts else np.zeros(0, dtype)
+        # the blocks are merged (new variables and constraints are added as new blocks)
+        self._col_blocks = [
+            (
+                arrays["col_lower"],
+                arrays["col_upper"],
+                arrays["integrality"],
+                arrays["objective"],
+            )
+        ]
+        self._row_blocks = [
+            (
+                arrays["indptr"],
+                arrays["indices"],
+                arrays["data"],
+                arrays["row_lower"],
+                arrays["row_upper"],
+            )
+        ]
+        self._arrays = arrays
+        return arrays
+
+    def lp_text(self):
+        """
+        Return the model in LP file format.
+
+        Variable `j` is called `x{j}`, constraint `i` is called `c{i}`.
+
+        Returns
+        -------
+            str
+        """
+        arrays = self.arrays()
+        lines = [f"\\* {self.name} *\\\n", "Maximize\n" if self.maximize else "Minimize\n"]
+        (nonzero,) = np.nonzero(arrays["objective"])
+        if len(nonzero) == 0:
+            nonzero = np.zeros(min(1, self.num_cols), dtype=np.int64)
+        lines.append(
+            "obj:" + _lp_terms(nonzero, arrays["objective"][nonzero]) + "\n" + "Subject To\n"
+        )
+        indptr, indices, data = arrays["indptr"], arrays["indices"], arrays["data"]
+        for row in range(self.num_rows):
+            start, end = indptr[row], indptr[row + 1]
+            terms = _lp_terms(indices[start:end], data[start:end]) if end > start else " 0 x0"
+            lower, upper = arrays["row_lower"][row], arrays["row_upper"][row]
+            if lower == upper:
+                lines.append(f"c{row}:{terms} = {lower:.12g}\n")
+                continue
+            if lower > -np.inf:
+                lines.append(f"c{row}:{terms} >= {lower:.12g}\n")
+            if upper < np.inf:
+                name = f"c{row}" if lower == -np.inf else f"c{row}_upper"
+                lines.append(f"{name}:{terms} <= {upper:.12g}\n")
+        lines.append("Bounds\n")
+        for col in range(self.num_cols):
+            lower, upper = arrays["col_lower"][col], arrays["col_upper"][col]
+            if lower == 0 and upper == np.inf:
+                continue  # default bounds
+            if lower == -np.inf and upper == np.inf:
+                lines.append(f" x{col} free\n")
+            elif lower == upper:
+                lines.append(f" x{col} = {lower:.12g}\n")
+            else:
+                lower = "-infinity" if lower == -np.inf else f"{lower:.12g}"
+                upper = "+infinity" if upper == np.inf else f"{upper:.12g}"
+                lines.append(f" {lower} <= x{col} <= {upper}\n")
+        (integer_cols,) = np.nonzero(arrays["integrality"])
+        if len(integer_cols):
+            lines.append("Generals\n")
+            lines.extend(f"x{col}\n" for col in integer_cols)
+        lines.append("End\n")
+        return "".join(lines)
+
+    def solve(self):
+        """
+        Solve the model with the active solver backend (see `abcvoting.ilp_backends`).
+
+        Returns
+        -------
+            tuple
+                A triple `(status, objective_value, values)`, where `status` is a string
+                (e.g., "Optimal" or "Infeasible"), and `objective_value` and `values` (a numpy
+                array with the values of all variables) are `None` if no solution was found.
+        """
+        return ilp_backends.solve_matrix_model(self)
+
+
+def _lp_terms(indices, coefficients):
+    # a linear expression in LP file format
+    return "".join(
+        f" {'-' if coef < 0 else '+'} {abs(coef):.12g} x{col}"
+        for col, coef in zip(indices.tolist(), coefficients.tolist())
+    )
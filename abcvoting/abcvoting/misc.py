@@ -67,6 +67,18 @@ class CandidateSet(set):
     def __str__(self):
         return self.str_with_names()
 
+    def bitmask(self):
+        """
+        Return this set of candidates as an integer bitmask.
+
+        See `bitmask()` for details.
+
+        Returns
+        -------
+            int
+        """
+        return bitmask(self)
+
     def str_with_names(self, cand_names=None):
         """
         Format a CandidateSet, using the names of candidates (instead of indices) if provided.
@@ -235,6 +247,103 @@ def hamming(set1, set2):
     return len(diffs)
 
 
+def bitmask(candidates):
+    """
+    Encode a set of candidates as an integer bitmask.
+
+    Bit `cand` of the bitmask is set if and only if `cand` is contained in `candidates`.
+    Python integers have arbitrary precision, so there is no limit on the number of candidates.
+    Intersection, union and symmetric difference correspond to `&`, `|` and `^`, respectively;
+    the size of a set is the number of set bits, see `popcount()`.
+
+    .. doctest::
+
+        >>> bitmask({0, 2, 3})
+        13
+        >>> print(candidates_from_bitmask(bitmask({0, 2, 3}) & bitmask({2, 3, 4})))
+        {2, 3}
+
+    Parameters
+    ----------
+        candidates : iterable of int
+            A set of candidates.
+
+    Returns
+    -------
+        int
+    """
+    mask = 0
+    for cand in candidates:
+        mask |= 1 << int(cand)
+    return mask
+
+
+def candidates_from_bitmask(mask):
+    """
+    Decode an integer bitmask (see `bitmask()`) into a set of candidates.
+
+    Parameters
+    ----------
+        mask : int
+            A bitmask.
+
+    Returns
+    -------
+        CandidateSet
+    """
+    candidates = []
+    cand = 0
+    while mask:
+        if mask & 1:
+            candidates.append(cand)
+        mask >>= 1
+        cand += 1
+    return CandidateSet(candidates)
+
+
+def popcount(mask):
+    """
+    Number of set bits in a bitmask, i.e., the size of the encoded set of candidates.
+
+    Parameters
+    ----------
+        mask : int
+            A bitmask (see `bitmask()`).
+
+    Returns
+    -------
+        int
+    """
+    return _popcount(mask)
+
+
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+else:  # Python < 3.10
+
+    def _popcount(mask):
+        return bin(mask).count("1")
+
+
+def hamming_bitmask(mask1, mask2):
+    """
+    Hamming distance between two sets of candidates given as bitmasks (see `bitmask()`).
+
+    Equivalent to `hamming()`, but faster.
+
+    Parameters
+    ----------
+        mask1, mask2 : int
+            The two bitmasks for which the Hamming distance is computed.
+
+    Returns
+    -------
+        int
+            The Hamming distance.
+    """
+    return popcount(mask1 ^ mask2)
+
+
 def header(text, symbol="-"):
     """
     Format a header for `text`.
@@ -280,6 +389,87 @@ def powerset(iterable, max_size=None):
     return itertools.chain.from_iterable(itertools.combinations(s, r) for r in range(max_size + 1))
 
 
+def unrank_combination(rank, n, k):
+    """
+    Return the combination with a given rank in the lexicographic order of k-subsets of range(n).
+
+    The lexicographic order is the order of `itertools.combinations(range(n), k)`.
+
+    Parameters
+    ----------
+        rank : int
+            The rank (0 <= rank < binom(n, k)).
+
+        n, k : int
+            Positive integers.
+
+    Returns
+    -------
+        tuple of int
+
+    Examples
+    --------
+    >>> unrank_combination(0, 5, 3)
+    (0, 1, 2)
+    >>> unrank_combination(9, 5, 3)
+    (2, 3, 4)
+    """
+    if not 0 <= rank < binom(n, k):
+        raise ValueError(f"rank must be between 0 and binom({n}, {k}) - 1.")
+    combination = []
+    element = 0
+    for position in range(k):
+        # number of combinations with prefix `combination + [element]`
+        num_combinations = binom(n - element - 1, k - position - 1)
+        while rank >= num_combinations:
+            rank -= num_combinations
+            element += 1
+            num_combinations = binom(n - element - 1, k - position - 1)
+        combination.append(element)
+        element += 1
+    return tuple(combination)
+
+
+def combinations_range(n, k, start, stop):
+    """
+    Yield all k-subsets of range(n) with lexicographic rank in the range [start, stop).
+
+    Equivalent to `itertools.islice(itertools.combinations(range(n), k), start, stop)`,
+    but without enumerating the first `start` combinations (see `unrank_combination()`).
+
+    Parameters
+    ----------
+        n, k : int
+            Positive integers.
+
+        start, stop : int
+            Ranks of the first combination and after the last combination.
+
+    Returns
+    -------
+        iterable of tuple of int
+
+    Examples
+    --------
+    >>> list(combinations_range(5, 3, 2, 5))
+    [(0, 1, 4), (0, 2, 3), (0, 2, 4)]
+    """
+    stop = min(stop, binom(n, k))
+    if start >= stop:
+        return
+    combination = list(unrank_combination(start, n, k))
+    yield tuple(combination)
+    for _ in range(stop - start - 1):
+        # find rightmost element that can be incremented
+        position = k - 1
+        while combination[position] == n - k + position:
+            position -= 1
+        combination[position] += 1
+        for i in range(position + 1, k):
+            combination[i] = combination[i - 1] + 1
+        yield tuple(combination)
+
+
 def compare_list_of_committees(committees1, committees2):
     """
     Check whether two lists of committees are equal.
@@ -380,22 +570,22 @@ def dominate(profile, committee1, committee2):
     bool
     """
 
-    committee1 = CandidateSet(committee1)
-    committee2 = CandidateSet(committee2)
+    committee1 = bitmask(CandidateSet(committee1))
+    committee2 = bitmask(CandidateSet(committee2))
 
     # iterate through all voters
-    for voter in profile:
+    for mask in profile.approval_bitmasks:
         # check if there are at least as many approved candidates in `committee1`
         # as in `committee2`
-        if len(voter.approved & committee1) < len(voter.approved & committee2):
+        if popcount(mask & committee1) < popcount(mask & committee2):
             return False
 
     # if not yet returned by now, then check for condition whether there is a voter with strictly
     # more preferred candidates in dominating committee than in input committee
-    for voter in profile:
+    for mask in profile.approval_bitmasks:
         # check if there are for some voter strictly more preferred candidates in `committee1`
         # than in `committee2`
-        if len(voter.approved & committee1) > len(voter.approved & committee2):
+        if popcount(mask & committee1) > popcount(mask & committee2):
             return True
 
     # If function has still not returned by now, then it means that `committee1` does not
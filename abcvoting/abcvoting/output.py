@@ -18,7 +18,11 @@ The default verbosity is `WARNING`.
 """
 
 import textwrap
-import js
+
+try:
+    import js  # only available in Pyodide
+except ImportError:
+    js = None
 
 # should match the values defined in the logging module!
 CRITICAL = 50
@@ -87,6 +91,31 @@ class Output:
         """
         self.verbosity = verbosity
 
+    def is_enabled(self, verbosity):
+        """
+        Return whether messages with the given verbosity level are output.
+
+        Messages are output if they are printed (depending on the current verbosity level),
+        passed to the logger (depending on the logger's level) or passed to `js.logger`
+        (always, if available).
+
+        Parameters
+        ----------
+            verbosity : int
+                Verbosity level.
+
+        Returns
+        -------
+            bool
+        """
+        if verbosity >= self.verbosity or js is not None:
+            return True
+        if self.logger:
+            return self.logger.isEnabledFor(
+                verbosity if verbosity not in (DETAILS, DEBUG2) else DEBUG
+            )
+        return False
+
     def _print(self, verbosity, msg, wrap, indent):
         if verbosity >= self.verbosity:
             if wrap:
@@ -105,7 +134,8 @@ class Output:
                 )
             print(msg)
 
-        js.logger(verbosity, msg)
+        if js is not None:
+            js.logger(verbosity, msg)
 
         if self.logger:
             self.logger.log(verbosity if verbosity not in (DETAILS, DEBUG2) else DEBUG, msg)
@@ -12,6 +12,9 @@ Preference profiles and voters.
 
 
 from collections import OrderedDict
+from fractions import Fraction
+import hashlib
+import numpy as np
 from abcvoting import misc
 
 
@@ -58,6 +61,19 @@ class Profile:
         self._voters = []  # Internal list of voters.
         # Use `Profile.add_voter()` or `Profile.add_voters()` to add voters
 
+        # cached array representations of `self._voters`, see `Profile._clear_cache()`
+        self._approval_matrix = None
+        self._weight_vector = None
+        self._approval_bitmasks = None
+        self._approvers = None
+        # total weight of each ballot type (keyed by bitmask), see `Profile.aggregated()`;
+        # updated incrementally by `add_voter()`
+        self._ballot_types = None
+        self._aggregated_profile = None
+        # content hash over num_cand and all voters, see `Profile.freeze()`;
+        # updated incrementally by `add_voter()`
+        self._content_hasher = hashlib.sha256(f"{num_cand};".encode())
+
         if cand_names:
             if len(cand_names) < num_cand:
                 raise ValueError(
@@ -66,6 +82,192 @@ class Profile:
                 )
             self.cand_names = [str(cand_names[i]) for i in range(num_cand)]
 
+    @classmethod
+    def from_approval_matrix(cls, matrix, weights=None, cand_names=None):
+        """
+        Create a profile from an approval matrix (voters x candidates).
+
+        This is considerably faster than `add_voters()` for large profiles: the input is validated
+        in a single vectorized pass and `Voter` objects are only created when they are accessed.
+
+        Parameters
+        ----------
+            matrix : array_like
+                A 0-1 array of shape `(num_voters, num_cand)`.
+
+                Entry `[v, cand]` is `1` (or `True`) if voter `v` approves candidate `cand`.
+
+            weights : array_like, optional
+                The weights of the voters, a sequence of length `num_voters` with numbers > 0.
+
+                Defaults to unit weights.
+
+            cand_names : list of str or str, optional
+                List of symbolic names for every candidate.
+
+        Returns
+        -------
+            Profile
+
+        Examples
+        --------
+        .. doctest::
+
+            >>> profile = Profile.from_approval_matrix([[1, 1, 0], [0, 0, 1]], weights=[2, 1])
+            >>> print(profile)
+            weighted profile with 2 voters and 3 candidates:
+             voter 0:   2 * {0, 1},
+             voter 1:   1 * {2}
+        """
+        matrix = np.asarray(matrix)
+        if matrix.ndim != 2:
+            raise ValueError(f"Approval matrix must be two-dimensional (shape {matrix.shape}).")
+        if not np.isin(matrix, (0, 1)).all():
+            raise ValueError("Approval matrix must only contain the values 0 and 1.")
+        num_voters, num_cand = matrix.shape
+        profile = cls(num_cand, cand_names=cand_names)
+
+        voter_indices, candidates = np.nonzero(matrix)
+        indptr = np.zeros(num_voters + 1, dtype=np.int64)
+        np.cumsum(np.bincount(voter_indices, minlength=num_voters), out=indptr[1:])
+        profile._set_lazy_voters(indptr, candidates, weights)
+
+        approval_matrix = matrix.astype(np.uint8)
+        approval_matrix.flags.writeable = False
+        profile._approval_matrix = approval_matrix
+        return profile
+
+    @classmethod
+    def from_csr(cls, indptr, indices, weights=None, num_cand=None, cand_names=None):
+        """
+        Create a profile from approval sets in compressed sparse row (CSR) format.
+
+        The approval set of voter `v` is `indices[indptr[v]:indptr[v + 1]]`.
+        As for `from_approval_matrix()`, the input is validated in a single vectorized pass
+        and `Voter` objects are only created when they are accessed.
+
+        Parameters
+        ----------
+            indptr : array_like of int
+                Row pointers, a non-decreasing sequence of length `num_voters + 1`
+                starting with `0` and ending with `len(indices)`.
+
+            indices : array_like of int
+                Approved candidates of all voters, concatenated.
+
+            weights : array_like, optional
+                The weights of the voters, a sequence of length `num_voters` with numbers > 0.
+
+                Defaults to unit weights.
+
+            num_cand : int, optional
+                Number of candidates.
+
+                Defaults to the largest candidate in `indices` plus one.
+
+            cand_names : list of str or str, optional
+                List of symbolic names for every candidate.
+
+        Returns
+        -------
+            Profile
+
+        Examples
+        --------
+        .. doctest::
+
+            >>> profile = Profile.from_csr([0, 2, 2, 3], [0, 1, 2])
+            >>> print(profile)
+            profile with 3 voters and 3 candidates:
+             voter 0:   {0, 1},
+             voter 1:   {},
+             voter 2:   {2}
+        """
+        indptr = np.asarray(indptr)
+        indices = np.asarray(indices)
+        if indptr.ndim != 1 or indices.ndim != 1:
+            raise ValueError("indptr and indices must be one-dimensional.")
+        if len(indptr) == 0 or not np.issubdtype(indptr.dtype, np.integer):
+            raise ValueError("indptr must be a non-empty sequence of integers.")
+        if indices.size > 0 and not np.issubdtype(indices.dtype, np.integer):
+            raise TypeError("indices must only contain integers (candidates).")
+        indptr = indptr.astype(np.int64)
+        indices = indices.astype(np.int64)
+        if indptr[0] != 0 or indptr[-1] != len(indices) or (np.diff(indptr) < 0).any():
+            raise ValueError(
+                "indptr must be non-decreasing, start with 0 and end with len(indices)."
+            )
+        if (indices < 0).any():
+            raise ValueError("indices must only contain positive integers (candidates).")
+        if num_cand is None:
+            num_cand = int(indices.max()) + 1 if indices.size > 0 else 1
+        elif (indices >= num_cand).any():
+            raise ValueError(f"indices contains candidates that are >= num_cand ({num_cand}).")
+        num_voters = len(indptr) - 1
+        voter_indices = np.repeat(np.arange(num_voters), np.diff(indptr))
+        if np.unique(voter_indices * num_cand + indices).size != indices.size:
+            raise ValueError("The approval set of a voter contains duplicate candidates.")
+
+        profile = cls(num_cand, cand_names=cand_names)
+        profile._set_lazy_voters(indptr, indices, weights)
+        return profile
+
+    def _set_lazy_voters(self, indptr, indices, weights):
+        # store (already validated) voters in CSR format, see `from_csr()`;
+        # `Voter` objects are created by the `_voters` property when needed
+        num_voters = len(indptr) - 1
+        if weights is None:
+            weights = [1] * num_voters
+        elif isinstance(weights, np.ndarray):
+            weights = weights.tolist()
+        else:
+            weights = list(weights)
+        if len(weights) != num_voters:
+            raise ValueError(
+                f"Number of weights ({len(weights)}) does not match the number of "
+                f"voters ({num_voters})."
+            )
+        weight_vector = _weight_array(weights)
+        if not (weight_vector > 0).all():
+            raise ValueError("Weight should be a number > 0.")
+        self._voters = []
+        self._lazy_voters = (indptr, indices, weights)
+        self._weight_vector = weight_vector
+        self._content_hasher = None
+
+    @property
+    def _voters(self):
+        if self._lazy_voters is not None:
+            indptr, indices, weights = self._lazy_voters
+            candidates = indices.tolist()
+            bounds = indptr.tolist()
+            self._voter_list = [
+                Voter._from_validated(candidates[start:end], weight)
+                for start, end, weight in zip(bounds, bounds[1:], weights)
+            ]
+            self._lazy_voters = None
+        return self._voter_list
+
+    @_voters.setter
+    def _voters(self, voters):
+        self._lazy_voters = None
+        self._voter_list = voters
+        # `True` if the list of voters is shared with a copy of this profile, see `copy()`
+        self._voters_shared = False
+
+    def _unshare_voters(self):
+        # copy-on-write: has to be called before the list of voters is modified in place
+        if self._voters_shared:
+            self._voters = list(self._voters)
+
+    def __getstate__(self):
+        # support pickling (e.g., to send profiles to worker processes):
+        # hash objects cannot be pickled, the content hash is recomputed when required
+        state = self.__dict__.copy()
+        state["_content_hasher"] = None
+        state["_voters_shared"] = False
+        return state
+
     @property
     def num_cand(self):  # number of candidates
         """Number of candidates."""
@@ -85,8 +287,152 @@ class Profile:
         return _approved_candidates
 
     def __len__(self):
+        if self._lazy_voters is not None:
+            return len(self._lazy_voters[0]) - 1
         return len(self._voters)
 
+    def _clear_cache(self):
+        # has to be called whenever `self._voters` is modified
+        self._approval_matrix = None
+        self._weight_vector = None
+        self._approval_bitmasks = None
+        self._approvers = None
+        self._ballot_types = None
+        self._aggregated_profile = None
+        self._content_hasher = None
+
+    @property
+    def approval_matrix(self):
+        """
+        Approval matrix of the profile (voters x candidates).
+
+        Entry `[v, cand]` is `1` if voter `v` approves candidate `cand` and `0` otherwise.
+
+        The matrix is computed when it is used for the first time and then cached.
+        The cache is cleared whenever the profile is modified via `add_voter()`, `add_voters()`,
+        `profile[i] = ...`, `convert_to_unit_weights()` or `convert_to_weighted()`.
+        Voters should not be modified in place, as this is not detected.
+
+        Returns
+        -------
+            numpy.ndarray
+                Array of shape `(len(profile), profile.num_cand)` and dtype `uint8`.
+
+        Examples
+        --------
+        .. doctest::
+
+            >>> profile = Profile(num_cand=3)
+            >>> profile.add_voters([[0, 1], [2]])
+            >>> print(profile.approval_matrix)
+            [[1 1 0]
+             [0 0 1]]
+        """
+        if self._approval_matrix is None:
+            matrix = np.zeros((len(self), self.num_cand), dtype=np.uint8)
+            if self._lazy_voters is not None:
+                indptr, indices, _ = self._lazy_voters
+                matrix[np.repeat(np.arange(len(self)), np.diff(indptr)), indices] = 1
+            else:
+                for v, voter in enumerate(self._voters):
+                    matrix[v, list(voter.approved)] = 1
+            matrix.flags.writeable = False
+            self._approval_matrix = matrix
+        return self._approval_matrix
+
+    @property
+    def weight_vector(self):
+        """
+        Weights of all voters as a vector (in the same order as the rows of `approval_matrix`).
+
+        The dtype is `int64` if all weights are integers, `float64` if all weights are integers
+        or floats, and `object` otherwise (e.g., for `Fraction` weights, which are kept exact).
+        Cached in the same way as `approval_matrix`.
+
+        Returns
+        -------
+            numpy.ndarray
+                Array of shape `(len(profile),)`.
+        """
+        if self._weight_vector is None:
+            self._weight_vector = _weight_array([voter.weight for voter in self._voters])
+        return self._weight_vector
+
+    @property
+    def approval_bitmasks(self):
+        """
+        Approval sets of all voters as integer bitmasks (see `misc.bitmask()`).
+
+        The i-th entry corresponds to voter `profile[i]`.
+        Cached in the same way as `approval_matrix`.
+
+        Returns
+        -------
+            tuple of int
+
+        Examples
+        --------
+        .. doctest::
+
+            >>> profile = Profile(num_cand=3)
+            >>> profile.add_voters([[0, 1], [2]])
+            >>> profile.approval_bitmasks
+            (3, 4)
+        """
+        if self._approval_bitmasks is None:
+            # pack the approval matrix into integers, 62 candidates at a time
+            bitmasks = [0] * len(self)
+            for offset in range(0, self.num_cand, 62):
+                block = self.approval_matrix[:, offset : offset + 62].astype(np.int64)
+                powers_of_two = 1 << np.arange(block.shape[1], dtype=np.int64)
+                block_bitmasks = (block @ powers_of_two).tolist()
+                bitmasks = [
+                    bitmask | (block_bitmask << offset)
+                    for bitmask, block_bitmask in zip(bitmasks, block_bitmasks)
+                ]
+            self._approval_bitmasks = tuple(bitmasks)
+        return self._approval_bitmasks
+
+    @property
+    def approvers(self):
+        """
+        Inverted index of the profile, i.e., the approvers of each candidate.
+
+        `profile.approvers[cand]` is a pair `(voter_indices, weights)` of tuples:
+        the (sorted) indices of all voters approving `cand` and their respective weights.
+        Cached in the same way as `approval_matrix`.
+
+        Returns
+        -------
+            tuple of (tuple of int, tuple)
+
+        Examples
+        --------
+        .. doctest::
+
+            >>> profile = Profile(num_cand=3)
+            >>> profile.add_voters([Voter([0, 1], weight=2), [1], [0, 2]])
+            >>> profile.approvers[0]
+            ((0, 2), (2, 1))
+            >>> profile.approvers[1]
+            ((0, 1), (2, 1))
+        """
+        if self._approvers is None:
+            if self._lazy_voters is not None:
+                weights = self._lazy_voters[2]
+            else:
+                weights = [voter.weight for voter in self._voters]
+            candidates, voter_indices = np.nonzero(self.approval_matrix.T)
+            bounds = [0] + np.cumsum(np.bincount(candidates, minlength=self.num_cand)).tolist()
+            voter_indices = voter_indices.tolist()
+            approvers = []
+            for start, end in zip(bounds, bounds[1:]):
+                cand_voter_indices = tuple(voter_indices[start:end])
+                cand_weights = tuple(weights[v] for v in cand_voter_indices)
+                approvers.append((cand_voter_indices, cand_weights))
+            self._approvers = tuple(approvers)
+        return self._approvers
+
     def _unique_voter(self, voter):
         # we ensure that each set in self._voters is a unique object even if
         # voter.approved might not be unique, because it is used as dict key
@@ -113,7 +459,21 @@ class Profile:
         """
 
         # ensure that new voter is unique
-        self._voters.append(self._unique_voter(voter))
+        voter = self._unique_voter(voter)
+        self._unshare_voters()
+        self._voters.append(voter)
+
+        # update the ballot-type index and the content hash incrementally
+        ballot_types = self._ballot_types
+        content_hasher = self._content_hasher
+        self._clear_cache()
+        bitmask = voter.bitmask()
+        if ballot_types is not None:
+            ballot_types[bitmask] = ballot_types.get(bitmask, 0) + voter.weight
+            self._ballot_types = ballot_types
+        if content_hasher is not None:
+            content_hasher.update(_ballot_hash_input(bitmask, voter.weight))
+            self._content_hasher = content_hasher
 
     def add_voters(self, voters):
         """
@@ -145,6 +505,48 @@ class Profile:
         """
         return sum(voter.weight for voter in self._voters)
 
+    def aggregated(self):
+        """
+        Return a weighted profile with one voter per distinct approval set (ballot type).
+
+        The weight of each voter is the total weight of all voters with this approval set.
+        Voters appear in the order of the first occurrence of their approval set.
+        The result is cached; the underlying index of ballot types is updated incrementally
+        when voters are added via `add_voter()` or `add_voters()`.
+
+        Returns
+        -------
+            Profile
+
+        Examples
+        --------
+        .. doctest::
+
+            >>> profile = Profile(num_cand=3)
+            >>> profile.add_voters([[0, 1], [2], [0, 1]])
+            >>> print(profile.aggregated())
+            weighted profile with 2 voters and 3 candidates:
+             voter 0:   2 * {0, 1},
+             voter 1:   1 * {2}
+        """
+        if self._aggregated_profile is None:
+            if self._ballot_types is None:
+                if self._lazy_voters is not None:
+                    weights = self._lazy_voters[2]
+                else:
+                    weights = [voter.weight for voter in self._voters]
+                ballot_types = {}
+                for key, weight in zip(self.approval_bitmasks, weights):
+                    ballot_types[key] = ballot_types.get(key, 0) + weight
+                self._ballot_types = ballot_types
+            aggregated_profile = Profile(self.num_cand, cand_names=self.cand_names)
+            aggregated_profile._voters = [
+                Voter(misc.candidates_from_bitmask(key), weight=weight)
+                for key, weight in self._ballot_types.items()
+            ]
+            self._aggregated_profile = aggregated_profile
+        return self._aggregated_profile
+
     def has_unit_weights(self):
         """
         Verify whether all voters in the profile have a weight of 1.
@@ -193,6 +595,7 @@ class Profile:
                     "Converting a profile to unit weights is only possible with integer weights."
                 )
         self._voters = new_voters
+        self._clear_cache()
 
     def convert_to_weighted(self):
         """
@@ -219,11 +622,8 @@ class Profile:
              voter 0:   2 * {0, 1},
              voter 1:   1 * {2}
         """
-        approval_sets = {tuple(sorted(voter.approved)) for voter in self._voters}
-        weights = {appr: 0 for appr in approval_sets}
-        for voter in self._voters:
-            weights[tuple(sorted(voter.approved))] += voter.weight
-        self._voters = [Voter(appr, weight=weight) for appr, weight in weights.items()]
+        self._voters = [Voter(voter.approved, weight=voter.weight) for voter in self.aggregated()]
+        self._clear_cache()
 
     def __iter__(self):
         return iter(self._voters)
@@ -241,7 +641,10 @@ class Profile:
         """
 
         # ensure that new voter is unique
-        self._voters[i] = self._unique_voter(voter)
+        voter = self._unique_voter(voter)
+        self._unshare_voters()
+        self._voters[i] = voter
+        self._clear_cache()
 
     def __str__(self):
         if self.has_unit_weights():
@@ -262,19 +665,93 @@ class Profile:
         """
         Return a copy of the profile.
 
-        This is a deep copy, i.e., all Voter objects are copied too.
+        The copy shares the list of voters (and all cached data) with this profile and only copies
+        it when one of the two profiles is modified (copy-on-write). Hence, copying takes constant
+        time. Note that Voter objects are shared as well and must not be modified in place.
 
         Returns
         -------
             Profile
         """
-        copy_profile = Profile(num_cand=self.num_cand)
-        copy_profile.add_voters(self._voters)
-        return copy_profile
+        return self._copy(Profile)
 
     __copy__ = copy
     __deepcopy__ = copy
 
+    def _copy(self, cls):
+        copy_profile = cls.__new__(cls)
+        copy_profile.candidates = list(self.candidates)
+        copy_profile.cand_names = list(self.cand_names)
+        copy_profile._voter_list = self._voter_list
+        copy_profile._lazy_voters = self._lazy_voters
+        copy_profile._voters_shared = self._voters_shared = True
+        # cached data is either immutable or copied
+        copy_profile._approval_matrix = self._approval_matrix
+        copy_profile._weight_vector = self._weight_vector
+        copy_profile._approval_bitmasks = self._approval_bitmasks
+        copy_profile._approvers = self._approvers
+        copy_profile._ballot_types = None
+        if self._ballot_types is not None:
+            copy_profile._ballot_types = dict(self._ballot_types)
+        copy_profile._aggregated_profile = None
+        copy_profile._content_hasher = None
+        if self._content_hasher is not None:
+            copy_profile._content_hasher = self._content_hasher.copy()
+        return copy_profile
+
+    def content_hash(self):
+        """
+        Return a hash of the content of the profile.
+
+        The hash covers `num_cand` as well as the approval sets and weights of all voters
+        (in this order). Weights are compared by value, i.e., `1`, `1.0` and `Fraction(1)` yield
+        the same hash. It is updated incrementally when voters are added, so computing it
+        takes constant time (unless the profile was modified otherwise).
+
+        Returns
+        -------
+            str
+                A SHA-256 hex digest.
+        """
+        if self._content_hasher is None:
+            if self._lazy_voters is not None:
+                weights = self._lazy_voters[2]
+            else:
+                weights = [voter.weight for voter in self._voters]
+            content_hasher = hashlib.sha256(f"{self.num_cand};".encode())
+            for bitmask, weight in zip(self.approval_bitmasks, weights):
+                content_hasher.update(_ballot_hash_input(bitmask, weight))
+            self._content_hasher = content_hasher
+        return self._content_hasher.hexdigest()
+
+    def freeze(self):
+        """
+        Return an immutable snapshot of the profile.
+
+        The snapshot is hashable (based on `content_hash()`) and can be used, e.g., as a cache key.
+        Creating it takes constant time, see `copy()`.
+
+        Returns
+        -------
+            FrozenProfile
+
+        Examples
+        --------
+        .. doctest::
+
+            >>> profile = Profile(num_cand=3)
+            >>> profile.add_voters([[0, 1], [2]])
+            >>> frozen = profile.freeze()
+            >>> profile.add_voter([1])
+            >>> len(frozen), len(profile)
+            (2, 3)
+            >>> frozen == profile.freeze()
+            False
+        """
+        frozen_profile = self._copy(FrozenProfile)
+        frozen_profile._frozen_content_hash = self.content_hash()
+        return frozen_profile
+
     def is_party_list(self):
         """
         Check whether this profile is a party-list profile.
@@ -323,6 +800,37 @@ class Profile:
         return output
 
 
+class FrozenProfile(Profile):
+    """
+    An immutable snapshot of a profile, created by `Profile.freeze()`.
+
+    Frozen profiles can be used like profiles, except that they cannot be modified.
+    Two frozen profiles are equal if they have the same content (see `Profile.content_hash()`).
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("FrozenProfile cannot be modified, use copy() to obtain a Profile.")
+
+    add_voter = _immutable
+    __setitem__ = _immutable
+    convert_to_unit_weights = _immutable
+    convert_to_weighted = _immutable
+
+    def content_hash(self):
+        return self._frozen_content_hash
+
+    def freeze(self):
+        return self
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenProfile):
+            return NotImplemented
+        return self._frozen_content_hash == other._frozen_content_hash
+
+    def __hash__(self):
+        return int(self._frozen_content_hash[:16], 16)
+
+
 class Voter:
     """
     A set of approved candidates by one voter.
@@ -371,6 +879,26 @@ class Voter:
         """
         return self.approved.str_with_names(cand_names)
 
+    def bitmask(self):
+        """
+        Return the set of approved candidates as an integer bitmask (see `misc.bitmask()`).
+
+        Returns
+        -------
+            int
+        """
+        return misc.bitmask(self.approved)
+
+    @classmethod
+    def _from_validated(cls, approved, weight):
+        # create a voter without the checks done by `__init__()`,
+        # used for bulk input that has already been validated (see `Profile.from_csr()`)
+        voter = cls.__new__(cls)
+        voter.approved = misc.CandidateSet.__new__(misc.CandidateSet)
+        voter.approved.update(approved)
+        voter.weight = weight
+        return voter
+
     # some shortcuts, removed for clarity
     #
     # def __len__(self):
@@ -378,3 +906,24 @@ class Voter:
     #
     # def __iter__(self):
     #     return iter(self.approved)
+
+
+def _weight_array(weights):
+    # convert a list of weights to a read-only numpy array, see `Profile.weight_vector`
+    if all(isinstance(weight, (int, np.integer)) for weight in weights):
+        vector = np.array(weights, dtype=np.int64)
+    elif all(isinstance(weight, (int, float, np.integer, np.floating)) for weight in weights):
+        vector = np.array(weights, dtype=np.float64)
+    else:
+        vector = np.empty(len(weights), dtype=object)
+        vector[:] = weights
+    vector.flags.writeable = False
+    return vector
+
+
+def _ballot_hash_input(bitmask, weight):
+    # the bytes describing one voter in `Profile.content_hash()`;
+    # weights are hashed as exact fractions, hence, e.g., 1, 1.0 and Fraction(1) are equivalent
+    if not isinstance(weight, int):
+        weight = Fraction(weight)
+    return f"{bitmask:x}:{weight.numerator}/{weight.denominator};".encode()
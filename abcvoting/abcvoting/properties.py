@@ -3,17 +3,21 @@ Axiomatic properties of committees.
 """
 
 # import gurobipy as gb
+import functools
 import itertools
 import math
+import operator
+import numpy as np
 from fractions import Fraction
 from abcvoting.output import output, WARNING
 from abcvoting.misc import str_set_of_candidates, CandidateSet, dominate, powerset
+from abcvoting.misc import bitmask, candidates_from_bitmask, popcount
+from abcvoting import ilp_model
 import pulp
-import json
-import js
+from abcvoting import ilp_backends
 
 def mySolve(model):
-    return json.loads(js.runHighs(model.writeLP()))
+    return ilp_backends.solve_pulp_model(model)
 
 
 ACCURACY = 1e-8  # 1e-9 causes problems (some unit tests fail)
@@ -734,6 +738,11 @@ def _check_EJR_brute_force(profile, committee, quota):
     # largest possible ell such that ell-cohesive groups can exist
     ell_upper_bound = int(profile.total_weight() / quota)
 
+    approval_bitmasks = profile.approval_bitmasks
+    committee_bitmask = bitmask(committee)
+    # number of approved candidates in committee, for each voter
+    satisfaction = [popcount(mask & committee_bitmask) for mask in approval_bitmasks]
+
     # loop through all possible ell
     for ell in range(1, ell_upper_bound + 1):
         # list of voters with less than ell approved candidates in committee
@@ -745,7 +754,7 @@ def _check_EJR_brute_force(profile, committee, quota):
 
         # compute list of voters to consider
         for i, voter in enumerate(profile):
-            if len(voter.approved & committee) < ell:
+            if satisfaction[i] < ell:
                 voters_less_than_ell_approved_candidates.append(i)
                 voters_less_than_ell_approved_candidates_weight += voter.weight
 
@@ -761,16 +770,16 @@ def _check_EJR_brute_force(profile, committee, quota):
             voters_less_than_ell_approved_candidates, min_group_size
         ):
             # compute set of candidates approved by all voters in combination
-            cut = set.intersection(*(profile[vi].approved for vi in combination))
+            cut = functools.reduce(operator.and_, (approval_bitmasks[vi] for vi in combination))
 
             # if size of cut is >= ell, then combination is an ell-cohesive group
-            if len(cut) >= ell:
+            if popcount(cut) >= ell:
                 # we have found combination to be an ell-cohesive set, with no voter having
                 # at least ell approved candidates in committee. Thus EJR fails
                 detailed_information = {
                     "cohesive_group": voters_less_than_ell_approved_candidates,
                     "ell": ell,
-                    "joint_candidates": cut,
+                    "joint_candidates": candidates_from_bitmask(cut),
                 }
                 return False, detailed_information
 
@@ -1109,14 +1118,16 @@ def _check_EJR_plus(profile, committee, quota):
     # largest possible ell such that ell-cohesive groups can exist
     ell_upper_bound = int(profile.total_weight() / quota)
 
+    committee_bitmask = bitmask(committee)
+    # number of approved candidates in committee, for each voter
+    utilities = [popcount(mask & committee_bitmask) for mask in profile.approval_bitmasks]
+
     for cand in profile.candidates:
         if cand in committee:
             continue
         supporters_by_utility = {ell: set() for ell in range(ell_upper_bound + 1)}
-        for vi, voter in enumerate(profile):
-            if cand in voter.approved:
-                utility = len(voter.approved & committee)
-                supporters_by_utility[utility].add(vi)
+        for vi in profile.approvers[cand][0]:
+            supporters_by_utility[utilities[vi]].add(vi)
 
         group = set()
         for ell in range(ell_upper_bound):
@@ -1740,18 +1751,23 @@ def _check_core_brute_force(profile, committee, quota):
 
     max_num_of_candidates = int(profile.total_weight() / quota)
 
+    approval_bitmasks = profile.approval_bitmasks
+    committee_bitmask = bitmask(committee)
+    # number of approved candidates in committee, for each voter
+    satisfaction = [popcount(mask & committee_bitmask) for mask in approval_bitmasks]
+
     for cands in powerset(profile.approved_candidates(), max_size=max_num_of_candidates):
-        cands = set(cands)
+        cands_bitmask = bitmask(cands)
         set_of_voters = [
             vi
-            for vi, voter in enumerate(profile)
-            if len(voter.approved & cands) > len(voter.approved & committee)
+            for vi, mask in enumerate(approval_bitmasks)
+            if popcount(mask & cands_bitmask) > satisfaction[vi]
         ]  # set of voters that would profit from `cands`
         if not set_of_voters:
             continue
         if len(cands) * quota <= sum(profile[vi].weight for vi in set_of_voters):
             # a sufficient number of voters would profit from deviating to `cands`
-            detailed_information = {"coalition": set_of_voters, "objection": cands}
+            detailed_information = {"coalition": set_of_voters, "objection": set(cands)}
             return False, detailed_information
     detailed_information = {}
     return True, detailed_information
@@ -1918,7 +1934,7 @@ def _check_pareto_optimality_pulp(profile, committee):
 
 def _check_EJR_pulp(profile, committee, quota):
     """
-    Test, by an ILP and the pulp solver, whether a committee satisfies EJR.
+    Test, by an ILP (built as an `ilp_model.MatrixModel`), whether a committee satisfies EJR.
 
     Parameters
     ----------
@@ -1932,65 +1948,65 @@ def _check_EJR_pulp(profile, committee, quota):
     bool
     """
 
-    # compute matrix-dictionary for voters approval
-    # approval_matrix[(voter, cand)] = 1 if cand is in voter's approval set
-    # approval_matrix[(voter, cand)] = 0 otherwise
-    approval_matrix = {}
-    for voter in profile:
-        for cand in profile.candidates:
-            if cand in voter.approved:
-                approval_matrix[(voter, cand)] = 1
-            else:
-                approval_matrix[(voter, cand)] = 0
+    approval_matrix = profile.approval_matrix
+    num_voters, num_cand = approval_matrix.shape
+    committeesize = len(committee)
+    in_committee = np.zeros(num_cand, dtype=np.int64)
+    in_committee[list(committee)] = 1
 
-    # create the model to be optimized
-    model = pulp.LpProblem("ejr_problem", pulp.LpMinimize)
+    # create the model to be optimized (no objective, any feasible solution will do)
+    model = ilp_model.MatrixModel("ejr_problem", maximize=False)
 
     # integer variable: ell
-    ell = pulp.LpVariable("ell", lowBound=1, upBound=len(committee), cat="Integer")
+    (ell,) = model.add_variables(1, 1, committeesize, integer=True)
 
     # binary variables: indicate whether a voter is inside the ell-cohesive group
-    in_group = [pulp.LpVariable(f"in_group_{i}", cat="Binary") for i in range(len(profile))]
+    in_group = model.add_variables(num_voters, 0, 1, integer=True)
+
+    # binary variables: indicate whether a candidate is approved by all voters in the group
+    in_cut = model.add_variables(num_cand, 0, 1, integer=True)
 
     # constraints: size of ell-cohesive group should be appropriate wrt. ell
-    model += pulp.lpSum(in_group) >= ell * float(quota)
+    model.add_constraint(
+        np.append(in_group, ell), np.append(np.ones(num_voters), -float(quota)), lower=0
+    )
 
     # constraints based on binary indicator variables:
     # if voter is in ell-cohesive group, then the voter should have
-    # strictly less than ell approved candidates in committee
-    for vi, voter in enumerate(profile):
-        model += len(voter.approved & committee) + 1 <= ell + (1 - in_group[vi]) * len(committee)
-
-    in_cut = [pulp.LpVariable(f"in_cut_{i}", cat="Binary") for i in range(profile.num_cand)]
+    # strictly less than ell approved candidates in committee, i.e.,
+    # ell - committeesize * in_group[voter] >= |approved & committee| + 1 - committeesize
+    model.add_constraints(
+        indptr=np.arange(0, 2 * num_voters + 1, 2),
+        indices=np.column_stack((np.full(num_voters, ell), in_group)).ravel(),
+        data=np.tile([1.0, -committeesize], num_voters),
+        lower=approval_matrix.astype(np.int64) @ in_committee + 1 - committeesize,
+    )
 
     # the voters in group should agree on at least ell candidates
-    model += pulp.lpSum(in_cut) >= ell
+    model.add_constraint(np.append(in_cut, ell), np.append(np.ones(num_cand), -1.0), lower=0)
 
-    # if a candidate is in the cut, then `approval_matrix[(voter, cand)]` *must be* 1 for all
+    # if a candidate is in the cut, then the candidate *must be* approved by all
     # voters inside the group
-    for voter_index, voter in enumerate(profile):
-        for cand in profile.candidates:
-            if approval_matrix[(voter, cand)] == 0:
-                model += in_cut[cand] + in_group[voter_index] <= 1.5  # not both true
-
-    # model.setObjective(ell, gb.GRB.MINIMIZE)
+    voters, cands = np.nonzero(approval_matrix == 0)
+    model.add_constraints(
+        indptr=np.arange(0, 2 * len(voters) + 1, 2),
+        indices=np.column_stack((in_cut[cands], in_group[voters])).ravel(),
+        data=np.ones(2 * len(voters)),
+        upper=1,  # not both true
+    )
 
     # solve the problem
-    solution = mySolve(model)
-    status = solution["Status"]
+    status, _, values = model.solve()
 
     # return value based on status code
     # status code "Optimal" means model was solved to optimality, thus an ell-cohesive group
     # that satisfies the condition of EJR was found
     if status == "Optimal":
-        value = {}
-        for v in solution["Columns"]:
-            value[v] = solution["Columns"][v]["Primal"]
-        cohesive_group = {vi for vi, _ in enumerate(profile) if value[in_group[vi].name] >= 0.9}
-        joint_candidates = {cand for cand in profile.candidates if value[in_cut[cand].name] >= 0.9}
+        cohesive_group = {vi for vi in range(num_voters) if values[in_group[vi]] >= 0.9}
+        joint_candidates = {cand for cand in profile.candidates if values[in_cut[cand]] >= 0.9}
         detailed_information = {
             "cohesive_group": cohesive_group,
-            "ell": round(value[ell.name]),
+            "ell": round(values[ell]),
             "joint_candidates": joint_candidates,
         }
         return False, detailed_information
@@ -2001,7 +2017,7 @@ def _check_EJR_pulp(profile, committee, quota):
         detailed_information = {}
         return True, detailed_information
 
-    raise RuntimeError(f"Pulp returned an unexpected status code: {status}")
+    raise RuntimeError(f"The ILP solver returned an unexpected status code: {status}")
 
 def _check_PJR_pulp(profile, committee, quota):
     """
@@ -1,9 +1,8 @@
 import pulp
-import json
-import js
+from abcvoting import ilp_backends
 
 def mySolve(model):
-    return json.loads(js.runHighs(model.writeLP()))
+    return ilp_backends.solve_pulp_model(model)
 
 def _check_pareto_optimality_pulp(profile, committee):
     """
@@ -5,8 +5,11 @@ try:
 except ImportError:
     from fractions import Fraction
 import functools
+import math
+import numbers
+import numpy as np
 # import networkx as nx
-from abcvoting.misc import hamming
+from abcvoting.misc import bitmask, hamming_bitmask
 
 
 class UnknownScoreFunctionError(ValueError):
@@ -61,6 +64,96 @@ def get_marginal_scorefct(scorefct_id, committeesize=None):
     raise UnknownScoreFunctionError(scorefct_id)
 
 
+class ScoreTable:
+    """
+    Precomputed marginal and cumulative scores of a Thiele score function.
+
+    Use `score_table()` to obtain (memoized) instances of this class.
+
+    Parameters
+    ----------
+        scorefct_id : str
+            A string identifying the score function.
+
+        max_size : int
+            The largest number of approved candidates in a committee that has to be covered.
+
+    Attributes
+    ----------
+        marginal : tuple
+            `marginal[i]` is the marginal score for the `i`-th approved candidate in the committee
+            (with `marginal[0] == 0`), as int or Fraction.
+
+        cumulative : tuple
+            `cumulative[i]` is the score of a voter with `i` approved candidates in the committee,
+            as int or Fraction.
+
+        marginal_float, cumulative_float : numpy.ndarray
+            The same values as floats.
+
+        denominator : int
+            The least common denominator of all scores (e.g., `lcm(1, ..., max_size)` for PAV).
+
+        marginal_scaled, cumulative_scaled : tuple of int
+            The scores multiplied by `denominator`, which are integers.
+            Comparing scaled scores avoids fractions altogether.
+    """
+
+    def __init__(self, scorefct_id, max_size):
+        marginal_scorefct = get_marginal_scorefct(scorefct_id, max_size)
+        self.scorefct_id = scorefct_id
+        self.max_size = max_size
+
+        marginal = [0] + [marginal_scorefct(i) for i in range(1, max_size + 1)]
+        cumulative = [0]
+        for score in marginal[1:]:
+            cumulative.append(cumulative[-1] + score)
+        self.marginal = tuple(marginal)
+        self.cumulative = tuple(cumulative)
+
+        self.marginal_float = np.array([float(score) for score in marginal])
+        self.marginal_float.flags.writeable = False
+        self.cumulative_float = np.array([float(score) for score in cumulative])
+        self.cumulative_float.flags.writeable = False
+
+        denominator = 1
+        for score in marginal:
+            denominator = _lcm(denominator, int(Fraction(score).denominator))
+        self.denominator = denominator
+        self.marginal_scaled = tuple(int(score * denominator) for score in marginal)
+        self.cumulative_scaled = tuple(int(score * denominator) for score in cumulative)
+
+
+@functools.lru_cache(maxsize=None)
+def score_table(scorefct_id, max_size):
+    """
+    Return precomputed marginal and cumulative scores of a Thiele score function.
+
+    The result is memoized, i.e., computed only once for each `scorefct_id` and `max_size`.
+
+    .. doctest::
+
+        >>> table = score_table("pav", 3)
+        >>> print(table.cumulative[3])
+        11/6
+        >>> table.denominator, table.cumulative_scaled
+        (6, (0, 6, 9, 11))
+
+    Parameters
+    ----------
+        scorefct_id : str
+            A string identifying the score function.
+
+        max_size : int
+            The largest number of approved candidates in a committee that has to be covered.
+
+    Returns
+    -------
+        ScoreTable
+    """
+    return ScoreTable(scorefct_id, max_size)
+
+
 def thiele_score(scorefct_id, profile, committee):
     """
     Compute Thiele score of a committee subject to a given scorefct_id.
@@ -83,16 +176,158 @@ def thiele_score(scorefct_id, profile, committee):
         int or Fraction
             The Thiele score using the score function given by `scorefct_id`.
     """
-    marginal_scorefct = get_marginal_scorefct(scorefct_id, len(committee))
+    cumulative_scores = score_table(scorefct_id, len(committee)).cumulative
+    satisfaction = _satisfaction_vector(profile, committee)
     score = 0
-    for vote in profile:
-        cand_in_com = 0
-        for _ in set(committee) & vote.approved:
-            cand_in_com += 1
-            score += vote.weight * marginal_scorefct(cand_in_com)
+    for cand_in_com in range(1, len(committee) + 1):
+        weight = _total_weight(profile.weight_vector[satisfaction == cand_in_com])
+        if weight:
+            score += weight * cumulative_scores[cand_in_com]
     return score
 
 
+def thiele_scores_batch(scorefct_id, profile, committees, exact=True):
+    """
+    Compute Thiele scores of many committees at once.
+
+    The number of approved candidates of every voter in every committee is computed as a
+    single matrix product (approval matrix times committee indicator matrix). These
+    satisfaction values are then mapped to scores via a table of cumulative scores.
+
+    Parameters
+    ----------
+        scorefct_id : str
+            Identifies the score function to be used.
+
+            `scorefct_id` has to be recognized by `abcvoting.scores.get_scorefct`.
+
+        profile : abcvoting.preferences.Profile
+            A profile.
+
+        committees : iterable of iterable of int
+            The committees (of arbitrary sizes).
+
+        exact : bool, default=True
+            Compute exact scores (same values as `thiele_score()`) or floats.
+
+            Exact scores are computed with integer arithmetic (scaled by the common denominator
+            of all cumulative scores). Floats are faster but not suitable to detect ties.
+
+    Returns
+    -------
+        list of int or Fraction, or numpy.ndarray
+            The Thiele scores of all committees, as a list if `exact=True` and as a float array
+            otherwise.
+    """
+    committees = [list(set(committee)) for committee in committees]
+    if not committees:
+        return [] if exact else np.zeros(0)
+    table = score_table(scorefct_id, max(len(committee) for committee in committees))
+    if not exact:
+        weights = np.array([float(weight) for weight in profile.weight_vector.tolist()])
+        return _thiele_scores_batch(table.cumulative_float, weights, profile, committees)
+
+    scaled_scores = scaled_thiele_scores_batch(table, profile, committees)
+    if table.denominator == 1:
+        return scaled_scores
+    return [
+        Fraction(score, table.denominator) if isinstance(score, int) else score / table.denominator
+        for score in scaled_scores
+    ]
+
+
+def scaled_thiele_scores_batch(table, profile, committees):
+    """
+    Compute Thiele scores of many committees at once, scaled by `table.denominator`.
+
+    The same as `thiele_scores_batch()` (with `exact=True`), but all scores are multiplied by
+    the common denominator of the score table. Hence, for integer weights, all scores are
+    integers and can be compared without any fractions.
+
+    Parameters
+    ----------
+        table : ScoreTable
+            The score table of the Thiele method, see `score_table()`.
+
+            `table.max_size` must not be smaller than the size of any committee.
+
+        profile : abcvoting.preferences.Profile
+            A profile.
+
+        committees : list of tuple or list of list
+            The committees (of arbitrary sizes, without duplicate candidates).
+
+    Returns
+    -------
+        list of int
+            The scaled Thiele scores (of type float or Fraction if weights are not integers).
+    """
+    weights = profile.weight_vector
+    numerators = table.cumulative_scaled
+    if weights.dtype == np.int64 and numerators[-1] * _total_weight(weights) < 2**63:
+        numerators = np.array(numerators, dtype=np.int64)
+    else:
+        # Python integers (and weights) avoid overflows
+        numerators = np.array(numerators, dtype=object)
+        weights = weights.astype(object)
+    return _thiele_scores_batch(numerators, weights, profile, committees).tolist()
+
+
+def _thiele_scores_batch(cumulative_scores, weights, profile, committees):
+    """
+    Weighted sum of `cumulative_scores[satisfaction]` for each committee (as numpy array).
+    """
+
+    approval_matrix = profile.approval_matrix.astype(np.int32)
+    # limit the size of intermediate (voters x committees) arrays
+    batch_size = max(1, 2**20 // max(1, len(profile)))
+    batch_scores = []
+    for start in range(0, len(committees), batch_size):
+        batch = committees[start : start + batch_size]
+        indicator = np.zeros((profile.num_cand, len(batch)), dtype=np.int32)
+        for i, committee in enumerate(batch):
+            indicator[committee, i] = 1
+        satisfaction = approval_matrix @ indicator
+        batch_scores.append(weights @ cumulative_scores[satisfaction])
+    return np.concatenate(batch_scores)
+
+
+def _lcm(x, y):
+    return x * y // math.gcd(x, y)
+
+
+def _satisfaction_vector(profile, committee):
+    """
+    Return the number of approved candidates in `committee` for every voter (as numpy array).
+    """
+    committee = list(set(committee))
+    if not committee:
+        return np.zeros(len(profile), dtype=np.int64)
+    return profile.approval_matrix[:, committee].sum(axis=1, dtype=np.int64)
+
+
+def _total_weight(weights):
+    """
+    Sum of a numpy array of voter weights, as a Python number (int, float or Fraction).
+    """
+    total = weights.sum()
+    if isinstance(total, np.generic):
+        total = total.item()
+    return total
+
+
+def _weighted_approval_counts(profile, voter_mask):
+    """
+    Return for every candidate the total weight of its approvers among voters in `voter_mask`.
+
+    The result is a list of Python numbers (of length `profile.num_cand`).
+    """
+    weights = profile.weight_vector[voter_mask]
+    if weights.dtype == object:
+        return list(np.dot(weights, profile.approval_matrix[voter_mask].astype(object)))
+    return np.dot(weights, profile.approval_matrix[voter_mask]).tolist()
+
+
 #
 # Thiele marginal score functions:
 #
@@ -289,6 +524,480 @@ def cumulative_score(marginal_scorefct, cand_in_com):
     return sum(marginal_scorefct(i + 1) for i in range(cand_in_com))
 
 
+class ThieleScoreState:
+    """
+    Incrementally updated satisfaction and marginal scores of a committee for a Thiele method.
+
+    Adding (or removing) a candidate only updates the satisfaction of its approvers and the
+    marginal scores of candidates approved by these voters. All scores are scaled by
+    `table.denominator` (see `ScoreTable`), so they are integers if all weights are integers.
+
+    Parameters
+    ----------
+        scorefct_id : str
+            Identifies the score function to be used.
+
+        profile : abcvoting.preferences.Profile
+            A profile.
+
+        max_size : int
+            The maximum number of approved candidates in the committee, for any voter
+            (e.g., the maximum size of the committee).
+
+        committee : iterable of int, optional
+            The initial committee.
+
+        lazy : bool, optional
+            Do not update `add_gains` and `remove_losses` when changing the committee.
+
+            In this case, both only contain the marginal scores with respect to the initial
+            committee; for Thiele methods with non-increasing marginal scores, `add_gains` are
+            upper bounds on the current marginal scores (use `gain()` to obtain the exact value).
+
+    Attributes
+    ----------
+        committee : set of int
+            The current committee.
+
+        satisfaction : list of int
+            The number of approved candidates in the committee, for each voter.
+
+        add_gains : list
+            The (scaled) marginal score increase from adding a candidate to the committee,
+            for each candidate. The entries of candidates in the committee are meaningless.
+
+        remove_losses : list
+            The (scaled) marginal score decrease from removing a candidate from the committee,
+            for each candidate. The entries of candidates not in the committee are meaningless.
+
+        table : ScoreTable
+            The score table used.
+    """
+
+    def __init__(self, scorefct_id, profile, max_size, committee=(), lazy=False):
+        self.table = score_table(scorefct_id, max_size + 1)
+        self.committee = set(committee)
+        self.lazy = lazy
+        self._approvers = profile.approvers
+        # approved candidates of each voter (only required to update marginal scores)
+        self._approved = None
+        if not lazy:
+            self._approved = [[] for _ in range(len(profile))]
+            for cand, (voter_indices, _) in enumerate(self._approvers):
+                for v in voter_indices:
+                    self._approved[v].append(cand)
+
+        satisfaction = _satisfaction_vector(profile, self.committee)
+        self.satisfaction = satisfaction.tolist()
+        marginal = self.table.marginal_scaled
+        self.add_gains = [0] * profile.num_cand
+        self.remove_losses = [0] * profile.num_cand
+        for level in np.unique(satisfaction).tolist():
+            if marginal[level + 1] == 0 and marginal[level] == 0:
+                continue
+            counts = _weighted_approval_counts(profile, satisfaction == level)
+            for cand, count in enumerate(counts):
+                if count:
+                    self.add_gains[cand] += count * marginal[level + 1]
+                    self.remove_losses[cand] += count * marginal[level]
+
+    def add(self, cand):
+        """
+        Add candidate `cand` to the committee.
+
+        Parameters
+        ----------
+            cand : int
+                A candidate that is not yet in the committee.
+        """
+        # after increasing the satisfaction of its approvers by one,
+        # the loss from removing `cand` equals the gain from adding it
+        gain = self.add_gains[cand]
+        self._update(cand, 1)
+        self.committee.add(cand)
+        self.remove_losses[cand] = gain
+
+    def remove(self, cand):
+        """
+        Remove candidate `cand` from the committee.
+
+        Parameters
+        ----------
+            cand : int
+                A candidate in the committee.
+        """
+        loss = self.remove_losses[cand]
+        self.committee.remove(cand)
+        self._update(cand, -1)
+        self.add_gains[cand] = loss
+
+    def _update(self, cand, change):
+        """
+        Change the satisfaction of all approvers of `cand` by `change` (+1 or -1) and update
+        the marginal scores of all other candidates approved by these voters.
+        """
+        marginal = self.table.marginal_scaled
+        satisfaction = self.satisfaction
+        if self.lazy:
+            for v in self._approvers[cand][0]:
+                satisfaction[v] += change
+            return
+        committee = self.committee
+        add_gains = self.add_gains
+        remove_losses = self.remove_losses
+        for v, weight in zip(*self._approvers[cand]):
+            old_level = satisfaction[v]
+            new_level = old_level + change
+            satisfaction[v] = new_level
+            gain_delta = weight * (marginal[new_level + 1] - marginal[old_level + 1])
+            loss_delta = weight * (marginal[new_level] - marginal[old_level])
+            if not gain_delta and not loss_delta:
+                continue
+            for approved_cand in self._approved[v]:
+                if approved_cand in committee:
+                    remove_losses[approved_cand] += loss_delta
+                else:
+                    add_gains[approved_cand] += gain_delta
+
+    def gain(self, cand):
+        """
+        Compute the (scaled) marginal score increase from adding `cand` to the committee.
+
+        In contrast to `add_gains`, this value is always computed from the current satisfaction
+        of the approvers of `cand`.
+
+        Parameters
+        ----------
+            cand : int
+                A candidate that is not in the committee.
+
+        Returns
+        -------
+            int or Fraction or float
+        """
+        marginal = self.table.marginal_scaled
+        satisfaction = self.satisfaction
+        return sum(
+            weight * marginal[satisfaction[v] + 1] for v, weight in zip(*self._approvers[cand])
+        )
+
+    def copy(self):
+        """
+        Return a copy of this state (to branch on different ways to change the committee).
+
+        Returns
+        -------
+            ThieleScoreState
+        """
+        state = ThieleScoreState.__new__(ThieleScoreState)
+        state.table = self.table
+        state.committee = set(self.committee)
+        state.lazy = self.lazy
+        state._approvers = self._approvers
+        state._approved = self._approved
+        state.satisfaction = list(self.satisfaction)
+        state.add_gains = list(self.add_gains)
+        state.remove_losses = list(self.remove_losses)
+        return state
+
+    def unscaled(self, score):
+        """
+        Convert a scaled score (e.g., an entry of `add_gains`) to the actual score.
+
+        Parameters
+        ----------
+            score : int or Fraction or float
+                A scaled score.
+
+        Returns
+        -------
+            int or Fraction or float
+        """
+        if self.table.denominator == 1:
+            return score
+        if isinstance(score, int):
+            return Fraction(score, self.table.denominator)
+        return score / self.table.denominator
+
+
+class PhragmenLoadState:
+    """
+    Loads of voters for sequential Phragmen, with the loads of approvers stored as floats.
+
+    The (weighted) total load of the approvers of each candidate is kept in a numpy vector.
+    Adding a candidate only updates this vector with the rows of the approval matrix that
+    belong to its approvers. The float values are used to find the candidates that might
+    minimize the new maximum load; for these few candidates the new maximum load is recomputed
+    from `load` with `division`, so results do not depend on rounding errors of the updates.
+
+    Parameters
+    ----------
+        profile : abcvoting.preferences.Profile
+            A profile.
+
+        load : list
+            The current load of each voter. This list is updated by `add()`.
+
+        division : callable
+            The function used for computing new loads (float division, `Fraction` or `mpq`).
+
+    Attributes
+    ----------
+        load : list
+            The current load of each voter.
+    """
+
+    # relative distance to the minimum in which candidates are recomputed
+    # (orders of magnitude larger than rounding errors of the incremental updates)
+    _TOLERANCE = 1e-9
+
+    def __init__(self, profile, load, division):
+        self.load = load
+        self._division = division
+        self._approvers = profile.approvers
+        self._matrix = profile.approval_matrix
+        self._weights = profile.weight_vector.astype(float)
+        self._approvers_weight = self._weights @ self._matrix
+        self._load_vector = np.array(load, dtype=float)
+        self._max_abs_load = float(np.abs(self._load_vector).max(initial=0))
+        if self._max_abs_load > 0:
+            self._approvers_load = (self._weights * self._load_vector) @ self._matrix
+        else:
+            self._approvers_load = np.zeros(profile.num_cand)
+
+    def new_maxloads(self, committee, committeesize):
+        """
+        Compute the new maximum load for all candidates that possibly minimize it.
+
+        Parameters
+        ----------
+            committee : iterable of int
+                The current committee (these candidates are not considered).
+
+            committeesize : int
+                The desired committee size (candidates without approvers have a new maximum
+                load of `committeesize + 1`).
+
+        Returns
+        -------
+            dict
+                A dictionary mapping candidates to their new maximum load. Contains all
+                candidates with minimum new maximum load (and possibly other candidates).
+        """
+        has_approvers = self._approvers_weight > 0
+        values = np.full(len(has_approvers), float(committeesize + 1))
+        np.divide(
+            self._approvers_load + 1, self._approvers_weight, out=values, where=has_approvers
+        )
+        values[list(committee)] = np.inf
+        best = values.min()
+        tolerance = self._TOLERANCE * (1 + abs(best) + self._max_abs_load)
+        return {
+            cand: self._new_maxload(cand, committeesize)
+            for cand in np.flatnonzero(values <= best + tolerance).tolist()
+        }
+
+    def _new_maxload(self, cand, committeesize):
+        voter_indices, weights = self._approvers[cand]
+        if not voter_indices:
+            return committeesize + 1
+        approvers_load = sum(weight * self.load[v] for v, weight in zip(voter_indices, weights))
+        return self._division(approvers_load + 1, sum(weights))
+
+    def add(self, cand, new_load):
+        """
+        Add candidate `cand`, i.e., set the load of all its approvers to `new_load`.
+
+        Parameters
+        ----------
+            cand : int
+                A candidate.
+
+            new_load : int or float or Fraction
+                The new load of the approvers of `cand` (as returned by `new_maxloads()`).
+        """
+        voter_indices = self._approvers[cand][0]
+        if not voter_indices:
+            return
+        indices = np.array(voter_indices)
+        new_load_float = float(new_load)
+        change = self._weights[indices] * (new_load_float - self._load_vector[indices])
+        self._approvers_load += change @ self._matrix[indices]
+        self._load_vector[indices] = new_load_float
+        self._max_abs_load = max(self._max_abs_load, abs(new_load_float))
+        for v in voter_indices:
+            self.load[v] = new_load
+
+
+class ExactPhragmenLoadState:
+    """
+    Loads of voters for sequential Phragmen, computed exactly with integers.
+
+    All loads are integer numerators over a common denominator. Voters with the same load form
+    a group (one group for each distinct initial load and a new group for the approvers of each
+    added candidate), hence a change of the common denominator only rescales the numerators of
+    groups and the approver loads of candidates. The weighted number of approvers of each
+    candidate within a group is counted with numpy; all other operations use Python integers
+    and candidates are compared by cross-multiplication.
+
+    Requires rational weights and loads (see `is_applicable()`). Parameters and attributes are
+    the same as for `PhragmenLoadState`.
+    """
+
+    def __init__(self, profile, load, division):
+        self.load = load
+        self._division = division
+        self._approvers = profile.approvers
+        self._matrix = profile.approval_matrix
+        # weights are scaled by `self._weight_denominator` to obtain integers
+        self._weights, self._weight_denominator = _integer_weights(profile)
+        self._approvers_weight = (self._weights @ self._matrix).tolist()
+
+        group_ids = {}
+        self._groups = np.array(
+            [group_ids.setdefault(value, len(group_ids)) for value in load], dtype=np.int64
+        )
+        denominators = [int(value.denominator) for value in group_ids]
+        self._denominator = functools.reduce(_lcm, denominators, 1)
+        self._numerators = [
+            int(value.numerator) * (self._denominator // denominator)
+            for value, denominator in zip(group_ids, denominators)
+        ]
+        # (scaled) numerators of the total load of the approvers of each candidate
+        self._approvers_load = [0] * profile.num_cand
+        nonzero_groups = [group for group, numerator in enumerate(self._numerators) if numerator]
+        if nonzero_groups:
+            voter_indices = np.flatnonzero(np.isin(self._groups, nonzero_groups))
+            for group, counts in zip(*self._group_counts(voter_indices)):
+                numerator = self._numerators[group]
+                self._approvers_load = [
+                    total + numerator * count for total, count in zip(self._approvers_load, counts)
+                ]
+
+    @staticmethod
+    def is_applicable(profile, load):
+        """
+        Return whether all voter weights and loads are rational numbers (not floats).
+
+        Parameters
+        ----------
+            profile : abcvoting.preferences.Profile
+                A profile.
+
+            load : list
+                The load of each voter.
+
+        Returns
+        -------
+            bool
+        """
+        return _integer_weights(profile) is not None and all(
+            isinstance(value, numbers.Rational) for value in load
+        )
+
+    def _group_counts(self, voter_indices):
+        # the groups of the given voters and, for each group, the (scaled) weight of
+        # the voters in `voter_indices` and this group that approve each candidate
+        groups, inverse = np.unique(self._groups[voter_indices], return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        voter_indices = voter_indices[order]
+        starts = np.searchsorted(inverse[order], np.arange(len(groups)))
+        weighted = self._matrix[voter_indices] * self._weights[voter_indices, np.newaxis]
+        return groups.tolist(), np.add.reduceat(weighted, starts, axis=0).tolist()
+
+    def _fraction(self, cand, committeesize):
+        # the new maximum load of `cand` as pair (numerator, denominator)
+        if self._approvers_weight[cand] == 0:
+            return committeesize + 1, 1
+        return (
+            self._approvers_load[cand] + self._denominator * self._weight_denominator,
+            self._denominator * self._approvers_weight[cand],
+        )
+
+    def new_maxloads(self, committee, committeesize):
+        """
+        Compute the new maximum load for all candidates that minimize it.
+
+        See `PhragmenLoadState.new_maxloads()`; the returned dictionary contains exactly the
+        candidates with minimum new maximum load.
+        """
+        committee = set(committee)
+        best_numerator, best_denominator = None, None
+        tied_cands = []
+        for cand in range(len(self._approvers_load)):
+            if cand in committee:
+                continue
+            numerator, denominator = self._fraction(cand, committeesize)
+            if best_numerator is not None:
+                difference = numerator * best_denominator - best_numerator * denominator
+                if difference > 0:
+                    continue
+                if difference == 0:
+                    tied_cands.append(cand)
+                    continue
+            best_numerator, best_denominator = numerator, denominator
+            tied_cands = [cand]
+        new_maxload = {}
+        for cand in tied_cands:
+            if self._approvers_weight[cand] > 0:
+                new_maxload[cand] = self._division(*self._fraction(cand, committeesize))
+            else:
+                new_maxload[cand] = committeesize + 1
+        return new_maxload
+
+    def add(self, cand, new_load):
+        """
+        Add candidate `cand`, i.e., set the load of all its approvers to `new_load`.
+
+        See `PhragmenLoadState.add()`.
+        """
+        voter_indices = self._approvers[cand][0]
+        if not voter_indices:
+            return
+        numerator, denominator = self._fraction(cand, None)
+        divisor = math.gcd(numerator, denominator)
+        numerator, denominator = numerator // divisor, denominator // divisor
+        common_denominator = _lcm(self._denominator, denominator)
+        if common_denominator != self._denominator:
+            factor = common_denominator // self._denominator
+            self._numerators = [value * factor for value in self._numerators]
+            self._approvers_load = [value * factor for value in self._approvers_load]
+            self._denominator = common_denominator
+        new_numerator = numerator * (common_denominator // denominator)
+
+        indices = np.array(voter_indices)
+        for group, counts in zip(*self._group_counts(indices)):
+            change = new_numerator - self._numerators[group]
+            if change:
+                self._approvers_load = [
+                    total + change * count for total, count in zip(self._approvers_load, counts)
+                ]
+        self._groups[indices] = len(self._numerators)
+        self._numerators.append(new_numerator)
+        for v in voter_indices:
+            self.load[v] = new_load
+
+
+def _integer_weights(profile):
+    """
+    Return voter weights scaled to integers (as int64 array) and the scaling factor.
+
+    Returns `None` if the weights are not rational or too large.
+    """
+    weights = profile.weight_vector
+    if weights.dtype == object and all(isinstance(w, numbers.Rational) for w in weights):
+        factor = functools.reduce(_lcm, (int(w.denominator) for w in weights), 1)
+        scaled_weights = [int(w * factor) for w in weights]
+    elif weights.dtype == np.int64:
+        factor = 1
+        scaled_weights = weights.tolist()
+    else:
+        return None
+    if sum(scaled_weights) >= 2**63:
+        return None
+    return np.array(scaled_weights, dtype=np.int64), factor
+
+
 def marginal_thiele_scores_add(marginal_scorefct, profile, committee):
     """
     Return marginal score increases from adding one candidate to the committee.
@@ -314,10 +1023,16 @@ def marginal_thiele_scores_add(marginal_scorefct, profile, committee):
             Marginal score increases from adding candidates to the committee.
     """
     marginal = [0] * profile.num_cand
-    for voter in profile:
-        intersectionsize = len(voter.approved.intersection(committee))
-        for cand in voter.approved:
-            marginal[cand] += voter.weight * marginal_scorefct(intersectionsize + 1)
+    satisfaction = _satisfaction_vector(profile, committee)
+    # voters with the same satisfaction contribute the same marginal score per candidate
+    for intersectionsize in np.unique(satisfaction).tolist():
+        marginal_score = marginal_scorefct(intersectionsize + 1)
+        if marginal_score == 0:
+            continue
+        counts = _weighted_approval_counts(profile, satisfaction == intersectionsize)
+        for cand, count in enumerate(counts):
+            if count:
+                marginal[cand] += count * marginal_score
     for cand in committee:
         marginal[cand] = -1
     return marginal
@@ -349,10 +1064,15 @@ def marginal_thiele_scores_remove(marginal_scorefct, profile, committee):
     """
     marg_util_cand = [0] * profile.num_cand
     #  marginal utility gained by adding candidate to the committee
-    for voter in profile:
-        satisfaction = len(voter.approved.intersection(committee))
-        for cand in voter.approved:
-            marg_util_cand[cand] += voter.weight * marginal_scorefct(satisfaction)
+    satisfaction_vector = _satisfaction_vector(profile, committee)
+    for satisfaction in np.unique(satisfaction_vector).tolist():
+        marginal_score = marginal_scorefct(satisfaction)
+        if marginal_score == 0:
+            continue
+        counts = _weighted_approval_counts(profile, satisfaction_vector == satisfaction)
+        for cand, count in enumerate(counts):
+            if count:
+                marg_util_cand[cand] += count * marginal_score
     for cand in profile.candidates:
         if cand not in committee:
             # do not choose candidates that already have been removed
@@ -494,12 +1214,10 @@ def minimaxav_score(profile, committee):
         int
             The Minimax AV score of `committee`.
     """
-    score = 0
-    for voter in profile:
-        hamdistance = hamming(voter.approved, committee)
-        if hamdistance > score:
-            score = hamdistance
-    return score
+    committee_bitmask = bitmask(committee)
+    return max(
+        (hamming_bitmask(mask, committee_bitmask) for mask in profile.approval_bitmasks), default=0
+    )
 
 
 def num_voters_with_upper_bounded_hamming_distance(upperbound, profile, committee):
@@ -522,4 +1240,9 @@ def num_voters_with_upper_bounded_hamming_distance(upperbound, profile, committe
         int
             The number of voters having a Hamming distance <= `upperbound`.
     """
-    return len([voter for voter in profile if hamming(voter.approved, committee) <= upperbound])
+    committee_bitmask = bitmask(committee)
+    return sum(
+        1
+        for mask in profile.approval_bitmasks
+        if hamming_bitmask(mask, committee_bitmask) <= upperbound
+    )
@@ -2,26 +2,31 @@
 Unit tests for abcvoting/abcrules*.py.
 """
 import pytest
+import logging
 import os
 import re
 import random
 from abcvoting.abcrules_gurobi import _gurobi_thiele_methods
 from abcvoting.output import VERBOSITY_TO_NAME, WARNING, INFO, DETAILS, DEBUG, output
 from abcvoting.preferences import Profile, Voter
-from abcvoting import abcrules, misc, fileio
+from abcvoting import abcrules, abcrules_pulp, misc, fileio, scores
 from itertools import combinations
+from fractions import Fraction
 
 MARKS = {
     "gurobi": [pytest.mark.gurobipy],
     "ortools-cp": [pytest.mark.ortools],
     "mip-cbc": [pytest.mark.mip, pytest.mark.mipcbc],
     "mip-gurobi": [pytest.mark.mip, pytest.mark.mipgurobi],
+    "pulp": [],
     "brute-force": [],
     "branch-and-bound": [],
     "standard": [],
+    "lazy-greedy": [],
     "standard-fractions": [],
     "gmpy2-fractions": [pytest.mark.gmpy2],
     "float-fractions": [],
+    "auto-exact": [],
     "fastest": [],
 }
 random.seed(24121838)
@@ -1026,6 +1031,76 @@ def test_minimaxphragmen_does_not_use_lexicographic_optimization(algorithm):
     assert len(committees) == 12
 
 
+@pytest.mark.parametrize("rule_id, algorithm, resolute", testrules.rule_algorithm_resolute)
+def test_abcrules_aggregated_profile(rule_id, algorithm, resolute):
+    if rule_id not in abcrules._WEIGHT_INVARIANT_RULE_IDS:
+        return
+    profile = Profile(5)
+    profile.add_voters([[0, 1], [0, 1], [2], [0, 1], [2, 3], [4], [2, 3], [1, 4], [2]])
+    committeesize = 2
+    aggregated_profile = profile.aggregated()
+    assert len(aggregated_profile) == 5
+    assert aggregated_profile.total_weight() == profile.total_weight()
+
+    rule = abcrules.Rule(rule_id)
+    committees = rule.compute_fct(profile, committeesize, algorithm=algorithm, resolute=resolute)
+    committees_aggregated = rule.compute_fct(
+        aggregated_profile, committeesize, algorithm=algorithm, resolute=resolute
+    )
+    assert committees == committees_aggregated
+
+
+@pytest.mark.parametrize(
+    "rule_id",
+    [
+        "minimaxav",
+        "lexminimaxav",
+        "minimaxphragmen",
+        "leximaxphragmen",
+        "monroe",
+        "maximin-support",
+    ],
+)
+@pytest.mark.parametrize(
+    "approval_sets, committeesize",
+    [([[0, 1], [0, 1], [2, 4]], 2), ([[1], [1], [1], [2], [2], [0, 2]], 1)],
+)
+def test_compute_rules_with_a_constraint_per_voter(rule_id, approval_sets, committeesize):
+    # the ILPs of these rules have one row per voter; compute() aggregates duplicate ballots
+    # only for rules that are not affected by this
+    profile = Profile(5)
+    profile.add_voters(approval_sets)
+    assert len(profile.aggregated()) < len(profile)
+    committees = abcrules.compute(
+        rule_id, profile, committeesize, resolute=False, preferfractions=False
+    )
+    rule = abcrules.Rule(rule_id)
+    assert committees == rule.compute_fct(profile, committeesize, algorithm="pulp", resolute=False)
+    if rule_id == "leximaxphragmen":
+        # e.g., the load vector (1, 1/2, 1/2) of {0, 2} is better than (1, 1, 0) of {0, 1};
+        # this is not the case if the two voters approving {0, 1} are aggregated to one voter
+        assert committees == (
+            [{0, 2}, {0, 4}, {1, 2}, {1, 4}] if committeesize == 2 else [{1}, {2}]
+        )
+
+
+def test_compute_aggregates_only_without_detailed_output(capfd):
+    # the load distribution of seq-Phragmén contains one entry per voter
+    profile = Profile(3)
+    profile.add_voters([[0], [0], [1], [0, 2]])
+    committeesize = 2
+    output.set_verbosity(verbosity=DETAILS)
+    try:
+        committees = abcrules.compute(
+            "seqphragmen", profile, committeesize, resolute=True, preferfractions=False
+        )
+    finally:
+        output.set_verbosity(verbosity=WARNING)
+    assert committees == [{0, 1}]
+    out = capfd.readouterr().out
+    assert "(0.3333333333333333, 0.3333333333333333, 1.0, 0.3333333333333333)" in out
+
+
 @pytest.mark.parametrize(
     "rule_id, algorithm, resolute, profile, profilename, expected_result, committeesize",
     testinsts.instances,
@@ -1091,6 +1166,244 @@ def test_abcrules_correct_with_max_num_of_committees(
         assert comm in expected_result
 
 
+def test_thiele_branchandbound_large_instance():
+    profile = Profile(40)
+    profile.add_voters([random.sample(range(40), random.randint(1, 8)) for _ in range(200)])
+    committeesize = 10
+    committees, detailed_info = abcrules._thiele_methods_branchandbound(
+        "pav", profile, committeesize, resolute=False
+    )
+    assert detailed_info["num_nodes"] > 0
+    assert detailed_info["num_pruned"] > 0
+    opt_scores = {scores.thiele_score("pav", profile, committee) for committee in committees}
+    assert len(opt_scores) == 1
+    seqpav_committee = abcrules.compute_seqpav(profile, committeesize)[0]
+    assert opt_scores.pop() >= scores.thiele_score("pav", profile, seqpav_committee)
+
+
+@pytest.mark.parametrize("rule_id", ["pav", "cc", "lexcc", "minimaxav", "lexminimaxav", "monroe"])
+@pytest.mark.parametrize("resolute", [True, False])
+def test_bruteforce_with_workers(rule_id, resolute):
+    profile = Profile(8)
+    profile.add_voters([random.sample(range(8), random.randint(1, 4)) for _ in range(12)])
+    rule = abcrules.Rule(rule_id)
+    committees = rule.compute_fct(profile, 3, algorithm="brute-force", resolute=resolute)
+    assert committees == rule.compute_fct(
+        profile, 3, algorithm="brute-force", resolute=resolute, workers=2
+    )
+
+
+def test_thiele_kernel():
+    # candidate 4 is dominated by candidates 0, 1, 2 and 3, candidate 5 is not approved,
+    # candidate 0 dominates all other candidates
+    profile = Profile(6)
+    profile.add_voters([[0, 1, 2, 3, 4], [0, 1], [0, 2, 3], [0, 3], [0, 1, 2]])
+    reduced_profile, kept_cands, forced_cands = abcrules._thiele_methods_kernel("pav", profile, 3)
+    assert kept_cands == [0, 1, 2, 3]
+    assert forced_cands == (0,)
+    assert reduced_profile.num_cand == 4
+    assert abcrules._thiele_methods_kernel("cc", profile, 3) is None
+
+
+@pytest.mark.parametrize("algorithm", ["branch-and-bound", "brute-force"])
+@pytest.mark.parametrize("rule_id", ["pav", "slav"])
+def test_thiele_kernel_same_committees(rule_id, algorithm):
+    profile = Profile(10)
+    profile.add_voters([random.sample(range(8), random.randint(1, 4)) for _ in range(15)])
+    profile.add_voter(list(range(10)))
+    committees = abcrules.compute_thiele_method(rule_id, profile, 3, algorithm=algorithm)
+    if algorithm == "branch-and-bound":
+        expected_committees, _ = abcrules._thiele_methods_branchandbound(
+            rule_id, profile, 3, resolute=False
+        )
+    else:
+        expected_committees, _ = abcrules._thiele_methods_bruteforce(
+            rule_id, profile, 3, resolute=False
+        )
+    assert committees == expected_committees
+
+
+@pytest.mark.parametrize("rule_id", ["cc", "minimaxav", "monroe"])
+def test_pulp_clone_classes(rule_id, monkeypatch):
+    # candidates 0, 1, 2 are clones, candidates 3 and 4 are clones, 5-9 are not approved
+    profile = Profile(10)
+    profile.add_voters([[0, 1, 2], [0, 1, 2, 3, 4], [3, 4], [3, 4]])
+    assert abcrules_pulp._clone_classes(profile) == [[0, 1, 2], [3, 4], [5, 6, 7, 8, 9]]
+
+    num_solves = 0
+
+    def counting(solve):
+        def counting_solve(session):
+            nonlocal num_solves
+            num_solves += 1
+            return solve(session)
+
+        return counting_solve
+
+    for session_class in [abcrules_pulp._PulpSession, abcrules_pulp._MatrixSession]:
+        monkeypatch.setattr(session_class, "solve", counting(session_class.solve))
+    rule = abcrules.Rule(rule_id)
+    committees = rule.compute_fct(profile, 2, algorithm="pulp", resolute=False)
+    if rule_id == "monroe":
+        # brute-force Monroe requires Monroe scores, which are stubbed (return 0) in this tree
+        # because they need networkx; hence, brute-force Monroe returns all committees here
+        assert committees == [{0, 3}, {0, 4}, {1, 3}, {1, 4}, {2, 3}, {2, 4}]
+    else:
+        assert committees == rule.compute_fct(profile, 2, algorithm="brute-force", resolute=False)
+    # one solve per number of candidates chosen from each class of clones (plus the final one)
+    assert 0 < num_solves < len(committees) + 1
+
+
+@pytest.mark.parametrize("rule_id", ["pav", "cc", "minimaxav", "lexcc"])
+def test_pulp_optimal_face(rule_id, monkeypatch):
+    profile = Profile(8)
+    profile.add_voters([[0, 1], [1, 2], [2, 3], [3, 4], [4, 5], [5, 6], [6, 7], [7, 0], [0, 4]])
+    rule = abcrules.Rule(rule_id)
+    num_solves = 0
+
+    def counting(solve):
+        def counting_solve(session):
+            nonlocal num_solves
+            num_solves += 1
+            return solve(session)
+
+        return counting_solve
+
+    for session_class in [abcrules_pulp._PulpSession, abcrules_pulp._MatrixSession]:
+        monkeypatch.setattr(session_class, "solve", counting(session_class.solve))
+
+    committees = rule.compute_fct(profile, 3, algorithm="pulp", resolute=False)
+    assert committees == rule.compute_fct(profile, 3, algorithm="brute-force", resolute=False)
+    assert len(committees) > 1
+    num_solves_all_committees = num_solves
+
+    # committees are enumerated lazily
+    num_solves = 0
+    first_committees = rule.compute_fct(
+        profile, 3, algorithm="pulp", resolute=False, max_num_of_committees=1
+    )
+    assert len(first_committees) == 1 and first_committees[0] in committees
+    assert num_solves < num_solves_all_committees
+
+
+@pytest.mark.parametrize("rule_id", ["minimaxphragmen", "leximaxphragmen"])
+@pytest.mark.parametrize("num_cand", [3, 5])
+def test_pulp_optimal_face_float_objective(rule_id, num_cand):
+    # the objective values in the optimal face may be (slightly) better than the first optimum;
+    # leximaxphragmen additionally requires exact integrality (big-M constraints)
+    profile = Profile(num_cand)
+    profile.add_voters([[1], [2], [0, 2], [2], [1], [1]])
+    rule = abcrules.Rule(rule_id)
+    committees = rule.compute_fct(profile, 1, algorithm="pulp", resolute=False)
+    assert committees == [{1}, {2}]
+
+
+def test_pulp_session():
+    profile = Profile(4)
+    profile.add_voters([[0, 1], [1, 2], [3]])
+    session = abcrules_pulp._PulpSession(profile, "test")
+    in_committee = session.in_committee
+    session.model += in_committee[0] + in_committee[1] + in_committee[2] + in_committee[3] == 2
+    session.model.setObjective(2 * in_committee[1] + in_committee[3])
+    status, objective_value, in_committee_values = session.solve()
+    assert status == "Optimal"
+    assert objective_value == pytest.approx(3)
+    assert in_committee_values == pytest.approx([0, 1, 0, 1])
+
+    # constraints added later are appended to the same model
+    session.model += in_committee[3] == 0
+    assert session.lp_text() == session.model.writeLP()
+    _, objective_value, _ = session.solve()
+    assert objective_value == pytest.approx(2)
+    assert abcrules_pulp.mySolve(session.model)["ObjectiveValue"] == pytest.approx(2)
+
+
+@pytest.mark.parametrize("error", [False, True])
+def test_pulp_session_lp_text_fallback(error, monkeypatch):
+    # if the cached LP file differs from `writeLP()` (or cannot be created), `writeLP()` is used
+    def cached_lp_text(session):
+        if error:
+            raise AttributeError
+        return "wrong"
+
+    monkeypatch.setattr(abcrules_pulp._PulpSession, "_cached_lp_text", cached_lp_text)
+    profile = Profile(4)
+    profile.add_voters([[0, 1], [1, 2], [3]])
+    session = abcrules_pulp._PulpSession(profile, "test")
+    in_committee = session.in_committee
+    session.model += in_committee[0] + in_committee[1] + in_committee[2] + in_committee[3] == 2
+    session.model.setObjective(2 * in_committee[1] + in_committee[3])
+    for _ in range(2):
+        assert session.lp_text() == session.model.writeLP()
+    assert session.solve()[1] == pytest.approx(3)
+
+
+def test_matrix_session():
+    profile = Profile(4)
+    profile.add_voters([[0, 1], [0, 1], [2]])
+    session = abcrules_pulp._MatrixSession(profile, "test")
+    assert session.clone_classes == [[0, 1], [2], [3]]
+    in_committee = session.in_committee
+    session.model.add_constraint(in_committee, [1, 1, 1, 1], 2, 2)
+    session.model.arrays()["objective"][in_committee] = [2, 2, 1, 0]
+    status, objective_value, in_committee_values = session.solve()
+    assert status == "Optimal"
+    assert objective_value == pytest.approx(4)
+    assert in_committee_values == pytest.approx([1, 1, 0, 0])
+
+    # {1, 2} is excluded by symmetry breaking (candidate 1 is a clone of candidate 0)
+    bounds = session.candidate_bounds()
+    session.fix_candidates({1: 0, 2: 0}, bounds)
+    _, objective_value, in_committee_values = session.solve()
+    assert objective_value == pytest.approx(2)
+    assert in_committee_values == pytest.approx([1, 0, 0, 1])
+    session.fix_candidates({0: 0, 3: 0}, bounds)
+    assert session.solve()[0] == "Infeasible"
+
+    session.fix_candidates({}, bounds)
+    session.fix_objective(3)
+    _, objective_value, in_committee_values = session.solve()
+    assert objective_value == pytest.approx(4)
+
+
+@pytest.mark.parametrize("rule_id", ["pav", "slav", "cc", "geom3"])
+def test_thiele_local_search(rule_id):
+    profile = Profile(12)
+    profile.add_voters([random.sample(range(12), random.randint(1, 5)) for _ in range(30)])
+    committeesize = 4
+    rule = abcrules.Rule(rule_id)
+    committees = rule.compute_fct(profile, committeesize, algorithm="local-search", resolute=True)
+    assert len(committees) == 1 and len(committees[0]) == committeesize
+
+    committee, detailed_info = abcrules._thiele_methods_localsearch(
+        rule_id, profile, committeesize
+    )
+    assert committee == committees
+    opt_committee = rule.compute_fct(profile, committeesize, algorithm="brute-force")[0]
+    opt_score = scores.thiele_score(rule_id, profile, opt_committee)
+    assert detailed_info["score"] == scores.thiele_score(rule_id, profile, committee[0])
+    assert detailed_info["score"] <= opt_score <= detailed_info["upper_bound"]
+    assert detailed_info["gap"] == detailed_info["upper_bound"] - detailed_info["score"]
+    seq_committee = abcrules.compute_seq_thiele_method(rule_id, profile, committeesize)[0]
+    assert detailed_info["score"] >= scores.thiele_score(rule_id, profile, seq_committee)
+
+    start_committee, detailed_info = abcrules._thiele_methods_localsearch(
+        rule_id, profile, committeesize, max_iterations=0
+    )
+    assert detailed_info["stopping_reason"] == "iteration limit"
+    assert start_committee == abcrules.compute_thiele_method(
+        rule_id, profile, committeesize, algorithm="local-search", resolute=True, max_iterations=0
+    )
+    _, detailed_info = abcrules._thiele_methods_localsearch(
+        rule_id, profile, committeesize, time_limit=0
+    )
+    assert detailed_info["stopping_reason"] == "time limit"
+
+    with pytest.raises(NotImplementedError):
+        rule.compute_fct(profile, committeesize, algorithm="local-search", resolute=False)
+    assert "local-search" not in rule.algorithms
+
+
 def test_seqphragmen_irresolute():
     profile = Profile(3)
     profile.add_voters([[0, 1], [0, 1], [0], [1, 2], [2]])
@@ -1102,6 +1415,159 @@ def test_seqphragmen_irresolute():
     assert committees == [{0, 2}]
 
 
+@pytest.mark.parametrize("algorithm", ["float-fractions", "standard-fractions"])
+def test_seqphragmen_small_weights(algorithm):
+    # loads larger than `committeesize + 2`, candidates must not be chosen twice
+    profile = Profile(3)
+    profile.add_voters([Voter([0], weight=Fraction(1, 10)), Voter([1], weight=Fraction(1, 10))])
+    committees, detailed_info = abcrules._seqphragmen_resolute(profile, 3, algorithm)
+    assert committees == [[0, 1, 2]]
+    assert detailed_info["next_cand"] == [2, 0, 1]
+
+
+@pytest.mark.parametrize(
+    "rule_id", ["seqphragmen", "equal-shares", "phragmen-enestroem", "consensus-rule"]
+)
+@pytest.mark.parametrize("resolute", [True, False])
+def test_auto_exact_near_ties(rule_id, resolute):
+    # candidates 0 and 1 are not tied, but floats are too close to notice
+    profile = Profile(3)
+    profile.add_voters(
+        [Voter([0], weight=10**13), Voter([1], weight=10**13 + 1), Voter([2], weight=2)]
+    )
+    rule = abcrules.Rule(rule_id)
+    committees = rule.compute_fct(profile, 1, algorithm="auto-exact", resolute=resolute)
+    assert committees == [{1}]
+    assert committees == rule.compute_fct(
+        profile, 1, algorithm="standard-fractions", resolute=resolute
+    )
+    assert rule.compute_fct(profile, 1, algorithm="float-fractions", resolute=resolute) != [{1}]
+
+
+def test_seqphragmen_auto_exact_resolves_ties_per_round():
+    # near ties are resolved with exact loads in the round in which they occur
+    # (`_NearTie` is not raised, which would require to recompute all rounds)
+    profile = Profile(4)
+    profile.add_voters(
+        [Voter([0, 1], weight=10**13), Voter([1, 2], weight=10**13 + 1), Voter([3], weight=3)]
+        + [Voter([3])] * 3
+    )
+    committees, detailed_info = abcrules._seqphragmen_resolute(profile, 3, "auto-exact")
+    expected_committees, expected_detailed_info = abcrules._seqphragmen_resolute(
+        profile, 3, "standard-fractions"
+    )
+    assert committees == expected_committees
+    assert detailed_info["tied_cands"] == expected_detailed_info["tied_cands"]
+    assert detailed_info["max_load"] == pytest.approx(expected_detailed_info["max_load"])
+
+
+@pytest.mark.parametrize(
+    "rule_id",
+    [
+        "seqphragmen",
+        "equal-shares",
+        "equal-shares-with-av-completion",
+        "phragmen-enestroem",
+        "consensus-rule",
+        "eph",
+    ],
+)
+@pytest.mark.parametrize("resolute", [True, False])
+def test_auto_exact_resolves_exact_ties_per_round(monkeypatch, rule_id, resolute):
+    # exact ties and budgets that are exactly zero are resolved with exact fractions in the
+    # round in which they occur, the computation does not start over with exact fractions
+    def auto_exact_without_fallback(algorithm_fct, algorithm, **kwargs):
+        return algorithm_fct(algorithm=algorithm, **kwargs)
+
+    profile = Profile(5)
+    profile.add_voters([[0, 1], [0, 1], [2, 3], [2, 3], [0], [2], [4]])
+    rule = abcrules.Rule(rule_id)
+    if resolute not in rule.resolute_values:
+        return
+    expected_committees = rule.compute_fct(
+        profile, 3, algorithm="standard-fractions", resolute=resolute
+    )
+    monkeypatch.setattr(abcrules, "_auto_exact", auto_exact_without_fallback)
+    committees = rule.compute_fct(profile, 3, algorithm="auto-exact", resolute=resolute)
+    assert committees == expected_committees
+
+
+@pytest.mark.parametrize("algorithm", ["float-fractions", "standard-fractions"])
+def test_equal_shares_costs(algorithm):
+    # every round, the candidate with the smallest maximum cost per voter `q` is bought
+    # (the costs of all candidates increase, candidates are re-evaluated lazily)
+    profile = Profile(5)
+    profile.add_voters(
+        [
+            Voter([0, 1], weight=3),
+            Voter([0, 2], weight=Fraction(1, 2)),
+            Voter([1, 2, 3]),
+            Voter([2, 3], weight=2),
+            Voter([3, 4]),
+            Voter([4], weight=Fraction(3, 2)),
+        ]
+    )
+    committees, detailed_info = abcrules._equal_shares_algorithm(
+        profile, 4, algorithm, resolute=True, completion=None
+    )
+    assert detailed_info["cost"] == sorted(detailed_info["cost"])
+    budget = detailed_info["start_budget"]
+    for next_cand, cost, new_budget in zip(
+        detailed_info["next_cand"], detailed_info["cost"], detailed_info["budget"]
+    ):
+        for cand in profile.candidates:
+            voters, weights = profile.approvers[cand]
+            payment = sum(min(budget[v], cost * weight) for v, weight in zip(voters, weights))
+            if cand == next_cand:
+                assert payment == pytest.approx(1)
+            elif cand not in committees[0]:
+                assert payment < 1 or payment == pytest.approx(1)
+        assert sum(budget.values()) - sum(new_budget.values()) == pytest.approx(1)
+        budget = new_budget
+
+
+@pytest.mark.parametrize("weights", [[1] * 7, [2, 1, 3, 1, Fraction(1, 2), 2, Fraction(5, 2)]])
+def test_equal_shares_next_budget(weights):
+    # the committee does not change for per-voter budgets smaller than `next_budget`
+    profile = Profile(6)
+    profile.add_voters(
+        [
+            Voter(approved, weight=weight)
+            for approved, weight in zip(
+                [[0, 1], [0, 2], [1, 2, 3], [2, 3], [3, 4], [4, 5], [5]], weights
+            )
+        ]
+    )
+    committeesize = 4
+    total_weight = profile.total_weight()
+    per_voter_budgets = [Fraction(i, 4 * total_weight) for i in range(4, 4 * 8)]
+    num_changes = 0
+    for per_voter_budget in per_voter_budgets:
+        committee, next_budget = abcrules._equal_shares_next_budget(
+            profile, committeesize, per_voter_budget
+        )
+        _, detailed_info = abcrules._equal_shares_algorithm(
+            profile,
+            committeesize,
+            "standard-fractions",
+            resolute=True,
+            completion=None,
+            per_voter_budget=per_voter_budget,
+        )
+        assert committee == detailed_info["next_cand"]
+        assert next_budget is None or next_budget > per_voter_budget
+        for larger_budget in per_voter_budgets:
+            if per_voter_budget < larger_budget and (
+                next_budget is None or larger_budget < next_budget
+            ):
+                larger_committee, _ = abcrules._equal_shares_next_budget(
+                    profile, committeesize, larger_budget
+                )
+                assert larger_committee == committee
+        num_changes += next_budget is not None
+    assert num_changes > 0
+
+
 def test_seqpav_irresolute():
     profile = Profile(3)
     profile.add_voters([[0, 1]] * 3 + [[0], [1, 2], [2], [2]])
@@ -1114,6 +1580,63 @@ def test_seqpav_irresolute():
     assert committees == [{0, 2}]
 
 
+def test_parallel_universes():
+    # all candidates are tied in every round
+    num_calls = 0
+
+    def tied_successors(committee, state):
+        nonlocal num_calls
+        num_calls += 1
+        return [(cand, state + (cand,)) for cand in range(5) if cand not in committee]
+
+    committees = list(abcrules._parallel_universes(3, tied_successors, start_state=()))
+    assert len(committees) == 10
+    assert committees[0] == ((0, 1, 2), (0, 1, 2))
+    assert len({frozenset(committee) for committee, _ in committees}) == 10
+    # every partial committee is processed only once (1 + 5 + 10 partial committees)
+    assert num_calls == 16
+
+    # states that depend on the order of candidates are distinguished
+    num_calls = 0
+    committees = list(
+        abcrules._parallel_universes(3, tied_successors, start_state=(), canonical_state=tuple)
+    )
+    assert len(committees) == 60
+    assert num_calls == 1 + 5 + 20
+
+    # committees are generated lazily
+    num_calls = 0
+    assert next(abcrules._parallel_universes(3, tied_successors, start_state=())) == (
+        (0, 1, 2),
+        (0, 1, 2),
+    )
+    assert num_calls == 3
+
+
+@pytest.mark.parametrize("scorefct_id", ["pav", "slav", "cc", "geom3"])
+def test_seq_thiele_lazy_greedy(scorefct_id):
+    for _ in range(50):
+        num_cand = random.randint(3, 10)
+        profile = Profile(num_cand)
+        profile.add_voters(
+            [
+                Voter(random.sample(range(num_cand), random.randint(0, 3)), random.randint(1, 3))
+                for _ in range(random.randint(1, 20))
+            ]
+        )
+        committeesize = random.randint(1, num_cand)
+        assert abcrules._seq_thiele_lazy_resolute(
+            scorefct_id, profile, committeesize
+        ) == abcrules._seq_thiele_resolute(scorefct_id, profile, committeesize)
+
+
+def test_seq_thiele_lazy_greedy_requires_nonincreasing_scores():
+    profile = Profile(3)
+    profile.add_voters([[0, 1], [0, 1], [2]])
+    with pytest.raises(ValueError, match="non-increasing marginal scores"):
+        abcrules.compute_seq_thiele_method("geom0.5", profile, 2, algorithm="lazy-greedy")
+
+
 @pytest.mark.parametrize("parameter", [1.001, "1.1", 1.5, 5, 10, 100.901, "100.901"])
 @pytest.mark.parametrize("resolute", [True, False])
 @pytest.mark.parametrize(
@@ -1483,6 +2006,22 @@ def test_output(capfd, rule_id, algorithm, resolute, verbosity):
         output.set_verbosity(verbosity=WARNING)
 
 
+@pytest.mark.parametrize(
+    "rule_id, algorithm", [("seqpav", "lazy-greedy"), ("revseqpav", "standard")]
+)
+def test_detailed_output_to_logger(monkeypatch, rule_id, algorithm):
+    # messages are passed to the logger independent of the verbosity
+    messages = []
+    logger = logging.getLogger("test_detailed_output_to_logger")
+    logger.setLevel(logging.DEBUG)
+    monkeypatch.setattr(logger, "log", lambda level, msg: messages.append(msg))
+    monkeypatch.setattr(output, "logger", logger)
+    profile = Profile(3)
+    profile.add_voters([[0], [0, 1], [2]])
+    abcrules.Rule(rule_id).compute_fct(profile, 2, algorithm=algorithm, resolute=True)
+    assert any("a total of" in msg for msg in messages)
+
+
 @pytest.mark.parametrize("rule_id, algorithm", testrules.rule_algorithm_onlyresolute)
 @pytest.mark.parametrize("max_num_of_committees", [-1, 0, 1, "None"])
 def test_resolute_and_max_num_of_committees(rule_id, algorithm, max_num_of_committees):
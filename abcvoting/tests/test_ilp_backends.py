@@ -0,0 +1,86 @@
+"""
+Unit tests for abcvoting/ilp_backends.py.
+"""
+
+import numpy as np
+import pulp
+import pytest
+from abcvoting import abcrules, ilp_backends
+from abcvoting.ilp_model import MatrixModel
+from abcvoting.preferences import Profile
+
+
+@pytest.fixture(params=ilp_backends.available_backends)
+def backend(request, monkeypatch):
+    monkeypatch.setattr(ilp_backends, "active_backend", ilp_backends.BACKENDS[request.param])
+    return request.param
+
+
+def test_solve_pulp_model(backend):
+    model = pulp.LpProblem("test", pulp.LpMaximize)
+    x = [pulp.LpVariable(f"x_{i}", cat=pulp.LpBinary) for i in range(3)]
+    y = pulp.LpVariable("y", lowBound=0, upBound=2.5)
+    model += pulp.lpSum(x) <= 2
+    model += x[0] + x[1] <= 1
+    model += y <= 2 * x[2]
+    model += 3 * x[0] + 2 * x[1] + 2 * x[2] + y
+    solution = ilp_backends.solve_pulp_model(model)
+    assert solution["Status"] == "Optimal"
+    assert solution["ObjectiveValue"] == pytest.approx(7)
+    values = {name: column["Primal"] for name, column in solution["Columns"].items()}
+    assert values["x_0"] == pytest.approx(1)
+    assert values["x_2"] == pytest.approx(1)
+    assert values["y"] == pytest.approx(2)
+
+    model += x[2] + y >= 4
+    assert ilp_backends.solve_pulp_model(model)["Status"] == "Infeasible"
+
+
+def test_solve_matrix_model(backend):
+    model = MatrixModel("test", maximize=False)
+    x = model.add_variables(3, 0, 1, integer=True, objective=[1, 2, 3])
+    y = model.add_variables(1, -np.inf, np.inf, objective=-1)
+    model.add_constraint(x, [1, 1, 1], lower=2)
+    model.add_constraint([x[0], y[0]], [1, -1], lower=0, upper=0)
+    status, objective_value, values = model.solve()
+    assert status == "Optimal"
+    assert objective_value == pytest.approx(2)
+    assert values.tolist() == pytest.approx([1, 1, 0, 1])
+
+    model.set_bounds(x[:2], 0, 0)
+    assert model.solve() == ("Infeasible", None, None)
+
+
+@pytest.mark.parametrize("rule_id", ["pav", "cc", "minimaxav", "lexcc"])
+def test_backends_compute_same_committees(backend, rule_id):
+    profile = Profile(6)
+    profile.add_voters([[0, 1, 2], [0, 1], [1, 3], [3, 4], [4, 5], [5]])
+    rule = abcrules.Rule(rule_id)
+    assert rule.compute_fct(profile, 3, algorithm="pulp", resolute=False) == rule.compute_fct(
+        profile, 3, algorithm="brute-force", resolute=False
+    )
+
+
+@pytest.mark.skipif("highspy" not in ilp_backends.available_backends, reason="requires highspy")
+def test_highspy_tolerances():
+    # HiGHS by default accepts a relative gap of 1e-4 as optimal
+    highs = ilp_backends._HighspyBackend._highs()
+    for option in ["mip_feasibility_tolerance", "mip_rel_gap", "mip_abs_gap"]:
+        _, value = highs.getOptionValue(option)
+        assert value <= ilp_backends.ACCURACY
+
+
+def test_set_backend(monkeypatch):
+    monkeypatch.setattr(ilp_backends, "active_backend", ilp_backends.active_backend)
+    for name in ilp_backends.available_backends:
+        ilp_backends.set_backend(name)
+        assert ilp_backends.active_backend.name == name
+    with pytest.raises(ValueError):
+        ilp_backends.set_backend("unknown-solver")
+
+
+def test_no_backend_available(monkeypatch):
+    monkeypatch.setattr(ilp_backends, "active_backend", None)
+    assert "pulp" not in abcrules._available_algorithms()
+    with pytest.raises(RuntimeError):
+        ilp_backends.solve_pulp_model(pulp.LpProblem("test"))
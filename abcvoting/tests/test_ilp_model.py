@@ -0,0 +1,71 @@
+"""
+Unit tests for abcvoting/ilp_model.py.
+"""
+
+import numpy as np
+import pytest
+from abcvoting.ilp_model import MatrixModel
+
+
+def test_arrays():
+    model = MatrixModel("test")
+    x = model.add_variables(2, 0, 1, integer=True, objective=[1, 2])
+    y = model.add_variables(1, -np.inf, np.inf)
+    model.add_constraints([0, 2, 3], [x[0], x[1], y[0]], [1, 1, 1], upper=[1, 5])
+    model.add_constraint([y[0], x[0]], [1, -1], lower=0, upper=0)
+    arrays = model.arrays()
+    assert arrays["col_lower"].tolist() == [0, 0, -np.inf]
+    assert arrays["integrality"].tolist() == [True, True, False]
+    assert arrays["objective"].tolist() == [1, 2, 0]
+    assert arrays["indptr"].tolist() == [0, 2, 3, 5]
+    assert arrays["indices"].tolist() == [0, 1, 2, 2, 0]
+    assert arrays["data"].tolist() == [1, 1, 1, 1, -1]
+    assert arrays["row_lower"].tolist() == [-np.inf, -np.inf, 0]
+    assert arrays["row_upper"].tolist() == [1, 5, 0]
+
+    # blocks added after merging are appended
+    model.add_constraint([x[1]], [1], lower=1)
+    assert model.arrays()["indptr"].tolist() == [0, 2, 3, 5, 6]
+    assert model.num_rows == 4
+
+
+def test_lp_text():
+    model = MatrixModel("test", maximize=False)
+    x = model.add_variables(2, 0, 3, integer=True, objective=[1, -1])
+    model.add_variables(1, -np.inf, np.inf)
+    model.add_constraint(x, [2, 1], lower=1, upper=4)
+    model.add_constraint(x, [1, -1], lower=0, upper=0)
+    assert model.lp_text() == (
+        "\\* test *\\\n"
+        "Minimize\n"
+        "obj: + 1 x0 - 1 x1\n"
+        "Subject To\n"
+        "c0: + 2 x0 + 1 x1 >= 1\n"
+        "c0_upper: + 2 x0 + 1 x1 <= 4\n"
+        "c1: + 1 x0 - 1 x1 = 0\n"
+        "Bounds\n"
+        " 0 <= x0 <= 3\n"
+        " 0 <= x1 <= 3\n"
+        " x2 free\n"
+        "Generals\n"
+        "x0\n"
+        "x1\n"
+        "End\n"
+    )
+
+
+def test_solve():
+    model = MatrixModel("test")
+    x = model.add_variables(3, 0, 1, integer=True, objective=[3, 2, 2])
+    model.add_constraint(x, [1, 1, 1], upper=2)
+    model.add_constraint(x[:2], [1, 1], upper=1)
+    status, objective_value, values = model.solve()
+    assert status == "Optimal"
+    assert objective_value == pytest.approx(5)
+    assert values.tolist() == pytest.approx([1, 0, 1])
+
+    model.set_bounds(x[0], 0, 0)
+    model.add_constraint(x, [1, 1, 1], lower=3)
+    status, objective_value, values = model.solve()
+    assert status == "Infeasible"
+    assert objective_value is None and values is None
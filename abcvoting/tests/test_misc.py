@@ -3,6 +3,7 @@ Unit tests for abcvoting/misc.py.
 """
 
 import pytest
+import itertools
 from abcvoting import misc
 from abcvoting.preferences import Profile
 
@@ -18,6 +19,30 @@ from abcvoting.preferences import Profile
 )
 def test_hamming(a, b, dist):
     assert misc.hamming(a, b) == dist
+    assert misc.hamming_bitmask(misc.bitmask(a), misc.bitmask(b)) == dist
+
+
+@pytest.mark.parametrize("candidates", [set(), {0}, {1, 3, 4}, {0, 63, 64, 100}])
+def test_bitmask(candidates):
+    mask = misc.bitmask(candidates)
+    assert misc.popcount(mask) == len(candidates)
+    assert misc.candidates_from_bitmask(mask) == candidates
+    assert misc.CandidateSet(candidates).bitmask() == mask
+    other = {1, 4, 64, 65}
+    assert misc.candidates_from_bitmask(mask & misc.bitmask(other)) == candidates & other
+    assert misc.candidates_from_bitmask(mask | misc.bitmask(other)) == candidates | other
+
+
+@pytest.mark.parametrize("n,k", [(1, 1), (5, 2), (7, 3), (8, 8)])
+def test_unrank_combination(n, k):
+    combinations = list(itertools.combinations(range(n), k))
+    for rank, combination in enumerate(combinations):
+        assert misc.unrank_combination(rank, n, k) == combination
+    for start in range(len(combinations) + 1):
+        stop = start + 3
+        assert list(misc.combinations_range(n, k, start, stop)) == combinations[start:stop]
+    with pytest.raises(ValueError):
+        misc.unrank_combination(len(combinations), n, k)
 
 
 def test_compare_list_of_committees():
@@ -6,7 +6,7 @@ import io
 import logging
 import pytest
 
-from abcvoting.output import Output, VERBOSITY_TO_NAME, DETAILS, INFO
+from abcvoting.output import Output, VERBOSITY_TO_NAME, DEBUG2, DETAILS, INFO, WARNING
 
 
 @pytest.mark.parametrize("verbosity", VERBOSITY_TO_NAME.keys())
@@ -78,3 +78,20 @@ def test_logger(capfd, verbosity):
     assert "info\n" in logger_output_str
     assert "details\n" in logger_output_str
     assert "debug2\n" in logger_output_str
+
+
+def test_is_enabled(monkeypatch):
+    monkeypatch.setattr("abcvoting.output.js", None)  # messages are not passed to Pyodide
+    output = Output(verbosity=INFO)
+    assert output.is_enabled(WARNING)
+    assert output.is_enabled(INFO)
+    assert not output.is_enabled(DETAILS)
+
+    # messages are passed to the logger independent of the verbosity
+    logger = logging.getLogger("testoutput_is_enabled")
+    logger.setLevel(logging.DEBUG)
+    output = Output(verbosity=INFO, logger=logger)
+    assert output.is_enabled(DETAILS)
+    assert output.is_enabled(DEBUG2)
+    logger.setLevel(logging.INFO)
+    assert not output.is_enabled(DETAILS)
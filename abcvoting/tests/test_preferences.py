@@ -3,6 +3,8 @@ Unit tests for abcvoting/preferences.py.
 """
 
 import pytest
+import pickle
+from fractions import Fraction
 from abcvoting.preferences import Profile, Voter
 from abcvoting.misc import CandidateSet
 
@@ -156,9 +158,163 @@ def test_copy_profile():
     for voter, voter_copy in zip(profile, copy):
         assert voter.approved == voter_copy.approved
         assert voter.weight == voter_copy.weight
-        assert voter is not voter_copy
     copy.add_voter(Voter([4], 2))
     assert len(profile) != len(copy)
+    profile[0] = Voter([6])
+    assert copy[0].approved == {1, 3, 5}
+    assert profile.approval_matrix.tolist() != copy.approval_matrix[:2].tolist()
+
+
+def test_freeze_profile():
+    profile = Profile(10)
+    profile.add_voters([[1, 3, 5], Voter([2], 3)])
+    frozen = profile.freeze()
+    assert frozen == profile.freeze()
+    assert hash(frozen) == hash(profile.freeze())
+    assert frozen.content_hash() == profile.content_hash()
+    with pytest.raises(TypeError):
+        frozen.add_voter([1])
+    with pytest.raises(TypeError):
+        frozen[0] = [1]
+
+    # the content hash is independent of how the profile was created
+    profile2 = Profile.from_csr([0, 3, 4], [1, 3, 5, 2], weights=[1, 3], num_cand=10)
+    assert profile2.freeze() == frozen
+    profile2.add_voter([4])
+    assert profile2.freeze() != frozen
+    profile.add_voter([4])
+    assert profile2.freeze() == profile.freeze()
+    assert len(frozen) == 2
+
+    # the content hash is recomputed after other modifications
+    profile[2] = [3]
+    profile2[2] = [3]
+    assert profile.freeze() == profile2.freeze()
+    assert profile.content_hash() != Profile(11).content_hash()
+
+    # the content hash depends on the values of weights, not on their types
+    hashes = set()
+    for weight in [1, 1.0, Fraction(1)]:
+        profile3 = Profile(3)
+        profile3.add_voters([Voter([0, 1], weight), Voter([2], weight / 2)])
+        hashes.add(profile3.content_hash())
+    assert len(hashes) == 1
+    profile3.add_voter(Voter([2], 0.1))
+    profile4 = profile3.copy()
+    profile4[2] = Voter([2], Fraction(1, 10))
+    assert profile3.content_hash() != profile4.content_hash()
+    unfrozen = frozen.copy()
+    unfrozen.add_voter([1])
+    assert len(unfrozen) == 3 and len(frozen) == 2
+
+
+def test_pickle_profile():
+    profile = Profile(5)
+    profile.add_voters([[0, 1], Voter([2, 4], 2)])
+    profile.approvers  # cached data is pickled as well
+    unpickled = pickle.loads(pickle.dumps(profile))
+    assert unpickled.content_hash() == profile.content_hash()
+    assert unpickled.approvers == profile.approvers
+    assert pickle.loads(pickle.dumps(profile.freeze())) == profile.freeze()
+    unpickled.add_voter([3])
+    assert unpickled.freeze() != profile.freeze()
+    assert len(profile) == 2
+
+
+def test_approval_matrix():
+    profile = Profile(4)
+    profile.add_voters([[0, 1], [2]])
+    assert profile.approval_matrix.tolist() == [[1, 1, 0, 0], [0, 0, 1, 0]]
+    assert profile.weight_vector.tolist() == [1, 1]
+    assert profile.approval_matrix is profile.approval_matrix
+    profile.add_voter(Voter([1, 3], 2))
+    assert profile.approval_matrix.tolist() == [[1, 1, 0, 0], [0, 0, 1, 0], [0, 1, 0, 1]]
+    assert profile.weight_vector.tolist() == [1, 1, 2]
+    profile[1] = Voter([3], 0.5)
+    assert profile.approval_matrix.tolist() == [[1, 1, 0, 0], [0, 0, 0, 1], [0, 1, 0, 1]]
+    assert profile.weight_vector.tolist() == [1, 0.5, 2]
+    profile.add_voters([[0, 1]])
+    profile.convert_to_weighted()
+    assert len(profile.approval_matrix) == len(profile.weight_vector) == 3
+    assert sum(profile.weight_vector.tolist()) == 4.5
+    with pytest.raises(ValueError):
+        profile.approval_matrix[0, 0] = 0
+
+
+@pytest.mark.parametrize("weights", [None, [2, 1, 3], [0.5, 1.5, 2], [Fraction(1, 3), 1, 2]])
+def test_from_approval_matrix_and_csr(weights):
+    approval_sets = [{0, 2}, set(), {1, 2, 3}]
+    expected = Profile(4)
+    if weights is None:
+        expected.add_voters(approval_sets)
+    else:
+        expected.add_voters(Voter(appr, weight) for appr, weight in zip(approval_sets, weights))
+    matrix = [[1, 0, 1, 0], [0, 0, 0, 0], [0, 1, 1, 1]]
+    profile1 = Profile.from_approval_matrix(matrix, weights=weights)
+    profile2 = Profile.from_csr([0, 2, 2, 5], [0, 2, 1, 2, 3], weights=weights, num_cand=4)
+    for profile in [profile1, profile2]:
+        assert len(profile) == 3
+        assert profile.approval_matrix.tolist() == matrix
+        assert profile.weight_vector.tolist() == expected.weight_vector.tolist()
+        assert profile._lazy_voters is not None
+        for voter, expected_voter in zip(profile, expected):
+            assert voter.approved == expected_voter.approved
+            assert voter.weight == expected_voter.weight
+            assert type(voter.weight) is type(expected_voter.weight)
+        assert profile._lazy_voters is None
+        assert str(profile) == str(expected)
+    profile = Profile.from_approval_matrix(matrix, cand_names="abcd")
+    assert profile.cand_names == ["a", "b", "c", "d"]
+    profile2.add_voter([0])
+    assert len(profile2) == 4
+
+
+@pytest.mark.parametrize(
+    "matrix,weights", [([[0, 2]], None), ([0, 1], None), ([[0, 1]], [0]), ([[0, 1]], [1, 1])]
+)
+def test_invalid_approval_matrix(matrix, weights):
+    with pytest.raises(ValueError):
+        Profile.from_approval_matrix(matrix, weights=weights)
+
+
+@pytest.mark.parametrize(
+    "indptr,indices,num_cand",
+    [([0, 2], [0, 0], None), ([0, 2], [0, 1], 1), ([0, 1], [-1], None), ([1, 2], [0, 1], None)],
+)
+def test_invalid_csr(indptr, indices, num_cand):
+    with pytest.raises(ValueError):
+        Profile.from_csr(indptr, indices, num_cand=num_cand)
+
+
+def test_aggregated():
+    profile = Profile(4)
+    profile.add_voters([[0, 1], [2], [1, 0]])
+    aggregated = profile.aggregated()
+    assert [(voter.approved, voter.weight) for voter in aggregated] == [({0, 1}, 2), ({2}, 1)]
+    assert profile.aggregated() is aggregated
+    profile.add_voter(Voter([2], weight=3))
+    profile.add_voter([3])
+    aggregated = profile.aggregated()
+    assert [(voter.approved, voter.weight) for voter in aggregated] == [
+        ({0, 1}, 2),
+        ({2}, 4),
+        ({3}, 1),
+    ]
+    profile[0] = [3]
+    assert [(voter.approved, voter.weight) for voter in profile.aggregated()] == [
+        ({3}, 2),
+        ({2}, 4),
+        ({0, 1}, 1),
+    ]
+    assert len(profile) == 5
+
+
+def test_approvers():
+    profile = Profile(4)
+    profile.add_voters([Voter([0, 1], 2), Voter([1], 3), Voter([], 1), Voter([1, 3], 4)])
+    assert profile.approvers == (((0,), (2,)), ((0, 1, 3), (2, 3, 4)), ((), ()), ((3,), (4,)))
+    profile.add_voter([2])
+    assert profile.approvers[2] == ((4,), (1,))
 
 
 def test_voter_str():
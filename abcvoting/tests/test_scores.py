@@ -4,7 +4,7 @@ Unit tests for abcvoting/scores.py.
 
 import pytest
 
-from abcvoting.preferences import Profile
+from abcvoting.preferences import Profile, Voter
 from abcvoting.scores import monroescore_flowbased
 from abcvoting.scores import monroescore_matching
 from abcvoting import scores
@@ -68,3 +68,143 @@ def test_thiele_scores(scorefct_id, score, num_cand):
     assert scores.thiele_score(scorefct_id, profile, committee) == 0
     committee = [1, 2, 3, 4]
     assert scores.thiele_score(scorefct_id, profile, committee) == score
+
+
+@pytest.mark.parametrize(
+    "scorefct_id", ["pav", "av", "slav", "cc", "geom2", "geom1.5", "atleast2"]
+)
+@pytest.mark.parametrize("weights", [None, [1, 2, 1, 5, 3, 1, 2], [Fraction(1, 3)] * 7])
+def test_thiele_scores_batch(scorefct_id, weights):
+    approval_sets = [[0, 1], [1], [1, 3], [4], [1, 2, 3, 4, 5], [1, 5, 3], [0, 1, 2, 4, 5]]
+    profile = Profile.from_csr(
+        [0, 2, 3, 5, 6, 11, 14, 19], sum(approval_sets, []), weights=weights, num_cand=6
+    )
+    committees = [[], [2], [1, 2, 3, 4], [0, 1, 2, 3, 4, 5], [5, 3]]
+    expected = [scores.thiele_score(scorefct_id, profile, committee) for committee in committees]
+    assert scores.thiele_scores_batch(scorefct_id, profile, committees) == expected
+    float_scores = scores.thiele_scores_batch(scorefct_id, profile, committees, exact=False)
+    assert list(float_scores) == pytest.approx([float(score) for score in expected])
+
+
+@pytest.mark.parametrize("scorefct_id", ["pav", "slav", "cc", "av", "geom3", "atleast2"])
+def test_score_table(scorefct_id):
+    table = scores.score_table(scorefct_id, 6)
+    assert table is scores.score_table(scorefct_id, 6)
+    marginal_scorefct = scores.get_marginal_scorefct(scorefct_id)
+    for i in range(7):
+        assert table.marginal[i] == marginal_scorefct(i)
+        assert table.cumulative[i] == scores.cumulative_score(marginal_scorefct, i)
+        assert table.cumulative_float[i] == pytest.approx(float(table.cumulative[i]))
+        assert table.marginal_scaled[i] == table.marginal[i] * table.denominator
+        assert table.cumulative_scaled[i] == table.cumulative[i] * table.denominator
+    if scorefct_id == "pav":
+        assert table.denominator == 60  # lcm(1, ..., 6)
+
+
+def test_score_table_unknown_scorefct():
+    with pytest.raises(scores.UnknownScoreFunctionError):
+        scores.score_table("unknown", 3)
+
+
+@pytest.mark.parametrize("scorefct_id", ["pav", "slav", "cc", "av", "geom3", "atleast2"])
+@pytest.mark.parametrize("weights", [None, [1, 2, 1, 5, 3, 1, 2], [Fraction(1, 3)] * 7])
+def test_thiele_score_state(scorefct_id, weights):
+    approval_sets = [[0, 1], [1], [1, 3], [4], [1, 2, 3, 4, 5], [1, 5, 3], [0, 1, 2, 4, 5]]
+    profile = Profile(6)
+    if weights is None:
+        profile.add_voters(approval_sets)
+    else:
+        profile.add_voters(
+            [Voter(approved, weight=weight) for approved, weight in zip(approval_sets, weights)]
+        )
+    marginal_scorefct = scores.get_marginal_scorefct(scorefct_id, 5)
+    state = scores.ThieleScoreState(scorefct_id, profile, 5, committee=[3])
+    committee = [3]
+    for cand in [1, 4, 0, 5]:
+        expected = scores.marginal_thiele_scores_add(marginal_scorefct, profile, committee)
+        branch = state.copy()
+        branch.add(cand)
+        for other in profile.candidates:
+            if other not in committee:
+                assert state.unscaled(state.add_gains[other]) == expected[other]
+        state = branch
+        committee.append(cand)
+    assert state.committee == set(committee)
+
+
+@pytest.mark.parametrize("scorefct_id", ["pav", "slav", "cc", "av", "geom3"])
+def test_thiele_score_state_remove(scorefct_id):
+    approval_sets = [[0, 1], [1], [1, 3], [4], [1, 2, 3, 4, 5], [1, 5, 3], [0, 1, 2, 4, 5]]
+    profile = Profile(6)
+    profile.add_voters(approval_sets)
+    marginal_scorefct = scores.get_marginal_scorefct(scorefct_id, 6)
+    committee = set(profile.candidates)
+    state = scores.ThieleScoreState(scorefct_id, profile, 6, committee=committee)
+    for cand in [2, 0, 4, 1]:
+        expected = scores.marginal_thiele_scores_remove(marginal_scorefct, profile, committee)
+        for other in committee:
+            assert state.unscaled(state.remove_losses[other]) == expected[other]
+        state.remove(cand)
+        committee.remove(cand)
+    # adding candidates again updates both marginal gains and losses
+    state.add(0)
+    committee.add(0)
+    expected = scores.marginal_thiele_scores_remove(marginal_scorefct, profile, committee)
+    for other in committee:
+        assert state.unscaled(state.remove_losses[other]) == expected[other]
+    expected = scores.marginal_thiele_scores_add(marginal_scorefct, profile, committee)
+    for other in set(profile.candidates) - committee:
+        assert state.unscaled(state.add_gains[other]) == expected[other]
+
+
+@pytest.mark.parametrize("state_class", [scores.PhragmenLoadState, scores.ExactPhragmenLoadState])
+@pytest.mark.parametrize("weights", [None, [1, 2, 1, 5, 3, 1, 2], [Fraction(1, 3)] * 6 + [2]])
+@pytest.mark.parametrize("start_load", [None, [0, Fraction(-1, 2), 0, Fraction(1, 6), 0, 0, -1]])
+def test_phragmen_load_state(state_class, weights, start_load):
+    approval_sets = [[0, 1], [1], [1, 3], [4], [1, 2, 3, 4], [1, 3], [0, 1, 2, 4]]
+    profile = Profile(6)  # candidate 5 has no approvers
+    if weights is None:
+        weights = [1] * len(approval_sets)
+    profile.add_voters(
+        [Voter(approved, weight=weight) for approved, weight in zip(approval_sets, weights)]
+    )
+    load = [0] * len(profile) if start_load is None else list(start_load)
+    assert state_class is scores.PhragmenLoadState or state_class.is_applicable(profile, load)
+    state = state_class(profile, load, Fraction)
+    expected_load = list(load)
+    committee = []
+    for _ in range(5):
+        expected = {}
+        for cand in profile.candidates:
+            if cand in committee:
+                continue
+            voter_indices, cand_weights = profile.approvers[cand]
+            if not voter_indices:
+                expected[cand] = 6
+                continue
+            approvers_load = sum(
+                weight * expected_load[v] for v, weight in zip(voter_indices, cand_weights)
+            )
+            expected[cand] = Fraction(approvers_load + 1, sum(cand_weights))
+        opt = min(expected.values())
+        new_maxload = state.new_maxloads(committee, 5)
+        assert opt == min(new_maxload.values())
+        tied_cands = [cand for cand in expected if expected[cand] == opt]
+        assert all(new_maxload[cand] == opt for cand in tied_cands)
+        if state_class is scores.ExactPhragmenLoadState:
+            assert sorted(new_maxload) == tied_cands
+        state.add(tied_cands[0], new_maxload[tied_cands[0]])
+        for v in profile.approvers[tied_cands[0]][0]:
+            expected_load[v] = opt
+        committee.append(tied_cands[0])
+        assert state.load == expected_load
+
+
+def test_exact_phragmen_load_state_is_applicable():
+    profile = Profile(2)
+    profile.add_voters([Voter([0], weight=0.5), [1]])
+    assert not scores.ExactPhragmenLoadState.is_applicable(profile, [0, 0])
+    profile = Profile(2)
+    profile.add_voters([Voter([0], weight=Fraction(1, 2)), [1]])
+    assert scores.ExactPhragmenLoadState.is_applicable(profile, [0, Fraction(1, 3)])
+    assert not scores.ExactPhragmenLoadState.is_applicable(profile, [0, 0.5])